@@ -3,6 +3,47 @@ Base Report Generator with common functionality
 """
 import re
 from typing import Dict
+from openpyxl.cell import WriteOnlyCell
+
+
+class SheetWriter:
+    """Streams rows into a write-only worksheet and keeps track of the current row number.
+
+    Works with openpyxl write-only worksheets and with the xlsxwriter backend sheets.
+    Column widths must be set on the worksheet before the first row is appended.
+    """
+    
+    def __init__(self, ws):
+        self.ws = ws
+        self.row = 0
+    
+    def cell(self, value=None, font=None, fill=None, number_format=None):
+        """Return a styled cell to place in a row passed to append()"""
+        styled_cell = getattr(self.ws, 'styled_cell', None)
+        if styled_cell is not None:
+            return styled_cell(value, font, fill, number_format)
+        cell = WriteOnlyCell(self.ws, value=value)
+        if font is not None:
+            cell.font = font
+        if fill is not None:
+            cell.fill = fill
+        if number_format is not None:
+            cell.number_format = number_format
+        return cell
+    
+    def append(self, values=()):
+        """Write one row and advance the row counter"""
+        self.ws.append(list(values))
+        self.row += 1
+    
+    def skip(self, count: int = 1):
+        """Write empty spacer rows"""
+        for _ in range(count):
+            self.append()
+    
+    def merge(self, last_column: str):
+        """Merge columns A..last_column of the row that was just written"""
+        self.ws.merged_cells.add(f'A{self.row}:{last_column}{self.row}')
 
 
 class BaseReportGenerator:
@@ -202,7 +202,7 @@ class BladeComponentValidator:
         try:
             # Find image in .cmp-blade__media
             media = blade.locator('.cmp-blade__media')
-            if media.count() > 0:
+            if media.first.count() > 0:
                 # Try to find img tag (could be in picture or direct)
                 img = media.locator('img').first
                 if img.count() > 0:
@@ -0,0 +1,175 @@
+"""
+Shared Playwright browser for the validation runners
+
+Chromium is launched once per process; each runner opens its own BrowserContext
+(isolated cookies/storage) on it and closes only that context when it is done.
+The browser itself is closed when the interpreter exits.
+
+The first context of a process is opened on a persistent Chromium profile, so the
+HTTP disk cache (the site's CSS/JS/images) is reused by the next run instead of
+being downloaded again.
+"""
+import atexit
+import os
+from playwright.sync_api import Browser, BrowserContext, Route, sync_playwright
+
+# Headless unless SOLIDIGM_HEADED=1 (no GPU process/compositor, runs in CI without Xvfb)
+HEADLESS = os.environ.get('SOLIDIGM_HEADED') != '1'
+
+
+def _viewport() -> dict:
+    """Viewport from SOLIDIGM_VIEWPORT ("WIDTHxHEIGHT"), 1366x768 by default"""
+    value = os.environ.get('SOLIDIGM_VIEWPORT', '1366x768')
+    try:
+        width, height = (int(part) for part in value.lower().split('x'))
+    except ValueError:
+        print(f"[WARNING] Invalid SOLIDIGM_VIEWPORT '{value}', using 1366x768")
+        width, height = 1366, 768
+    return {'width': width, 'height': height}
+
+
+# Viewport used by every runner's context
+VIEWPORT = _viewport()
+
+# Page default timeouts (ms): element actions/waits fail fast, navigations get longer.
+# Pass timeout= on a single call for an element that is known to be slow.
+SELECTOR_TIMEOUT = 15000
+NAVIGATION_TIMEOUT = 45000
+
+# Requests aborted in every context: media, web fonts and analytics beacons. Images are kept -
+# the validators check image sizes and loaded state. SOLIDIGM_BLOCK_RESOURCES=0 turns this off.
+BLOCK_HEAVY_RESOURCES = os.environ.get('SOLIDIGM_BLOCK_RESOURCES') != '0'
+BLOCKED_RESOURCE_TYPES = ('media', 'font')
+BLOCKED_HOSTS = ('google-analytics', 'doubleclick', 'adobedtm', 'omtrdc')
+
+# Persistent Chromium profiles (one directory per concurrent browser); SOLIDIGM_PERSISTENT_PROFILE=0 turns this off
+PERSISTENT_PROFILE = os.environ.get('SOLIDIGM_PERSISTENT_PROFILE') != '0'
+PROFILE_DIR = os.environ.get('SOLIDIGM_PROFILE_DIR', os.path.expanduser('~/.cache/solidigm_playwright'))
+DISK_CACHE_SIZE = 256000000
+
+_LAUNCH_ARGS = ['--no-sandbox', '--disable-dev-shm-usage']
+
+_playwright = None
+_browser = None
+_persistent_context = None
+
+
+def _route_request(route: Route):
+    request = route.request
+    if request.resource_type in BLOCKED_RESOURCE_TYPES or any(host in request.url for host in BLOCKED_HOSTS):
+        route.abort()
+    else:
+        route.continue_()
+
+
+def block_heavy_resources(context: BrowserContext):
+    """Abort media, web font and analytics requests for every page of the context"""
+    if BLOCK_HEAVY_RESOURCES:
+        context.route("**/*", _route_request)
+
+
+def _remove_stale_lock(profile_dir: str):
+    """Delete the SingletonLock a crashed Chromium left in the profile (it refuses to start otherwise)"""
+    lock = os.path.join(profile_dir, 'SingletonLock')
+    if not os.path.islink(lock):
+        return
+    try:
+        # The lock points at "<hostname>-<pid>" of the Chromium that holds the profile
+        pid = int(os.readlink(lock).rsplit('-', 1)[1])
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        os.remove(lock)
+    except (IndexError, ValueError, OSError):
+        pass
+
+
+def launch_browser(playwright) -> Browser:
+    """Launch Chromium with the runners' settings on the given Playwright instance"""
+    return playwright.chromium.launch(headless=HEADLESS, args=_LAUNCH_ARGS)
+
+
+def launch_persistent_context(playwright, profile_dir: str, **kwargs) -> BrowserContext:
+    """Launch Chromium on a persistent profile and return its (only) context, heavy resources blocked"""
+    os.makedirs(profile_dir, exist_ok=True)
+    _remove_stale_lock(profile_dir)
+    # The profile keeps its own cookies/local storage
+    kwargs.pop('storage_state', None)
+    context = playwright.chromium.launch_persistent_context(
+        profile_dir,
+        headless=HEADLESS,
+        args=_LAUNCH_ARGS + [f'--disk-cache-size={DISK_CACHE_SIZE}'],
+        **kwargs
+    )
+    block_heavy_resources(context)
+    return context
+
+
+def open_context(playwright, profile_name: str, **kwargs) -> BrowserContext:
+    """Open a context in a browser of its own on the given Playwright instance (one per worker thread)
+    
+    With persistent profiles every worker uses its own profile directory, since
+    Chromium locks a profile to a single browser process.
+    """
+    if PERSISTENT_PROFILE:
+        try:
+            return launch_persistent_context(playwright, os.path.join(PROFILE_DIR, profile_name), **kwargs)
+        except Exception as e:
+            # Another run holds the profile - fall back to a throwaway context
+            print(f"[WARNING] Persistent profile '{profile_name}' unavailable, using a fresh context: {str(e)}")
+    context = launch_browser(playwright).new_context(**kwargs)
+    block_heavy_resources(context)
+    return context
+
+
+def _start_playwright():
+    global _playwright
+    if _playwright is None:
+        _playwright = sync_playwright().start()
+        atexit.register(close_browser)
+    return _playwright
+
+
+def get_browser() -> Browser:
+    """Return the shared Chromium browser, launching it on first use"""
+    global _browser
+    if _browser is None:
+        _browser = launch_browser(_start_playwright())
+    return _browser
+
+
+def new_context(**kwargs) -> BrowserContext:
+    """Open a context with heavy resources blocked
+    
+    The first context of the process runs on the persistent profile; any further
+    ones, and every context while another process holds the profile, are isolated
+    contexts on the shared browser.
+    """
+    global _persistent_context
+    if PERSISTENT_PROFILE and _persistent_context is None:
+        try:
+            _persistent_context = launch_persistent_context(_start_playwright(), os.path.join(PROFILE_DIR, 'default'), **kwargs)
+            return _persistent_context
+        except Exception as e:
+            # Chromium locks a profile to one browser process, so a concurrent run cannot share it
+            print(f"[WARNING] Persistent profile unavailable, using a fresh context: {str(e)}")
+    context = get_browser().new_context(**kwargs)
+    block_heavy_resources(context)
+    return context
+
+
+def close_browser():
+    """Close the shared browser and stop Playwright (safe to call more than once)"""
+    global _playwright, _browser, _persistent_context
+    try:
+        if _persistent_context is not None:
+            _persistent_context.close()
+        if _browser is not None:
+            _browser.close()
+        if _playwright is not None:
+            _playwright.stop()
+    except Exception as e:
+        print(f"[WARNING] Could not close browser: {str(e)}")
+    finally:
+        _persistent_context = None
+        _browser = None
+        _playwright = None
@@ -6,6 +6,9 @@ import time
 from typing import Dict, List
 from playwright.sync_api import Page
 
+# Card classes used inside the featured products carousel
+CARD_SELECTOR = '.card, .cmp-product-card, .productcard'
+
 
 class FeaturedProductsValidator:
     def __init__(self, page: Page):
@@ -376,7 +379,7 @@ class FeaturedProductsValidator:
     def _get_cards_positions(self, section) -> List[float]:
         """Get horizontal positions of all cards"""
         try:
-            cards = section.locator('.card, [class*="card"]')
+            cards = section.locator(CARD_SELECTOR)
             positions = cards.evaluate_all("""
                 (cards) => {
                     return cards.map(card => card.getBoundingClientRect().left);
@@ -397,7 +400,7 @@ class FeaturedProductsValidator:
             if card_count == 0:
                 return hover_data
             
-            cards = section.locator('.card, [class*="card"]')
+            cards = section.locator(CARD_SELECTOR)
             first_card = cards.first
             
             # Get initial styles
@@ -1,18 +1,107 @@
 """
 Excel Report Generator for Complete Home Page Validation
 """
+from __future__ import annotations
+
 import os
+import atexit
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from typing import Dict
 from openpyxl import Workbook
 from openpyxl.styles import Font, PatternFill, Alignment
+from openpyxl.utils import get_column_letter
+from base_report_generator import SheetWriter
+
+
+# Shared style objects - built once and reused by every sheet
+_TITLE_FONT = Font(bold=True, size=16, color="366092")
+_SHEET_TITLE_FONT = Font(bold=True, size=14, color="366092")
+_SECTION_FONT = Font(bold=True, size=12)
+_BOLD = Font(bold=True)
+_HEADER_FONT = Font(bold=True, color="FFFFFF")
+_HEADER_FILL = PatternFill(start_color="366092", end_color="366092", fill_type="solid")
+
+FILL_PASS = PatternFill(start_color="D4EDDA", end_color="D4EDDA", fill_type="solid")  # Green
+FILL_FAIL = PatternFill(start_color="F8D7DA", end_color="F8D7DA", fill_type="solid")  # Red
+FILL_WARN = PatternFill(start_color="FFF3CD", end_color="FFF3CD", fill_type="solid")  # Yellow
+
+# Shared read-only default for missing nested result dicts (never mutated)
+_EMPTY = {}
+
+# Yes/No labels indexed by a bool
+_YESNO = ('No', 'Yes')
+
+# Broken link error types keyed by status code: (error type, fill)
+FILL_404 = PatternFill(start_color="FFE4E1", end_color="FFE4E1", fill_type="solid")  # Light red
+FILL_403 = PatternFill(start_color="FFB6C1", end_color="FFB6C1", fill_type="solid")  # Pink
+FILL_5XX = FILL_FAIL
+FILL_OTHER = FILL_WARN
+
+_ERROR_TABLE = {
+    404: ('404 Not Found', FILL_404),
+    403: ('403 Forbidden', FILL_403),
+}
+
+# One background save thread for every generator in the process; queued saves finish before exit
+_SAVE_POOL = ThreadPoolExecutor(max_workers=1)
+atexit.register(_SAVE_POOL.shutdown, wait=True)
+
+
+def _classify_error(status_code: int):
+    """Return (error_type, fill) for a broken link status code"""
+    error = _ERROR_TABLE.get(status_code)
+    if error:
+        return error
+    return ('500 Server Error', FILL_5XX) if status_code >= 500 else ('Other Error', FILL_OTHER)
+
+
+def _append_header(w: SheetWriter, headers):
+    """Append a table header row using the shared header font/fill"""
+    w.append([w.cell(header, font=_HEADER_FONT, fill=_HEADER_FILL) for header in headers])
+
+
+def _set_widths(ws, widths: tuple):
+    """Set column widths for columns A, B, C, ... in order"""
+    for index, width in enumerate(widths, 1):
+        ws.column_dimensions[get_column_letter(index)].width = width
+
+
+def _append_title(w: SheetWriter, text: str, last_column: str, font: Font = _SECTION_FONT):
+    """Append a title row merged across columns A..last_column"""
+    w.append([w.cell(text, font=font)])
+    w.merge(last_column)
+
+
+def _append_fields(w: SheetWriter, fields):
+    """Append one bold 'Label:' / value row per (label, value) pair"""
+    for label, value in fields:
+        w.append([w.cell(label, font=_BOLD), value])
 
 
 class HomePageReportGenerator:
-    def __init__(self, output_dir: str = "reports"):
+    def __init__(self, output_dir: str = "reports", fast_mode: bool = False):
         self.output_dir = output_dir
+        # Fast mode streams the workbook through xlsxwriter (constant_memory) when it is installed
+        self.fast_mode = fast_mode
         if not os.path.exists(output_dir):
             os.makedirs(output_dir)
+        # Workbooks are saved on the shared save thread so the caller can move on to the next page
+        self._pending_saves = []
+    
+    def wait_for_pending_saves(self):
+        """Block until every queued workbook save has finished; re-raises the first save error"""
+        pending, self._pending_saves = self._pending_saves, []
+        for future in pending:
+            future.result()
+    
+    def _save_workbook(self, wb: Workbook, filename: str):
+        """Save the workbook (runs on the save thread)"""
+        try:
+            wb.save(filename)
+            print(f"\n[EXCEL] [OK] Report successfully saved: {filename}")
+        except Exception as e:
+            print(f"\n[ERROR] Failed to save Excel file: {str(e)}")
+            raise
     
     def _format_font_size(self, font_size_str: str) -> str:
         """Format font size to 2 decimal places (e.g., '32.0001px' -> '32.00px')"""
@@ -28,7 +117,7 @@ class HomePageReportGenerator:
             return f"{numeric_value:.2f}{unit}"
         return str(font_size_str)
     
-    def generate_excel_report(self, results: Dict) -> str:
+    def generate_excel_report(self, results: dict) -> str:
         """Generate comprehensive Excel report for home page validation"""
         try:
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
@@ -36,8 +125,15 @@ class HomePageReportGenerator:
             
             print(f"\n[EXCEL] Generating report: {filename}")
             
-            wb = Workbook()
-            wb.remove(wb.active)
+            wb = None
+            if self.fast_mode:
+                # Only load the optional xlsxwriter backend when fast mode asks for it
+                from xlsxwriter_backend import XlsxWriterWorkbook, xlsxwriter_available
+                if xlsxwriter_available():
+                    wb = XlsxWriterWorkbook(filename)
+            if wb is None:
+                # Write-only mode streams rows to disk instead of keeping every cell in memory
+                wb = Workbook(write_only=True)
             
             # Summary Sheet
             try:
@@ -118,14 +214,9 @@ class HomePageReportGenerator:
             except Exception as e:
                 print(f"[WARNING] Error creating footer sheet: {str(e)}")
             
-            # Save the workbook
-            try:
-                wb.save(filename)
-                print(f"\n[EXCEL] [OK] Report successfully saved: {filename}")
-                return filename
-            except Exception as e:
-                print(f"\n[ERROR] Failed to save Excel file: {str(e)}")
-                raise
+            # Save the workbook in the background; call wait_for_pending_saves() before reading the file
+            self._pending_saves.append(_SAVE_POOL.submit(self._save_workbook, wb, filename))
+            return filename
         
         except Exception as e:
             print(f"\n[ERROR] Excel report generation failed: {str(e)}")
@@ -133,26 +224,24 @@ class HomePageReportGenerator:
             traceback.print_exc()
             raise
     
-    def _create_summary_sheet(self, wb: Workbook, results: Dict):
+    def _create_summary_sheet(self, wb: Workbook, results: dict):
         """Create summary sheet"""
         ws = wb.create_sheet("Summary", 0)
+        _set_widths(ws, (30, 50))
+        w = SheetWriter(ws)
         
-        ws['A1'] = "SOLIDIGM HOMEPAGE VALIDATION REPORT"
-        ws['A1'].font = Font(bold=True, size=16, color="366092")
-        ws.merge_cells('A1:B1')
-        
-        row = 3
-        ws.cell(row=row, column=1, value="URL:").font = Font(bold=True)
-        ws.cell(row=row, column=2, value=results.get('url', ''))
-        row += 1
+        _append_title(w, "SOLIDIGM HOMEPAGE VALIDATION REPORT", 'B', _TITLE_FONT)
+        w.skip()
         
-        ws.cell(row=row, column=1, value="Timestamp:").font = Font(bold=True)
-        ws.cell(row=row, column=2, value=results.get('timestamp', ''))
-        row += 2
+        _append_fields(w, [
+            ("URL:", results.get('url', '')),
+            ("Timestamp:", results.get('timestamp', '')),
+        ])
+        w.skip()
         
         summary = results.get('summary', {})
-        ws.cell(row=row, column=1, value="COMPONENT VALIDATION SUMMARY").font = Font(bold=True, size=12)
-        row += 2
+        w.append([w.cell("COMPONENT VALIDATION SUMMARY", font=_SECTION_FONT)])
+        w.skip()
         
         # Calculate total slides from all carousels
         carousel_data = results.get('carousel', {})
@@ -185,70 +274,46 @@ class HomePageReportGenerator:
             ("Articles", f"{summary.get('article_count', 0)} found"),
             ("Blade Components", f"{summary.get('blade_count', 0)} found"),
             ("Tile List", f"{summary.get('tile_list_count', 0)} found"),
-            ("Footer", 'Yes' if summary.get('footer_exists') else 'No')
+            ("Footer", _YESNO[bool(summary.get('footer_exists'))])
         ]
         
-        for component, status in components:
-            ws.cell(row=row, column=1, value=component + ":").font = Font(bold=True)
-            ws.cell(row=row, column=2, value=status)
-            row += 1
-        
-        ws.column_dimensions['A'].width = 30
-        ws.column_dimensions['B'].width = 50
+        _append_fields(w, [(component + ":", status) for component, status in components])
     
-    def _create_navigation_sheet(self, wb: Workbook, nav_results: Dict):
+    def _create_navigation_sheet(self, wb: Workbook, nav_results: dict):
         """Create detailed navigation sheet"""
         ws = wb.create_sheet("Navigation")
         
+        # Set column widths (write-only sheets need them before the first row)
+        _set_widths(ws, (20, 40, 20, 30, 15, 15))
+        w = SheetWriter(ws)
+        
         # Summary Section
-        ws['A1'] = "NAVIGATION MENU SUMMARY"
-        ws['A1'].font = Font(bold=True, size=14, color="366092")
-        ws.merge_cells('A1:D1')
+        _append_title(w, "NAVIGATION MENU SUMMARY", 'D', _SHEET_TITLE_FONT)
+        w.skip()
         
         summary = nav_results.get('summary', {})
-        row = 3
         
-        ws.cell(row=row, column=1, value="Total Main Menu Items:").font = Font(bold=True)
-        ws.cell(row=row, column=2, value=summary.get('total_main_menu_items', 0))
-        row += 1
+        _append_fields(w, [
+            ("Total Main Menu Items:", summary.get('total_main_menu_items', 0)),
+            ("Visible Main Menu Items:", summary.get('visible_main_menu_items', 0)),
+            ("Total Sub-Menu Items:", summary.get('total_sub_menu_items', 0)),
+            ("Total Links Checked:", summary.get('total_links_checked', 0)),
+        ])
         
-        ws.cell(row=row, column=1, value="Visible Main Menu Items:").font = Font(bold=True)
-        ws.cell(row=row, column=2, value=summary.get('visible_main_menu_items', 0))
-        row += 1
-        
-        ws.cell(row=row, column=1, value="Total Sub-Menu Items:").font = Font(bold=True)
-        ws.cell(row=row, column=2, value=summary.get('total_sub_menu_items', 0))
-        row += 1
-        
-        ws.cell(row=row, column=1, value="Total Links Checked:").font = Font(bold=True)
-        ws.cell(row=row, column=2, value=summary.get('total_links_checked', 0))
-        row += 1
-        
-        ws.cell(row=row, column=1, value="Valid Links:").font = Font(bold=True)
         valid_links = summary.get('valid_links', 0)
-        ws.cell(row=row, column=2, value=valid_links)
-        if valid_links > 0:
-            ws.cell(row=row, column=2).fill = PatternFill(start_color="D4EDDA", end_color="D4EDDA", fill_type="solid")
-        row += 1
+        valid_fill = FILL_PASS if valid_links > 0 else None
+        w.append([w.cell("Valid Links:", font=_BOLD), w.cell(valid_links, fill=valid_fill)])
         
-        ws.cell(row=row, column=1, value="Broken Links:").font = Font(bold=True)
         broken_links = summary.get('broken_links', 0)
-        ws.cell(row=row, column=2, value=broken_links)
-        if broken_links > 0:
-            ws.cell(row=row, column=2).fill = PatternFill(start_color="F8D7DA", end_color="F8D7DA", fill_type="solid")
-        row += 2
+        broken_fill = FILL_FAIL if broken_links > 0 else None
+        w.append([w.cell("Broken Links:", font=_BOLD), w.cell(broken_links, fill=broken_fill)])
+        w.skip()
         
         # Main Menu Details Table
-        ws.cell(row=row, column=1, value="MAIN MENU DETAILS").font = Font(bold=True, size=12)
-        ws.merge_cells(f'A{row}:F{row}')
-        row += 1
+        _append_title(w, "MAIN MENU DETAILS", 'F')
         
         headers = ["Menu Name", "Display Text", "Is Visible", "Has Mega Menu", "Sub-Menu Count", "Status"]
-        for col, header in enumerate(headers, 1):
-            cell = ws.cell(row=row, column=col, value=header)
-            cell.font = Font(bold=True, color="FFFFFF")
-            cell.fill = PatternFill(start_color="366092", end_color="366092", fill_type="solid")
-        row += 1
+        _append_header(w, headers)
         
         # Get sub-menu counts
         sub_menus = nav_results.get('sub_menus', {})
@@ -258,307 +323,220 @@ class HomePageReportGenerator:
             menu_name = menu.get('name', '')
             sub_count = len(sub_menus.get(menu_name, []))
             
-            ws.cell(row=row, column=1, value=menu_name)
-            ws.cell(row=row, column=2, value=menu.get('text', ''))
-            ws.cell(row=row, column=3, value='Yes' if menu.get('is_visible', False) else 'No')
-            ws.cell(row=row, column=4, value='Yes' if menu.get('has_mega_menu', False) else 'No')
-            ws.cell(row=row, column=5, value=sub_count)
-            ws.cell(row=row, column=6, value=menu.get('status', ''))
-            
             # Color coding
             if menu.get('status') == 'PASS':
-                fill = PatternFill(start_color="D4EDDA", end_color="D4EDDA", fill_type="solid")
+                fill = FILL_PASS
             else:
-                fill = PatternFill(start_color="F8D7DA", end_color="F8D7DA", fill_type="solid")
+                fill = FILL_FAIL
             
-            for col in range(1, 7):
-                ws.cell(row=row, column=col).fill = fill
-            
-            row += 1
+            values = [
+                menu_name,
+                menu.get('text', ''),
+                _YESNO[bool(menu.get('is_visible', False))],
+                _YESNO[bool(menu.get('has_mega_menu', False))],
+                sub_count,
+                menu.get('status', ''),
+            ]
+            w.append([w.cell(value, fill=fill) for value in values])
         
-        row += 1
+        w.skip()
         
         # Sub-Menu Details Table
-        ws.cell(row=row, column=1, value="SUB-MENU DETAILS").font = Font(bold=True, size=12)
-        ws.merge_cells(f'A{row}:F{row}')
-        row += 1
+        _append_title(w, "SUB-MENU DETAILS", 'F')
         
         headers = ["Main Menu", "Link Text", "URL", "Status Code", "Is Visible", "Link Status"]
-        for col, header in enumerate(headers, 1):
-            cell = ws.cell(row=row, column=col, value=header)
-            cell.font = Font(bold=True, color="FFFFFF")
-            cell.fill = PatternFill(start_color="366092", end_color="366092", fill_type="solid")
-        row += 1
+        _append_header(w, headers)
         
         for menu_name, sub_items in sub_menus.items():
             for item in sub_items:
-                ws.cell(row=row, column=1, value=menu_name)
-                ws.cell(row=row, column=2, value=item.get('text', ''))
-                ws.cell(row=row, column=3, value=item.get('href', ''))
-                
                 status_code = item.get('status_code', 0)
-                status_cell = ws.cell(row=row, column=4, value=status_code)
-                status_cell.number_format = '0'
-                
-                ws.cell(row=row, column=5, value='Yes' if item.get('is_visible', False) else 'No')
-                
                 link_status = 'Working' if status_code == 200 else 'Broken' if status_code > 0 else 'Not Checked'
-                ws.cell(row=row, column=6, value=link_status)
                 
                 # Color coding
                 if status_code == 200:
-                    fill_color = "D4EDDA"  # Green
+                    fill = FILL_PASS
                 elif status_code == 0:
-                    fill_color = "FFF3CD"  # Yellow
+                    fill = FILL_WARN
                 else:
-                    fill_color = "F8D7DA"  # Red
+                    fill = FILL_FAIL
                 
-                for col in range(1, 7):
-                    ws.cell(row=row, column=col).fill = PatternFill(start_color=fill_color, end_color=fill_color, fill_type="solid")
-                
-                row += 1
+                w.append([
+                    w.cell(menu_name, fill=fill),
+                    w.cell(item.get('text', ''), fill=fill),
+                    w.cell(item.get('href', ''), fill=fill),
+                    w.cell(status_code, fill=fill, number_format='0'),
+                    w.cell(_YESNO[bool(item.get('is_visible', False))], fill=fill),
+                    w.cell(link_status, fill=fill),
+                ])
         
-        row += 1
+        w.skip()
         
         # Navigation Links Summary
         link_validation = nav_results.get('link_validation', {})
         if link_validation:
-            ws.cell(row=row, column=1, value="NAVIGATION LINKS SUMMARY").font = Font(bold=True, size=12)
-            ws.merge_cells(f'A{row}:D{row}')
-            row += 1
+            _append_title(w, "NAVIGATION LINKS SUMMARY", 'D')
             
-            ws.cell(row=row, column=1, value="Total Links Checked:").font = Font(bold=True)
-            ws.cell(row=row, column=2, value=link_validation.get('total_checked', 0))
-            row += 1
+            w.append([w.cell("Total Links Checked:", font=_BOLD), link_validation.get('total_checked', 0)])
             
-            ws.cell(row=row, column=1, value="Valid Links:").font = Font(bold=True)
             valid = link_validation.get('valid_links', 0)
-            ws.cell(row=row, column=2, value=valid)
-            if valid > 0:
-                ws.cell(row=row, column=2).fill = PatternFill(start_color="D4EDDA", end_color="D4EDDA", fill_type="solid")
-            row += 1
+            valid_fill = FILL_PASS if valid > 0 else None
+            w.append([w.cell("Valid Links:", font=_BOLD), w.cell(valid, fill=valid_fill)])
             
-            ws.cell(row=row, column=1, value="Broken Links (4xx/5xx):").font = Font(bold=True)
             broken = link_validation.get('broken_links', 0)
-            ws.cell(row=row, column=2, value=broken)
-            if broken > 0:
-                ws.cell(row=row, column=2).fill = PatternFill(start_color="F8D7DA", end_color="F8D7DA", fill_type="solid")
-            row += 1
+            broken_fill = FILL_FAIL if broken > 0 else None
+            w.append([w.cell("Broken Links (4xx/5xx):", font=_BOLD), w.cell(broken, fill=broken_fill)])
             
             # Not Checked Links (timeouts/errors)
             not_checked = link_validation.get('not_checked_links', 0)
             if not_checked > 0:
-                ws.cell(row=row, column=1, value="Not Checked (Timeouts/Errors):").font = Font(bold=True)
-                ws.cell(row=row, column=2, value=not_checked)
-                ws.cell(row=row, column=2).fill = PatternFill(start_color="FFF3CD", end_color="FFF3CD", fill_type="solid")
-                row += 1
+                w.append([
+                    w.cell("Not Checked (Timeouts/Errors):", font=_BOLD),
+                    w.cell(not_checked, fill=FILL_WARN),
+                ])
             
-            row += 1
+            w.skip()
             
             # Broken Links Details Table (only actual broken links)
             broken_details = link_validation.get('broken_details', [])
             if broken_details:
-                ws.cell(row=row, column=1, value="BROKEN LINKS DETAILS").font = Font(bold=True, size=12)
-                ws.merge_cells(f'A{row}:E{row}')
-                row += 1
+                _append_title(w, "BROKEN LINKS DETAILS", 'E')
                 
                 headers = ["Link Text", "URL", "Status Code", "Is Visible", "Error Type"]
-                for col, header in enumerate(headers, 1):
-                    cell = ws.cell(row=row, column=col, value=header)
-                    cell.font = Font(bold=True, color="FFFFFF")
-                    cell.fill = PatternFill(start_color="366092", end_color="366092", fill_type="solid")
-                row += 1
+                _append_header(w, headers)
                 
                 for link in broken_details:
-                    ws.cell(row=row, column=1, value=link.get('text', '')[:50])
-                    ws.cell(row=row, column=2, value=link.get('href', '')[:80])
                     status_code = link.get('status_code', 0)
-                    ws.cell(row=row, column=3, value=status_code)
-                    ws.cell(row=row, column=4, value='Yes' if link.get('is_visible', False) else 'No')
-                    ws.cell(row=row, column=5, value='404 Not Found' if status_code == 404 else '403 Forbidden' if status_code == 403 else '500 Server Error' if status_code >= 500 else 'Other Error')
-                    
-                    # Color coding
-                    if status_code == 404:
-                        fill_color = "FFE4E1"  # Light red
-                    elif status_code == 403:
-                        fill_color = "FFB6C1"  # Pink
-                    elif status_code >= 500:
-                        fill_color = "F8D7DA"  # Red
-                    else:
-                        fill_color = "FFF3CD"  # Yellow
-                    
-                    for col in range(1, 6):
-                        ws.cell(row=row, column=col).fill = PatternFill(start_color=fill_color, end_color=fill_color, fill_type="solid")
+                    error_type, fill = _classify_error(status_code)
                     
-                    row += 1
-            row += 1
+                    values = [
+                        link.get('text', '')[:50],
+                        link.get('href', '')[:80],
+                        status_code,
+                        _YESNO[bool(link.get('is_visible', False))],
+                        error_type,
+                    ]
+                    w.append([w.cell(value, fill=fill) for value in values])
+            w.skip()
         
         # Font Styles Section
         font_styles = nav_results.get('font_styles', {})
         if font_styles.get('main_menu') or font_styles.get('sub_menu'):
-            row += 1
-            ws.cell(row=row, column=1, value="FONT STYLES").font = Font(bold=True, size=12)
-            ws.merge_cells(f'A{row}:D{row}')
-            row += 1
+            w.skip()
+            _append_title(w, "FONT STYLES", 'D')
             
             headers = ["Element Type", "Name", "Font Size", "Font Color"]
-            for col, header in enumerate(headers, 1):
-                cell = ws.cell(row=row, column=col, value=header)
-                cell.font = Font(bold=True, color="FFFFFF")
-                cell.fill = PatternFill(start_color="366092", end_color="366092", fill_type="solid")
-            row += 1
+            _append_header(w, headers)
             
             # Main menu font styles
             for item in font_styles.get('main_menu', []):
-                ws.cell(row=row, column=1, value="Main Menu")
-                ws.cell(row=row, column=2, value=item.get('name', ''))
-                ws.cell(row=row, column=3, value=self._format_font_size(item.get('font_size', '')))
-                ws.cell(row=row, column=4, value=item.get('font_color', ''))
-                row += 1
+                w.append(["Main Menu", item.get('name', ''), self._format_font_size(item.get('font_size', '')), item.get('font_color', '')])
             
             # Sub menu font styles
             for item in font_styles.get('sub_menu', []):
-                ws.cell(row=row, column=1, value="Sub Menu")
-                ws.cell(row=row, column=2, value=item.get('type', ''))
-                ws.cell(row=row, column=3, value=self._format_font_size(item.get('font_size', '')))
-                ws.cell(row=row, column=4, value=item.get('font_color', ''))
-                row += 1
-        
-        # Set column widths
-        ws.column_dimensions['A'].width = 20
-        ws.column_dimensions['B'].width = 40
-        ws.column_dimensions['C'].width = 20
-        ws.column_dimensions['D'].width = 30
-        ws.column_dimensions['E'].width = 15
-        ws.column_dimensions['F'].width = 15
+                w.append(["Sub Menu", item.get('type', ''), self._format_font_size(item.get('font_size', '')), item.get('font_color', '')])
     
-    def _create_carousel_sheet(self, wb: Workbook, carousel_results: Dict):
+    def _create_carousel_sheet(self, wb: Workbook, carousel_results: dict):
         """Create detailed carousel sheet"""
         ws = wb.create_sheet("Carousels")
         
+        _set_widths(ws, (15, 12, 40, 15, 20, 50, 15, 20, 12, 40, 50, 15, 60, 15, 18, 15))
+        w = SheetWriter(ws)
+        
         # Summary Section
-        ws['A1'] = "CAROUSEL SUMMARY"
-        ws['A1'].font = Font(bold=True, size=14, color="366092")
-        ws.merge_cells('A1:D1')
+        _append_title(w, "CAROUSEL SUMMARY", 'D', _SHEET_TITLE_FONT)
+        w.skip()
+        
+        carousels = carousel_results.get('carousels') or []
+        # Container sizes and chevron visibility are shown in more than one table - format them once
+        container_sizes = []
+        chevrons_visible = []
+        for carousel in carousels:
+            container = carousel.get('container') or _EMPTY
+            container_sizes.append(f"{float(container.get('width', 0)):.2f}x{float(container.get('height', 0)):.2f}")
+            nav = carousel.get('navigation') or _EMPTY
+            chevrons_visible.append((
+                _YESNO[bool(nav.get('left_chevron_visible'))],
+                _YESNO[bool(nav.get('right_chevron_visible'))],
+            ))
         
-        row = 3
-        carousel_count = len(carousel_results.get('carousels', []))
-        ws.cell(row=row, column=1, value="Total Carousels Found:").font = Font(bold=True)
-        ws.cell(row=row, column=2, value=carousel_count)
-        row += 2
+        w.append([w.cell("Total Carousels Found:", font=_BOLD), len(carousels)])
+        w.skip()
         
         # Carousel Details Table
-        ws.cell(row=row, column=1, value="CAROUSEL DETAILS").font = Font(bold=True, size=12)
-        ws.merge_cells(f'A{row}:I{row}')
-        row += 1
+        _append_title(w, "CAROUSEL DETAILS", 'I')
         
         headers = ["Carousel #", "Title", "Title Font Size", "Title Font Color", "Slides Count", "Container Size (WxH)", "Progress Bar", "Left Chevron", "Right Chevron"]
-        for col, header in enumerate(headers, 1):
-            cell = ws.cell(row=row, column=col, value=header)
-            cell.font = Font(bold=True, color="FFFFFF")
-            cell.fill = PatternFill(start_color="366092", end_color="366092", fill_type="solid")
-        row += 1
-        
-        for i, carousel in enumerate(carousel_results.get('carousels', []), 1):
-            ws.cell(row=row, column=1, value=f"Carousel {i}")
-            
-            # Carousel title
-            title = carousel.get('title', {})
-            ws.cell(row=row, column=2, value=title.get('text', '') if title.get('text') else '')
-            ws.cell(row=row, column=3, value=self._format_font_size(title.get('font_size', '')) if title.get('font_size') else '')
-            ws.cell(row=row, column=4, value=title.get('font_color', '') if title.get('font_color') else '')
-            
-            ws.cell(row=row, column=5, value=carousel.get('slide_count', 0))
-            
-            container = carousel.get('container', {})
-            width = float(container.get('width', 0))
-            height = float(container.get('height', 0))
-            ws.cell(row=row, column=6, value=f"{width:.2f}x{height:.2f}")
-            
-            pb = carousel.get('progress_bar', {})
-            ws.cell(row=row, column=7, value='Yes' if pb.get('exists') else 'No')
-            
-            nav = carousel.get('navigation', {})
-            left_visible = 'Yes' if nav.get('left_chevron_visible') else 'No'
-            right_visible = 'Yes' if nav.get('right_chevron_visible') else 'No'
-            ws.cell(row=row, column=8, value=left_visible)
-            ws.cell(row=row, column=9, value=right_visible)
-            
-            row += 1
+        _append_header(w, headers)
+        
+        for i, (carousel, container_size, (left_visible, right_visible)) in enumerate(zip(carousels, container_sizes, chevrons_visible), 1):
+            # Unpack the nested dicts once per carousel
+            title = carousel.get('title') or _EMPTY
+            font_size = title.get('font_size')
+            pb_exists = (carousel.get('progress_bar') or _EMPTY).get('exists')
+            
+            w.append([
+                f"Carousel {i}",
+                title.get('text') or '',
+                self._format_font_size(font_size) if font_size else '',
+                title.get('font_color') or '',
+                carousel.get('slide_count', 0),
+                container_size,
+                _YESNO[bool(pb_exists)],
+                left_visible,
+                right_visible,
+            ])
         
         # Slide Details with Text, Font, Buttons, Links
-        row += 1
-        ws.cell(row=row, column=1, value="SLIDE DETAILS").font = Font(bold=True, size=12)
-        ws.merge_cells(f'A{row}:P{row}')
-        row += 1
+        w.skip()
+        _append_title(w, "SLIDE DETAILS", 'P')
         
         headers = ["Carousel #", "Slide #", "Title Text", "Title Font Size", "Title Font Color", "Description", "Desc Font Size", "Desc Font Color", "Button Count", "Button Full Text", "Button Link", "Link Valid", "Image URL", "Image Size", "Container Size", "Image Fits"]
-        for col, header in enumerate(headers, 1):
-            cell = ws.cell(row=row, column=col, value=header)
-            cell.font = Font(bold=True, color="FFFFFF")
-            cell.fill = PatternFill(start_color="366092", end_color="366092", fill_type="solid")
-        row += 1
-        
-        for i, carousel in enumerate(carousel_results.get('carousels', []), 1):
-            slides = carousel.get('slides', [])
-            container = carousel.get('container', {})
-            width = float(container.get('width', 0))
-            height = float(container.get('height', 0))
-            container_size = f"{width:.2f}x{height:.2f}"
-            
-            for slide in slides:
-                ws.cell(row=row, column=1, value=f"Carousel {i}")
-                ws.cell(row=row, column=2, value=slide.get('index', ''))
-                
+        _append_header(w, headers)
+        
+        for i, (carousel, container_size) in enumerate(zip(carousels, container_sizes), 1):
+            for slide in carousel.get('slides') or ():
                 # Title and font
                 title_text = slide.get('title', '') if isinstance(slide.get('title'), str) else ''
-                ws.cell(row=row, column=3, value=title_text if title_text else '')
                 
                 # Get title font from slide-specific data
                 title_font = slide.get('title_font', {})
                 title_font_size = self._format_font_size(title_font.get('fontSize', '')) if title_font else ''
                 title_font_color = title_font.get('color', '') if title_font else ''
-                ws.cell(row=row, column=4, value=title_font_size)
-                ws.cell(row=row, column=5, value=title_font_color)
                 
                 # Description and font
                 desc_text = slide.get('description', '') if isinstance(slide.get('description'), str) else ''
-                ws.cell(row=row, column=6, value=desc_text if desc_text else '')
                 
                 # Get description font from slide-specific data
                 desc_font = slide.get('description_font', {})
                 desc_font_size = self._format_font_size(desc_font.get('fontSize', '')) if desc_font else ''
                 desc_font_color = desc_font.get('color', '') if desc_font else ''
-                ws.cell(row=row, column=7, value=desc_font_size)
-                ws.cell(row=row, column=8, value=desc_font_color)
                 
                 # Button details
                 buttons = slide.get('buttons', [])
                 button_count = len(buttons) if buttons else slide.get('button_count', 0)
-                ws.cell(row=row, column=9, value=button_count)
                 
                 # First button details - full text
                 if buttons and len(buttons) > 0:
                     first_btn = buttons[0]
-                    ws.cell(row=row, column=10, value=first_btn.get('text', ''))  # Full text, no truncation
+                    btn_text = first_btn.get('text', '')  # Full text, no truncation
                     btn_href = first_btn.get('href', '')
-                    ws.cell(row=row, column=11, value=btn_href[:80] if btn_href else '')
+                    btn_href = btn_href[:80] if btn_href else ''
                     
                     # Link validation status
                     link_valid = 'Valid' if first_btn.get('is_valid') else 'Invalid' if first_btn.get('status_code', 0) > 0 else 'Not Checked'
-                    link_valid_cell = ws.cell(row=row, column=12, value=link_valid)
+                    link_valid_fill = None
                     if first_btn.get('is_valid'):
-                        link_valid_cell.fill = PatternFill(start_color="D4EDDA", end_color="D4EDDA", fill_type="solid")
+                        link_valid_fill = FILL_PASS
                     elif first_btn.get('status_code', 0) >= 400:
-                        link_valid_cell.fill = PatternFill(start_color="F8D7DA", end_color="F8D7DA", fill_type="solid")
+                        link_valid_fill = FILL_FAIL
+                    link_valid_cell = w.cell(link_valid, fill=link_valid_fill)
                 else:
-                    ws.cell(row=row, column=10, value='')
-                    ws.cell(row=row, column=11, value='')
-                    ws.cell(row=row, column=12, value='')
+                    btn_text = ''
+                    btn_href = ''
+                    link_valid_cell = ''
                 
                 # Image details
                 image_url = slide.get('image_url') or slide.get('main_image') or slide.get('background_image', '')
-                ws.cell(row=row, column=13, value=image_url[:80] if image_url else '')
                 
                 image_size = ''
                 if slide.get('image_width') and slide.get('image_height'):
@@ -567,83 +545,73 @@ class HomePageReportGenerator:
                     image_size = f"{img_width:.2f}x{img_height:.2f}"
                 else:
                     image_size = ''
-                ws.cell(row=row, column=14, value=image_size)
-                
-                ws.cell(row=row, column=15, value=container_size)
                 
                 # Image fits container
                 image_fits = slide.get('image_fits_container')
                 if image_fits is True:
                     fits_text = 'Yes'
-                    fits_color = "D4EDDA"
+                    fits_fill = FILL_PASS
                 elif image_fits is False:
                     fits_text = 'No'
-                    fits_color = "F8D7DA"
+                    fits_fill = FILL_FAIL
                 else:
                     fits_text = 'Unknown'
-                    fits_color = "FFF3CD"
-                fits_cell = ws.cell(row=row, column=16, value=fits_text)
-                fits_cell.fill = PatternFill(start_color=fits_color, end_color=fits_color, fill_type="solid")
+                    fits_fill = FILL_WARN
                 
-                row += 1
-        
-        row += 1
+                w.append([
+                    f"Carousel {i}",
+                    slide.get('index', ''),
+                    title_text if title_text else '',
+                    title_font_size,
+                    title_font_color,
+                    desc_text if desc_text else '',
+                    desc_font_size,
+                    desc_font_color,
+                    button_count,
+                    btn_text,
+                    btn_href,
+                    link_valid_cell,
+                    image_url[:80] if image_url else '',
+                    image_size,
+                    container_size,
+                    w.cell(fits_text, fill=fits_fill),
+                ])
+        
+        w.skip()
         
         # Chevron Details
-        ws.cell(row=row, column=1, value="CHEVRON DETAILS").font = Font(bold=True, size=12)
-        ws.merge_cells(f'A{row}:G{row}')
-        row += 1
+        _append_title(w, "CHEVRON DETAILS", 'G')
         
         headers = ["Carousel #", "Left Chevron", "Right Chevron", "Left Visible", "Right Visible", "Left Clicks", "Right Clicks"]
-        for col, header in enumerate(headers, 1):
-            cell = ws.cell(row=row, column=col, value=header)
-            cell.font = Font(bold=True, color="FFFFFF")
-            cell.fill = PatternFill(start_color="366092", end_color="366092", fill_type="solid")
-        row += 1
-        
-        for i, carousel in enumerate(carousel_results.get('carousels', []), 1):
-            ws.cell(row=row, column=1, value=f"Carousel {i}")
-            
-            nav = carousel.get('navigation', {})
-            ws.cell(row=row, column=2, value='Yes' if nav.get('has_left_chevron') else 'No')
-            ws.cell(row=row, column=3, value='Yes' if nav.get('has_right_chevron') else 'No')
-            ws.cell(row=row, column=4, value='Yes' if nav.get('left_chevron_visible') else 'No')
-            ws.cell(row=row, column=5, value='Yes' if nav.get('right_chevron_visible') else 'No')
-            ws.cell(row=row, column=6, value=f"{nav.get('left_clicks_successful', 0)}/{nav.get('left_clicks_tested', 0)}")
-            ws.cell(row=row, column=7, value=f"{nav.get('right_clicks_successful', 0)}/{nav.get('right_clicks_tested', 0)}")
-            
-            row += 1
-        
-        ws.column_dimensions['A'].width = 15
-        ws.column_dimensions['B'].width = 12
-        ws.column_dimensions['C'].width = 40
-        ws.column_dimensions['D'].width = 15
-        ws.column_dimensions['E'].width = 20
-        ws.column_dimensions['F'].width = 50
-        ws.column_dimensions['G'].width = 15
-        ws.column_dimensions['H'].width = 20
-        ws.column_dimensions['I'].width = 12
-        ws.column_dimensions['J'].width = 40
-        ws.column_dimensions['K'].width = 50
-        ws.column_dimensions['L'].width = 15
-        ws.column_dimensions['M'].width = 60
-        ws.column_dimensions['N'].width = 15
-        ws.column_dimensions['O'].width = 18
-        ws.column_dimensions['P'].width = 15
+        _append_header(w, headers)
+        
+        for i, (carousel, (left_visible, right_visible)) in enumerate(zip(carousels, chevrons_visible), 1):
+            nav = carousel.get('navigation') or _EMPTY
+            w.append([
+                f"Carousel {i}",
+                _YESNO[bool(nav.get('has_left_chevron'))],
+                _YESNO[bool(nav.get('has_right_chevron'))],
+                left_visible,
+                right_visible,
+                f"{nav.get('left_clicks_successful', 0)}/{nav.get('left_clicks_tested', 0)}",
+                f"{nav.get('right_clicks_successful', 0)}/{nav.get('right_clicks_tested', 0)}",
+            ])
     
-    def _create_featured_products_sheet(self, wb: Workbook, fp_results: Dict):
+    def _create_featured_products_sheet(self, wb: Workbook, fp_results: dict):
         """Create detailed featured products sheet"""
         ws = wb.create_sheet("Featured Products")
         
+        _set_widths(ws, (12, 30, 40, 50, 15, 20, 50, 15, 30, 30, 18))
+        w = SheetWriter(ws)
+        
         # Summary Section
-        ws['A1'] = "FEATURED PRODUCTS SUMMARY"
-        ws['A1'].font = Font(bold=True, size=14, color="366092")
-        ws.merge_cells('A1:C1')
+        _append_title(w, "FEATURED PRODUCTS SUMMARY", 'C', _SHEET_TITLE_FONT)
+        w.skip()
         
-        row = 3
-        ws.cell(row=row, column=1, value="Component Exists:").font = Font(bold=True)
-        ws.cell(row=row, column=2, value='Yes' if fp_results.get('found') or fp_results.get('component_exists') else 'No')
-        row += 1
+        w.append([
+            w.cell("Component Exists:", font=_BOLD),
+            _YESNO[bool(fp_results.get('found') or fp_results.get('component_exists'))],
+        ])
         
         # Get card count from cards data
         cards_data = fp_results.get('cards', {})
@@ -662,362 +630,271 @@ class HomePageReportGenerator:
         if not card_count:
             card_count = fp_results.get('product_count', 0)
         
-        ws.cell(row=row, column=1, value="Total Product Cards:").font = Font(bold=True)
-        ws.cell(row=row, column=2, value=card_count)
-        row += 2
+        w.append([w.cell("Total Product Cards:", font=_BOLD), card_count])
+        w.skip()
         
         # Title Details
         title_data = fp_results.get('title', {})
         if title_data:
-            ws.cell(row=row, column=1, value="TITLE DETAILS").font = Font(bold=True, size=12)
-            ws.merge_cells(f'A{row}:C{row}')
-            row += 1
-            
-            ws.cell(row=row, column=1, value="Title Text:").font = Font(bold=True)
-            ws.cell(row=row, column=2, value=title_data.get('text', ''))
-            row += 1
+            _append_title(w, "TITLE DETAILS", 'C')
             
-            ws.cell(row=row, column=1, value="Font Size:").font = Font(bold=True)
-            ws.cell(row=row, column=2, value=self._format_font_size(title_data.get('font_size', '')))
-            row += 1
-            
-            ws.cell(row=row, column=1, value="Font Color:").font = Font(bold=True)
-            ws.cell(row=row, column=2, value=title_data.get('font_color', ''))
-            row += 2
+            _append_fields(w, [
+                ("Title Text:", title_data.get('text', '')),
+                ("Font Size:", self._format_font_size(title_data.get('font_size', ''))),
+                ("Font Color:", title_data.get('font_color', '')),
+            ])
+            w.skip()
         
         # Product Cards Details
         cards_data = fp_results.get('cards', {})
         products = cards_data.get('cards', []) if cards_data else fp_results.get('products', [])
         if products:
-            ws.cell(row=row, column=1, value="PRODUCT CARDS DETAILS").font = Font(bold=True, size=12)
-            ws.merge_cells(f'A{row}:H{row}')
-            row += 1
+            _append_title(w, "PRODUCT CARDS DETAILS", 'H')
             
             headers = ["Card #", "Product Title", "Description", "Image Source", "Image Size", "Container Size", "Link URL", "Link Status", "Title Font", "Desc Font"]
-            for col, header in enumerate(headers, 1):
-                cell = ws.cell(row=row, column=col, value=header)
-                cell.font = Font(bold=True, color="FFFFFF")
-                cell.fill = PatternFill(start_color="366092", end_color="366092", fill_type="solid")
-            row += 1
+            _append_header(w, headers)
             
             for product in products:
-                ws.cell(row=row, column=1, value=product.get('index', ''))
-                
                 title = product.get('title', {}) if isinstance(product.get('title'), dict) else {'text': str(product.get('title', ''))}
-                ws.cell(row=row, column=2, value=title.get('text', '')[:50] if title.get('text') else '')
-                
                 desc = product.get('description', {}) if isinstance(product.get('description'), dict) else {'text': str(product.get('description', ''))}
-                ws.cell(row=row, column=3, value=desc.get('text', '')[:50] if desc.get('text') else '')
                 
                 image = product.get('image', {})
-                ws.cell(row=row, column=4, value=image.get('src', '')[:50] if image.get('src') else '')
                 if image.get('width') and image.get('height'):
                     img_width = float(image.get('width', 0))
                     img_height = float(image.get('height', 0))
-                    ws.cell(row=row, column=5, value=f"{img_width:.2f}x{img_height:.2f}")
+                    image_size = f"{img_width:.2f}x{img_height:.2f}"
                 else:
-                    ws.cell(row=row, column=5, value='')
+                    image_size = ''
                 
                 container = product.get('container', {})
                 width = float(container.get('width', 0))
                 height = float(container.get('height', 0))
-                ws.cell(row=row, column=6, value=f"{width:.2f}x{height:.2f}")
                 
                 link = product.get('link', {}) if isinstance(product.get('link'), dict) else {}
-                ws.cell(row=row, column=7, value=link.get('href', '')[:50] if link.get('href') else '')
                 link_status = 'Valid' if link.get('is_valid') else 'Invalid' if link.get('status_code', 0) > 0 else 'Not Checked'
-                ws.cell(row=row, column=8, value=link_status)
                 
                 # Font styles
                 font_styles = product.get('font_styles', {})
                 title_font = font_styles.get('title', {})
                 title_font_str = f"{self._format_font_size(title_font.get('fontSize', ''))} {title_font.get('color', '')}" if title_font else ''
-                ws.cell(row=row, column=9, value=title_font_str[:30])
                 
                 desc_font = font_styles.get('description', {})
                 desc_font_str = f"{self._format_font_size(desc_font.get('fontSize', ''))} {desc_font.get('color', '')}" if desc_font else ''
-                ws.cell(row=row, column=10, value=desc_font_str[:30])
                 
-                row += 1
+                w.append([
+                    product.get('index', ''),
+                    title.get('text', '')[:50] if title.get('text') else '',
+                    desc.get('text', '')[:50] if desc.get('text') else '',
+                    image.get('src', '')[:50] if image.get('src') else '',
+                    image_size,
+                    f"{width:.2f}x{height:.2f}",
+                    link.get('href', '')[:50] if link.get('href') else '',
+                    link_status,
+                    title_font_str[:30],
+                    desc_font_str[:30],
+                ])
         
         # Navigation Details
         chevrons = fp_results.get('chevrons', {})
         if chevrons:
-            row += 1
-            ws.cell(row=row, column=1, value="NAVIGATION DETAILS").font = Font(bold=True, size=12)
-            ws.merge_cells(f'A{row}:C{row}')
-            row += 1
-            
-            ws.cell(row=row, column=1, value="Left Chevron Works:").font = Font(bold=True)
-            ws.cell(row=row, column=2, value='Yes' if chevrons.get('left_works') else 'No')
-            row += 1
-            
-            ws.cell(row=row, column=1, value="Right Chevron Works:").font = Font(bold=True)
-            ws.cell(row=row, column=2, value='Yes' if chevrons.get('right_works') else 'No')
-        
-        ws.column_dimensions['A'].width = 12
-        ws.column_dimensions['B'].width = 30
-        ws.column_dimensions['C'].width = 40
-        ws.column_dimensions['D'].width = 50
-        ws.column_dimensions['E'].width = 15
-        ws.column_dimensions['F'].width = 20
-        ws.column_dimensions['G'].width = 50
-        ws.column_dimensions['H'].width = 15
-        ws.column_dimensions['I'].width = 30
-        ws.column_dimensions['J'].width = 30
-        ws.column_dimensions['K'].width = 18
+            w.skip()
+            _append_title(w, "NAVIGATION DETAILS", 'C')
+            
+            _append_fields(w, [
+                ("Left Chevron Works:", _YESNO[bool(chevrons.get('left_works'))]),
+                ("Right Chevron Works:", _YESNO[bool(chevrons.get('right_works'))]),
+            ])
     
-    def _create_product_cards_sheet(self, wb: Workbook, pc_results: Dict):
+    def _create_product_cards_sheet(self, wb: Workbook, pc_results: dict):
         """Create detailed product cards sheet"""
         ws = wb.create_sheet("Product Cards")
         
-        # Summary Section
-        ws['A1'] = "PRODUCT CARDS SUMMARY"
-        ws['A1'].font = Font(bold=True, size=14, color="366092")
-        ws.merge_cells('A1:C1')
+        _set_widths(ws, (20, 30, 20, 15, 15))
+        w = SheetWriter(ws)
         
-        row = 3
-        ws.cell(row=row, column=1, value="Component Exists:").font = Font(bold=True)
-        ws.cell(row=row, column=2, value='Yes' if pc_results.get('component_exists') else 'No')
-        row += 1
+        # Summary Section
+        _append_title(w, "PRODUCT CARDS SUMMARY", 'C', _SHEET_TITLE_FONT)
+        w.skip()
         
-        ws.cell(row=row, column=1, value="Total Card Count:").font = Font(bold=True)
-        ws.cell(row=row, column=2, value=pc_results.get('card_count', 0))
-        row += 2
+        _append_fields(w, [
+            ("Component Exists:", _YESNO[bool(pc_results.get('component_exists'))]),
+            ("Total Card Count:", pc_results.get('card_count', 0)),
+        ])
+        w.skip()
         
         # Card Details
         cards = pc_results.get('cards', [])
         if cards:
-            ws.cell(row=row, column=1, value="CARD DETAILS").font = Font(bold=True, size=12)
-            ws.merge_cells(f'A{row}:E{row}')
-            row += 1
+            _append_title(w, "CARD DETAILS", 'E')
             
             headers = ["Card #", "Card Type", "Container Size", "Link Count", "Status"]
-            for col, header in enumerate(headers, 1):
-                cell = ws.cell(row=row, column=col, value=header)
-                cell.font = Font(bold=True, color="FFFFFF")
-                cell.fill = PatternFill(start_color="366092", end_color="366092", fill_type="solid")
-            row += 1
+            _append_header(w, headers)
             
             for i, card in enumerate(cards[:20], 1):  # Limit to first 20 cards
-                ws.cell(row=row, column=1, value=i)
-                ws.cell(row=row, column=2, value=card.get('type', 'Product Card') if isinstance(card, dict) else 'Product Card')
-                if isinstance(card, dict):
-                    container = card.get('container', {})
-                    if container:
-                        width = float(container.get('width', 0))
-                        height = float(container.get('height', 0))
-                        ws.cell(row=row, column=3, value=f"{width:.2f}x{height:.2f}")
-                    else:
-                        ws.cell(row=row, column=3, value='')
-                    ws.cell(row=row, column=4, value=card.get('link_count', 0))
-                    ws.cell(row=row, column=5, value='Valid' if card.get('is_valid') else 'Invalid')
-                row += 1
-        
-        ws.column_dimensions['A'].width = 20
-        ws.column_dimensions['B'].width = 30
-        ws.column_dimensions['C'].width = 20
-        ws.column_dimensions['D'].width = 15
-        ws.column_dimensions['E'].width = 15
+                if not isinstance(card, dict):
+                    w.append([i, 'Product Card'])
+                    continue
+                container = card.get('container', {})
+                if container:
+                    width = float(container.get('width', 0))
+                    height = float(container.get('height', 0))
+                    container_size = f"{width:.2f}x{height:.2f}"
+                else:
+                    container_size = ''
+                w.append([
+                    i,
+                    card.get('type', 'Product Card'),
+                    container_size,
+                    card.get('link_count', 0),
+                    'Valid' if card.get('is_valid') else 'Invalid',
+                ])
     
-    def _create_article_list_sheet(self, wb: Workbook, al_results: Dict):
+    def _create_article_list_sheet(self, wb: Workbook, al_results: dict):
         """Create detailed article list sheet"""
         ws = wb.create_sheet("Article List")
         
+        _set_widths(ws, (12, 35, 20, 50, 15, 20, 50, 15, 30, 30, 18))
+        w = SheetWriter(ws)
+        
         # Summary Section
-        ws['A1'] = "ARTICLE LIST SUMMARY"
-        ws['A1'].font = Font(bold=True, size=14, color="366092")
-        ws.merge_cells('A1:C1')
+        _append_title(w, "ARTICLE LIST SUMMARY", 'C', _SHEET_TITLE_FONT)
+        w.skip()
         
-        row = 3
         cards_data = al_results.get('cards', {})
         card_count = cards_data.get('card_count', 0)
         
-        ws.cell(row=row, column=1, value="Component Found:").font = Font(bold=True)
-        ws.cell(row=row, column=2, value='Yes' if al_results.get('found', False) else 'No')
-        row += 1
-        
-        ws.cell(row=row, column=1, value="Total Article Count:").font = Font(bold=True)
-        ws.cell(row=row, column=2, value=card_count)
-        row += 1
+        _append_fields(w, [
+            ("Component Found:", _YESNO[bool(al_results.get('found', False))]),
+            ("Total Article Count:", card_count),
+        ])
         
         summary = al_results.get('summary', {})
-        ws.cell(row=row, column=1, value="All Links Valid:").font = Font(bold=True)
         links_valid = summary.get('all_links_valid', False)
-        ws.cell(row=row, column=2, value='Yes' if links_valid else 'No')
         if links_valid:
-            ws.cell(row=row, column=2).fill = PatternFill(start_color="D4EDDA", end_color="D4EDDA", fill_type="solid")
+            links_fill = FILL_PASS
         else:
-            ws.cell(row=row, column=2).fill = PatternFill(start_color="F8D7DA", end_color="F8D7DA", fill_type="solid")
-        row += 1
+            links_fill = FILL_FAIL
+        w.append([w.cell("All Links Valid:", font=_BOLD), w.cell(_YESNO[bool(links_valid)], fill=links_fill)])
         
-        ws.cell(row=row, column=1, value="Chevrons Working:").font = Font(bold=True)
         chevrons_working = summary.get('chevrons_working', False)
-        ws.cell(row=row, column=2, value='Yes' if chevrons_working else 'No')
-        row += 2
+        w.append([w.cell("Chevrons Working:", font=_BOLD), _YESNO[bool(chevrons_working)]])
+        w.skip()
         
         # Title Details
         title_data = al_results.get('title', {})
         if title_data:
-            ws.cell(row=row, column=1, value="TITLE DETAILS").font = Font(bold=True, size=12)
-            ws.merge_cells(f'A{row}:C{row}')
-            row += 1
-            
-            ws.cell(row=row, column=1, value="Title Text:").font = Font(bold=True)
-            ws.cell(row=row, column=2, value=title_data.get('text', ''))
-            row += 1
-            
-            ws.cell(row=row, column=1, value="View All Link:").font = Font(bold=True)
-            ws.cell(row=row, column=2, value=title_data.get('view_all_href', ''))
-            row += 1
+            _append_title(w, "TITLE DETAILS", 'C')
             
-            ws.cell(row=row, column=1, value="View All Link Valid:").font = Font(bold=True)
             view_all_valid = title_data.get('view_all_valid', False)
-            ws.cell(row=row, column=2, value='Yes' if view_all_valid else 'No')
-            row += 2
+            _append_fields(w, [
+                ("Title Text:", title_data.get('text', '')),
+                ("View All Link:", title_data.get('view_all_href', '')),
+                ("View All Link Valid:", _YESNO[bool(view_all_valid)]),
+            ])
+            w.skip()
         
         # Article Cards Details
         cards = cards_data.get('cards', [])
         if cards:
-            ws.cell(row=row, column=1, value="ARTICLE CARDS DETAILS").font = Font(bold=True, size=12)
-            ws.merge_cells(f'A{row}:G{row}')
-            row += 1
+            _append_title(w, "ARTICLE CARDS DETAILS", 'G')
             
             headers = ["Card #", "Article Title", "Category", "Image Source", "Image Size", "Container Size", "Link URL", "Link Valid", "Title Font", "Category Font", "Shadow Effect"]
-            for col, header in enumerate(headers, 1):
-                cell = ws.cell(row=row, column=col, value=header)
-                cell.font = Font(bold=True, color="FFFFFF")
-                cell.fill = PatternFill(start_color="366092", end_color="366092", fill_type="solid")
-            row += 1
+            _append_header(w, headers)
             
             for card in cards:
-                ws.cell(row=row, column=1, value=card.get('index', ''))
-                
                 title = card.get('title', {}) if isinstance(card.get('title'), dict) else {'text': str(card.get('title', ''))}
-                ws.cell(row=row, column=2, value=title.get('text', '')[:50] if title.get('text') else '')
-                
                 category = card.get('category', '')
-                ws.cell(row=row, column=3, value=category[:30] if category else '')
                 
                 image = card.get('image', {})
-                ws.cell(row=row, column=4, value=image.get('src', '')[:50] if image.get('src') else '')
                 if image.get('width') and image.get('height'):
                     img_width = float(image.get('width', 0))
                     img_height = float(image.get('height', 0))
-                    ws.cell(row=row, column=5, value=f"{img_width:.2f}x{img_height:.2f}")
+                    image_size = f"{img_width:.2f}x{img_height:.2f}"
                 else:
-                    ws.cell(row=row, column=5, value='')
+                    image_size = ''
                 
                 container = card.get('container', {})
                 width = float(container.get('width', 0))
                 height = float(container.get('height', 0))
-                ws.cell(row=row, column=6, value=f"{width:.2f}x{height:.2f}")
                 
                 link = card.get('link', '')
-                ws.cell(row=row, column=7, value=link[:50] if link else '')
-                
                 link_valid = card.get('link_valid', False)
-                ws.cell(row=row, column=8, value='Yes' if link_valid else 'No')
                 
                 # Font styles
                 font_styles = card.get('font_styles', {})
                 title_font = font_styles.get('title', {})
                 title_font_str = f"{title_font.get('fontSize', '')} {title_font.get('color', '')}"[:30] if title_font else ''
-                ws.cell(row=row, column=9, value=title_font_str)
                 
                 category_font = font_styles.get('category', {})
                 category_font_str = f"{self._format_font_size(category_font.get('fontSize', ''))} {category_font.get('color', '')}"[:30] if category_font else ''
-                ws.cell(row=row, column=10, value=category_font_str)
                 
                 # Shadow effect - check if card has shadow in hover data
                 shadow_effect = 'Detected' if card.get('has_shadow', False) else 'Not Detected'
-                ws.cell(row=row, column=11, value=shadow_effect)
                 
-                row += 1
+                w.append([
+                    card.get('index', ''),
+                    title.get('text', '')[:50] if title.get('text') else '',
+                    category[:30] if category else '',
+                    image.get('src', '')[:50] if image.get('src') else '',
+                    image_size,
+                    f"{width:.2f}x{height:.2f}",
+                    link[:50] if link else '',
+                    _YESNO[bool(link_valid)],
+                    title_font_str,
+                    category_font_str,
+                    shadow_effect,
+                ])
         
         # Hover/Shadow Effect Details
         hover_data = al_results.get('hover', {})
         if hover_data:
-            row += 1
-            ws.cell(row=row, column=1, value="SHADOW/HOVER EFFECT DETAILS").font = Font(bold=True, size=12)
-            ws.merge_cells(f'A{row}:C{row}')
-            row += 1
+            w.skip()
+            _append_title(w, "SHADOW/HOVER EFFECT DETAILS", 'C')
             
-            ws.cell(row=row, column=1, value="Hover Effect Detected:").font = Font(bold=True)
             hover_detected = hover_data.get('hover_effect_detected', False)
-            ws.cell(row=row, column=2, value='Yes' if hover_detected else 'No')
-            if hover_detected:
-                ws.cell(row=row, column=2).fill = PatternFill(start_color="D4EDDA", end_color="D4EDDA", fill_type="solid")
-            row += 1
-            
-            ws.cell(row=row, column=1, value="Focus Behavior:").font = Font(bold=True)
-            ws.cell(row=row, column=2, value=hover_data.get('focus_behavior', '')[:50])
-            row += 1
-            
-            ws.cell(row=row, column=1, value="Is Clickable:").font = Font(bold=True)
-            ws.cell(row=row, column=2, value='Yes' if hover_data.get('is_clickable', False) else 'No')
-            row += 1
-        
-        ws.column_dimensions['A'].width = 12
-        ws.column_dimensions['B'].width = 35
-        ws.column_dimensions['C'].width = 20
-        ws.column_dimensions['D'].width = 50
-        ws.column_dimensions['E'].width = 15
-        ws.column_dimensions['F'].width = 20
-        ws.column_dimensions['G'].width = 50
-        ws.column_dimensions['H'].width = 15
-        ws.column_dimensions['I'].width = 30
-        ws.column_dimensions['J'].width = 30
-        ws.column_dimensions['K'].width = 18
+            hover_fill = FILL_PASS if hover_detected else None
+            _append_fields(w, [
+                ("Hover Effect Detected:", w.cell(_YESNO[bool(hover_detected)], fill=hover_fill)),
+                ("Focus Behavior:", hover_data.get('focus_behavior', '')[:50]),
+                ("Is Clickable:", _YESNO[bool(hover_data.get('is_clickable', False))]),
+            ])
     
-    def _create_blade_components_sheet(self, wb: Workbook, bc_results: Dict):
+    def _create_blade_components_sheet(self, wb: Workbook, bc_results: dict):
         """Create detailed blade components sheet"""
         ws = wb.create_sheet("Blade Components")
         
-        # Summary Section
-        ws['A1'] = "BLADE COMPONENTS SUMMARY"
-        ws['A1'].font = Font(bold=True, size=14, color="366092")
-        ws.merge_cells('A1:C1')
+        _set_widths(ws, (12, 15, 18, 50, 15, 40, 30, 50, 30, 25, 30, 50, 15))
+        w = SheetWriter(ws)
         
-        row = 3
-        ws.cell(row=row, column=1, value="Component Exists:").font = Font(bold=True)
-        ws.cell(row=row, column=2, value='Yes' if bc_results.get('component_exists') else 'No')
-        row += 1
+        # Summary Section
+        _append_title(w, "BLADE COMPONENTS SUMMARY", 'C', _SHEET_TITLE_FONT)
+        w.skip()
         
-        ws.cell(row=row, column=1, value="Total Blade Count:").font = Font(bold=True)
-        ws.cell(row=row, column=2, value=bc_results.get('blade_count', 0))
-        row += 1
+        _append_fields(w, [
+            ("Component Exists:", _YESNO[bool(bc_results.get('component_exists'))]),
+            ("Total Blade Count:", bc_results.get('blade_count', 0)),
+        ])
         
         # Image Position Summary
         blades = bc_results.get('blades', [])
         if blades:
             left_count = sum(1 for b in blades if isinstance(b, dict) and b.get('layout') == 'Image Left')
             right_count = sum(1 for b in blades if isinstance(b, dict) and b.get('layout') == 'Image Right')
-            ws.cell(row=row, column=1, value="Image Position - Left:").font = Font(bold=True)
-            ws.cell(row=row, column=2, value=left_count)
-            row += 1
-            ws.cell(row=row, column=1, value="Image Position - Right:").font = Font(bold=True)
-            ws.cell(row=row, column=2, value=right_count)
-        row += 2
+            _append_fields(w, [
+                ("Image Position - Left:", left_count),
+                ("Image Position - Right:", right_count),
+            ])
+        w.skip()
         
         # Blade Details
-        blades = bc_results.get('blades', [])
         if blades:
-            ws.cell(row=row, column=1, value="BLADE DETAILS").font = Font(bold=True, size=12)
-            ws.merge_cells(f'A{row}:M{row}')
-            row += 1
+            _append_title(w, "BLADE DETAILS", 'M')
             
             headers = ["Blade #", "Image Position", "Container Size", "Image Source", "Image Size", "Title", "Title Font", "Description", "Desc Font", "Button Text", "Button Font", "Button Link", "Link Status"]
-            for col, header in enumerate(headers, 1):
-                cell = ws.cell(row=row, column=col, value=header)
-                cell.font = Font(bold=True, color="FFFFFF")
-                cell.fill = PatternFill(start_color="366092", end_color="366092", fill_type="solid")
-            row += 1
+            _append_header(w, headers)
             
             for blade in blades:
                 if isinstance(blade, dict):
-                    ws.cell(row=row, column=1, value=blade.get('index', ''))
-                    
                     # Image Position (Layout)
                     image_position = blade.get('layout', 'Unknown')
                     # Make it more explicit
@@ -1025,72 +902,71 @@ class HomePageReportGenerator:
                         image_position = 'Left'
                     elif image_position == 'Image Right':
                         image_position = 'Right'
-                    ws.cell(row=row, column=2, value=image_position)
                     
                     # Container size
                     container = blade.get('container', {})
                     if container.get('width') and container.get('height'):
                         container_width = float(container.get('width', 0))
                         container_height = float(container.get('height', 0))
-                        ws.cell(row=row, column=3, value=f"{container_width:.2f}x{container_height:.2f}")
+                        container_size = f"{container_width:.2f}x{container_height:.2f}"
                     else:
-                        ws.cell(row=row, column=3, value='')
+                        container_size = ''
                     
                     # Image details
                     image = blade.get('image', {})
-                    ws.cell(row=row, column=4, value=image.get('src', '')[:50] if image.get('src') else '')
                     if image.get('width') and image.get('height'):
                         img_width = float(image.get('width', 0))
                         img_height = float(image.get('height', 0))
-                        ws.cell(row=row, column=5, value=f"{img_width:.2f}x{img_height:.2f}")
+                        image_size = f"{img_width:.2f}x{img_height:.2f}"
                     else:
-                        ws.cell(row=row, column=5, value='')
+                        image_size = ''
                     
                     # Title
                     title = blade.get('title', {})
-                    ws.cell(row=row, column=6, value=title.get('text', '')[:40] if title.get('text') else '')
                     title_font = title.get('font_styles', {})
                     title_font_str = f"{title_font.get('fontSize', '')} {title_font.get('color', '')}"[:30] if title_font else ''
-                    ws.cell(row=row, column=7, value=title_font_str)
                     
                     # Description
                     description = blade.get('description', {})
-                    ws.cell(row=row, column=8, value=description.get('text', '')[:50] if description.get('text') else '')
                     desc_font = description.get('font_styles', {})
                     desc_font_str = f"{desc_font.get('fontSize', '')} {desc_font.get('color', '')}"[:30] if desc_font else ''
-                    ws.cell(row=row, column=9, value=desc_font_str)
                     
                     # Button
                     button = blade.get('button', {})
-                    ws.cell(row=row, column=10, value=button.get('text', '')[:30] if button.get('text') else '')
                     btn_font = button.get('font_styles', {})
                     btn_font_str = f"{self._format_font_size(btn_font.get('fontSize', ''))} {btn_font.get('color', '')}"[:30] if btn_font else ''
-                    ws.cell(row=row, column=11, value=btn_font_str)
-                    ws.cell(row=row, column=12, value=button.get('href', '')[:50] if button.get('href') else '')
                     
                     # Link status
                     link_status = 'Valid' if button.get('is_valid') else 'Invalid' if button.get('status_code', 0) > 0 else 'Not Checked'
-                    status_cell = ws.cell(row=row, column=13, value=link_status)
+                    status_fill = None
                     if button.get('is_valid'):
-                        status_cell.fill = PatternFill(start_color="D4EDDA", end_color="D4EDDA", fill_type="solid")
+                        status_fill = FILL_PASS
                     elif button.get('status_code', 0) > 0:
-                        status_cell.fill = PatternFill(start_color="F8D7DA", end_color="F8D7DA", fill_type="solid")
+                        status_fill = FILL_FAIL
                     
-                    row += 1
-            
-            row += 1
+                    w.append([
+                        blade.get('index', ''),
+                        image_position,
+                        container_size,
+                        image.get('src', '')[:50] if image.get('src') else '',
+                        image_size,
+                        title.get('text', '')[:40] if title.get('text') else '',
+                        title_font_str,
+                        description.get('text', '')[:50] if description.get('text') else '',
+                        desc_font_str,
+                        button.get('text', '')[:30] if button.get('text') else '',
+                        btn_font_str,
+                        button.get('href', '')[:50] if button.get('href') else '',
+                        w.cell(link_status, fill=status_fill),
+                    ])
+            
+            w.skip()
             
             # Additional Links Table
-            ws.cell(row=row, column=1, value="ADDITIONAL LINKS").font = Font(bold=True, size=12)
-            ws.merge_cells(f'A{row}:E{row}')
-            row += 1
+            _append_title(w, "ADDITIONAL LINKS", 'E')
             
             headers = ["Blade #", "Link Text", "Link URL", "Status Code", "Link Status"]
-            for col, header in enumerate(headers, 1):
-                cell = ws.cell(row=row, column=col, value=header)
-                cell.font = Font(bold=True, color="FFFFFF")
-                cell.fill = PatternFill(start_color="366092", end_color="366092", fill_type="solid")
-            row += 1
+            _append_header(w, headers)
             
             for blade in blades:
                 if isinstance(blade, dict):
@@ -1098,79 +974,49 @@ class HomePageReportGenerator:
                     links = blade.get('links', [])
                     for link in links:
                         if isinstance(link, dict):
-                            ws.cell(row=row, column=1, value=blade_index)
-                            ws.cell(row=row, column=2, value=link.get('text', '')[:40])
-                            ws.cell(row=row, column=3, value=link.get('href', '')[:50])
                             status_code = link.get('status_code', 0)
-                            ws.cell(row=row, column=4, value=status_code)
                             link_status = 'Valid' if link.get('is_valid') else 'Invalid' if status_code > 0 else 'Not Checked'
-                            ws.cell(row=row, column=5, value=link_status)
                             
                             # Color coding
                             if link.get('is_valid'):
-                                fill_color = "D4EDDA"
+                                fill = FILL_PASS
                             elif status_code > 0:
-                                fill_color = "F8D7DA"
+                                fill = FILL_FAIL
                             else:
-                                fill_color = "FFF3CD"
+                                fill = FILL_WARN
                             
-                            for col in range(1, 6):
-                                ws.cell(row=row, column=col).fill = PatternFill(start_color=fill_color, end_color=fill_color, fill_type="solid")
-                            
-                            row += 1
-        
-        ws.column_dimensions['A'].width = 12
-        ws.column_dimensions['B'].width = 15
-        ws.column_dimensions['C'].width = 18
-        ws.column_dimensions['D'].width = 50
-        ws.column_dimensions['E'].width = 15
-        ws.column_dimensions['F'].width = 40
-        ws.column_dimensions['G'].width = 30
-        ws.column_dimensions['H'].width = 50
-        ws.column_dimensions['I'].width = 30
-        ws.column_dimensions['J'].width = 25
-        ws.column_dimensions['K'].width = 30
-        ws.column_dimensions['L'].width = 50
-        ws.column_dimensions['M'].width = 15
+                            values = [blade_index, link.get('text', '')[:40], link.get('href', '')[:50], status_code, link_status]
+                            w.append([w.cell(value, fill=fill) for value in values])
     
-    def _create_footer_sheet(self, wb: Workbook, footer_results: Dict):
+    def _create_footer_sheet(self, wb: Workbook, footer_results: dict):
         """Create detailed footer sheet"""
         ws = wb.create_sheet("Footer")
         
+        _set_widths(ws, (15, 30, 18, 40, 60, 15, 15, 15, 20))
+        w = SheetWriter(ws)
+        
         # Summary Section
-        ws['A1'] = "FOOTER SUMMARY"
-        ws['A1'].font = Font(bold=True, size=14, color="366092")
-        ws.merge_cells('A1:C1')
+        _append_title(w, "FOOTER SUMMARY", 'C', _SHEET_TITLE_FONT)
+        w.skip()
         
-        row = 3
-        ws.cell(row=row, column=1, value="Component Exists:").font = Font(bold=True)
-        ws.cell(row=row, column=2, value='Yes' if footer_results.get('component_exists') else 'No')
-        row += 1
+        w.append([w.cell("Component Exists:", font=_BOLD), _YESNO[bool(footer_results.get('component_exists'))]])
         
         # Container Size
         container = footer_results.get('container', {})
         if container.get('width') and container.get('height'):
-            ws.cell(row=row, column=1, value="Container Size:").font = Font(bold=True)
             container_width = float(container.get('width', 0))
             container_height = float(container.get('height', 0))
-            ws.cell(row=row, column=2, value=f"{container_width:.2f}x{container_height:.2f}")
-            row += 1
+            w.append([w.cell("Container Size:", font=_BOLD), f"{container_width:.2f}x{container_height:.2f}"])
         
         # Number of Columns
         column_count = footer_results.get('column_count', 0) or footer_results.get('section_count', 0)
-        ws.cell(row=row, column=1, value="Number of Columns:").font = Font(bold=True)
-        ws.cell(row=row, column=2, value=column_count)
-        row += 1
+        w.append([w.cell("Number of Columns:", font=_BOLD), column_count])
         
-        ws.cell(row=row, column=1, value="Total Links Count:").font = Font(bold=True)
         total_links = footer_results.get('links_count', 0)
-        ws.cell(row=row, column=2, value=total_links)
-        row += 1
+        w.append([w.cell("Total Links Count:", font=_BOLD), total_links])
         
-        ws.cell(row=row, column=1, value="Social Icons Count:").font = Font(bold=True)
         social_count = footer_results.get('social_icon_count', 0)
-        ws.cell(row=row, column=2, value=social_count)
-        row += 1
+        w.append([w.cell("Social Icons Count:", font=_BOLD), social_count])
         
         # Calculate valid and broken links
         valid_links = 0
@@ -1201,61 +1047,39 @@ class HomePageReportGenerator:
             elif status_code == 0:
                 not_checked_links += 1
         
-        ws.cell(row=row, column=1, value="Valid Links:").font = Font(bold=True)
-        ws.cell(row=row, column=2, value=valid_links)
-        if valid_links > 0:
-            ws.cell(row=row, column=2).fill = PatternFill(start_color="D4EDDA", end_color="D4EDDA", fill_type="solid")
-        row += 1
+        valid_fill = FILL_PASS if valid_links > 0 else None
+        w.append([w.cell("Valid Links:", font=_BOLD), w.cell(valid_links, fill=valid_fill)])
         
-        ws.cell(row=row, column=1, value="Broken Links (4xx/5xx):").font = Font(bold=True)
-        ws.cell(row=row, column=2, value=broken_links)
-        if broken_links > 0:
-            ws.cell(row=row, column=2).fill = PatternFill(start_color="F8D7DA", end_color="F8D7DA", fill_type="solid")
-        row += 1
+        broken_fill = FILL_FAIL if broken_links > 0 else None
+        w.append([w.cell("Broken Links (4xx/5xx):", font=_BOLD), w.cell(broken_links, fill=broken_fill)])
         
         if not_checked_links > 0:
-            ws.cell(row=row, column=1, value="Not Checked (Timeouts/Errors):").font = Font(bold=True)
-            ws.cell(row=row, column=2, value=not_checked_links)
-            ws.cell(row=row, column=2).fill = PatternFill(start_color="FFF3CD", end_color="FFF3CD", fill_type="solid")
-            row += 1
+            w.append([
+                w.cell("Not Checked (Timeouts/Errors):", font=_BOLD),
+                w.cell(not_checked_links, fill=FILL_WARN),
+            ])
         
-        row += 1
+        w.skip()
         
         # Logo Details
         logo = footer_results.get('logo', {})
         if logo.get('href'):
-            ws.cell(row=row, column=1, value="LOGO DETAILS").font = Font(bold=True, size=12)
-            ws.merge_cells(f'A{row}:B{row}')
-            row += 1
+            _append_title(w, "LOGO DETAILS", 'B')
             
-            ws.cell(row=row, column=1, value="Logo Link:").font = Font(bold=True)
-            ws.cell(row=row, column=2, value=logo.get('href', ''))
-            row += 1
-            
-            ws.cell(row=row, column=1, value="Logo Title:").font = Font(bold=True)
-            ws.cell(row=row, column=2, value=logo.get('title', ''))
-            row += 2
+            _append_fields(w, [
+                ("Logo Link:", logo.get('href', '')),
+                ("Logo Title:", logo.get('title', '')),
+            ])
+            w.skip()
         
         # Social Icons Details
-        social_icons = footer_results.get('social_icons', [])
         if social_icons:
-            ws.cell(row=row, column=1, value="SOCIAL ICONS DETAILS").font = Font(bold=True, size=12)
-            ws.merge_cells(f'A{row}:I{row}')
-            row += 1
+            _append_title(w, "SOCIAL ICONS DETAILS", 'I')
             
             headers = ["Icon #", "Aria Label", "Link URL", "Target", "Is Clickable", "Domain Valid", "Domain Validation", "Status Code", "Link Status"]
-            for col, header in enumerate(headers, 1):
-                cell = ws.cell(row=row, column=col, value=header)
-                cell.font = Font(bold=True, color="FFFFFF")
-                cell.fill = PatternFill(start_color="366092", end_color="366092", fill_type="solid")
-            row += 1
+            _append_header(w, headers)
             
             for icon in social_icons:
-                ws.cell(row=row, column=1, value=icon.get('index', ''))
-                ws.cell(row=row, column=2, value=icon.get('aria_label', '')[:40])
-                ws.cell(row=row, column=3, value=icon.get('href', '')[:60])
-                ws.cell(row=row, column=4, value=icon.get('target', '_self'))
-                
                 # Check if icon link is clickable
                 is_clickable = False
                 try:
@@ -1264,112 +1088,93 @@ class HomePageReportGenerator:
                 except:
                     pass
                 
-                clickable_cell = ws.cell(row=row, column=5, value='Yes' if is_clickable else 'No')
                 if is_clickable:
-                    clickable_cell.fill = PatternFill(start_color="D4EDDA", end_color="D4EDDA", fill_type="solid")
+                    clickable_fill = FILL_PASS
                 else:
-                    clickable_cell.fill = PatternFill(start_color="F8D7DA", end_color="F8D7DA", fill_type="solid")
+                    clickable_fill = FILL_FAIL
                 
                 # Domain validation
                 domain_valid = icon.get('domain_valid', False)
-                domain_cell = ws.cell(row=row, column=6, value='Yes' if domain_valid else 'No')
                 if domain_valid:
-                    domain_cell.fill = PatternFill(start_color="D4EDDA", end_color="D4EDDA", fill_type="solid")
+                    domain_fill = FILL_PASS
                 else:
-                    domain_cell.fill = PatternFill(start_color="F8D7DA", end_color="F8D7DA", fill_type="solid")
-                
-                ws.cell(row=row, column=7, value=icon.get('domain_validation_message', '')[:50])
+                    domain_fill = FILL_FAIL
                 
                 status_code = icon.get('status_code', 0)
-                ws.cell(row=row, column=8, value=status_code)
-                
                 link_status = 'Valid' if icon.get('is_valid') else 'Invalid' if status_code > 0 else 'Not Checked'
-                status_cell = ws.cell(row=row, column=9, value=link_status)
                 
                 # Color coding for link status
                 if icon.get('is_valid'):
-                    status_cell.fill = PatternFill(start_color="D4EDDA", end_color="D4EDDA", fill_type="solid")
+                    status_fill = FILL_PASS
                 elif status_code >= 400:
-                    status_cell.fill = PatternFill(start_color="F8D7DA", end_color="F8D7DA", fill_type="solid")
+                    status_fill = FILL_FAIL
                 else:
-                    status_cell.fill = PatternFill(start_color="FFF3CD", end_color="FFF3CD", fill_type="solid")
+                    status_fill = FILL_WARN
                 
-                row += 1
-            row += 1
+                w.append([
+                    icon.get('index', ''),
+                    icon.get('aria_label', '')[:40],
+                    icon.get('href', '')[:60],
+                    icon.get('target', '_self'),
+                    w.cell(_YESNO[bool(is_clickable)], fill=clickable_fill),
+                    w.cell(_YESNO[bool(domain_valid)], fill=domain_fill),
+                    icon.get('domain_validation_message', '')[:50],
+                    status_code,
+                    w.cell(link_status, fill=status_fill),
+                ])
+            w.skip()
         
         # Copyright Details
         copyright = footer_results.get('copyright', {})
         if copyright.get('text'):
-            ws.cell(row=row, column=1, value="COPYRIGHT DETAILS").font = Font(bold=True, size=12)
-            ws.merge_cells(f'A{row}:B{row}')
-            row += 1
+            _append_title(w, "COPYRIGHT DETAILS", 'B')
             
-            ws.cell(row=row, column=1, value="Copyright Text:").font = Font(bold=True)
-            ws.cell(row=row, column=2, value=copyright.get('text', '')[:100])
-            row += 2
+            w.append([w.cell("Copyright Text:", font=_BOLD), copyright.get('text', '')[:100]])
+            w.skip()
         
         # Left Column Details (Column 1)
-        logo = footer_results.get('logo', {})
-        social_icons = footer_results.get('social_icons', [])
-        copyright = footer_results.get('copyright', {})
-        
         if logo.get('href') or social_icons or copyright.get('text'):
-            ws.cell(row=row, column=1, value="COLUMN 1 DETAILS (Left Column)").font = Font(bold=True, size=12)
-            ws.merge_cells(f'A{row}:C{row}')
-            row += 1
-            
-            ws.cell(row=row, column=1, value="Column #:").font = Font(bold=True)
-            ws.cell(row=row, column=2, value="1")
-            row += 1
+            _append_title(w, "COLUMN 1 DETAILS (Left Column)", 'C')
             
-            ws.cell(row=row, column=1, value="Column Heading:").font = Font(bold=True)
-            ws.cell(row=row, column=2, value="Logo, Social Icons, Copyright")
-            row += 1
-            
-            ws.cell(row=row, column=1, value="Sub-Menu Count:").font = Font(bold=True)
-            ws.cell(row=row, column=2, value=len(social_icons))
-            row += 2
+            _append_fields(w, [
+                ("Column #:", "1"),
+                ("Column Heading:", "Logo, Social Icons, Copyright"),
+                ("Sub-Menu Count:", len(social_icons)),
+            ])
+            w.skip()
         
         # Footer Sections Details (Columns 2, 3, 4, etc.)
-        sections = footer_results.get('sections', [])
         if sections:
-            ws.cell(row=row, column=1, value="NAVIGATION SECTIONS DETAILS (Columns 2+)").font = Font(bold=True, size=12)
-            ws.merge_cells(f'A{row}:C{row}')
-            row += 1
+            _append_title(w, "NAVIGATION SECTIONS DETAILS (Columns 2+)", 'C')
             
             headers = ["Column #", "Column Heading", "Sub-Menu Count"]
-            for col, header in enumerate(headers, 1):
-                cell = ws.cell(row=row, column=col, value=header)
-                cell.font = Font(bold=True, color="FFFFFF")
-                cell.fill = PatternFill(start_color="366092", end_color="366092", fill_type="solid")
-            row += 1
+            _append_header(w, headers)
             
             for section in sections:
                 if isinstance(section, dict):
-                    ws.cell(row=row, column=1, value=section.get('index', ''))
                     section_title = section.get('title', '')
                     # Handle empty titles - show "(No Title)" if empty
                     if not section_title or section_title == '(No Title)':
                         display_title = '(No Title)'
                     else:
                         display_title = section_title[:40]
-                    ws.cell(row=row, column=2, value=display_title)
-                    ws.cell(row=row, column=3, value=section.get('link_count', 0))
-                    row += 1
+                    w.append([section.get('index', ''), display_title, section.get('link_count', 0)])
             
-            row += 1
+            w.skip()
             
             # Section Links Details
-            ws.cell(row=row, column=1, value="SECTION LINKS DETAILS").font = Font(bold=True, size=12)
-            ws.merge_cells(f'A{row}:I{row}')
-            row += 1
+            _append_title(w, "SECTION LINKS DETAILS", 'I')
             
             headers = ["Column #", "Column Heading", "Sub-Menu Count", "Link Text", "Link URL", "Status Code", "Link Status", "Font Size", "Font Color"]
-            for col, header in enumerate(headers, 1):
-                cell = ws.cell(row=row, column=col, value=header)
-                cell.font = Font(bold=True, color="FFFFFF")
-                cell.fill = PatternFill(start_color="366092", end_color="366092", fill_type="solid")
-            row += 1
+            _append_header(w, headers)
+            
+            # Normalize every link's font size in one pass, then zip back in while writing rows
+            raw_sizes = [
+                link['font_styles'].get('fontSize', '') if link.get('font_styles') else link.get('font_size', '')
+                for section in sections if isinstance(section, dict)
+                for link in section.get('links', []) if isinstance(link, dict)
+            ]
+            formatted_sizes = iter([self._format_font_size(size) for size in raw_sizes])
             
             for section in sections:
                 if isinstance(section, dict):
@@ -1378,78 +1183,60 @@ class HomePageReportGenerator:
                     links = section.get('links', [])
                     link_count = len(links)  # Sub-menu count for this section
                     
+                    # Handle empty titles
+                    if not section_title or section_title == '(No Title)':
+                        display_title = '(No Title)'
+                    else:
+                        display_title = section_title[:30]
+                    
                     for link in links:
                         if isinstance(link, dict):
-                            ws.cell(row=row, column=1, value=section_index)
-                            # Handle empty titles
-                            if not section_title or section_title == '(No Title)':
-                                display_title = '(No Title)'
-                            else:
-                                display_title = section_title[:30]
-                            ws.cell(row=row, column=2, value=display_title)
-                            ws.cell(row=row, column=3, value=link_count)  # Sub-menu count
-                            ws.cell(row=row, column=4, value=link.get('text', '')[:40])
-                            ws.cell(row=row, column=5, value=link.get('href', '')[:60])
-                            
                             status_code = link.get('status_code', 0)
-                            ws.cell(row=row, column=6, value=status_code)
-                            
                             link_status = 'Valid' if link.get('is_valid') else 'Invalid' if status_code > 0 else 'Not Checked'
-                            status_cell = ws.cell(row=row, column=7, value=link_status)
                             
                             # Color coding for link status
                             if link.get('is_valid'):
-                                status_cell.fill = PatternFill(start_color="D4EDDA", end_color="D4EDDA", fill_type="solid")
+                                status_fill = FILL_PASS
                             elif status_code >= 400:
-                                status_cell.fill = PatternFill(start_color="F8D7DA", end_color="F8D7DA", fill_type="solid")
+                                status_fill = FILL_FAIL
                             else:
-                                status_cell.fill = PatternFill(start_color="FFF3CD", end_color="FFF3CD", fill_type="solid")
+                                status_fill = FILL_WARN
                             
-                            # Font styles
+                            # Font styles (size already normalized above)
+                            font_size = next(formatted_sizes)
                             font_styles = link.get('font_styles', {})
-                            if font_styles:
-                                font_size = self._format_font_size(font_styles.get('fontSize', ''))
-                                font_color = font_styles.get('color', '')
-                            else:
-                                # Try to get from direct properties
-                                font_size = self._format_font_size(link.get('font_size', ''))
-                                font_color = link.get('font_color', '')
-                            
-                            ws.cell(row=row, column=8, value=font_size)
-                            ws.cell(row=row, column=9, value=font_color)
+                            font_color = font_styles.get('color', '') if font_styles else link.get('font_color', '')
                             
-                            row += 1
+                            w.append([
+                                section_index,
+                                display_title,
+                                link_count,  # Sub-menu count
+                                link.get('text', '')[:40],
+                                link.get('href', '')[:60],
+                                status_code,
+                                w.cell(link_status, fill=status_fill),
+                                font_size,
+                                font_color,
+                            ])
         
         # Footer Links Summary (similar to Navigation Links Summary)
-        row += 1
-        ws.cell(row=row, column=1, value="FOOTER LINKS SUMMARY").font = Font(bold=True, size=12)
-        ws.merge_cells(f'A{row}:D{row}')
-        row += 1
+        w.skip()
+        _append_title(w, "FOOTER LINKS SUMMARY", 'D')
         
         total_footer_links = total_links + social_count
-        ws.cell(row=row, column=1, value="Total Links Checked:").font = Font(bold=True)
-        ws.cell(row=row, column=2, value=total_footer_links)
-        row += 1
-        
-        ws.cell(row=row, column=1, value="Valid Links:").font = Font(bold=True)
-        ws.cell(row=row, column=2, value=valid_links)
-        if valid_links > 0:
-            ws.cell(row=row, column=2).fill = PatternFill(start_color="D4EDDA", end_color="D4EDDA", fill_type="solid")
-        row += 1
-        
-        ws.cell(row=row, column=1, value="Broken Links (4xx/5xx):").font = Font(bold=True)
-        ws.cell(row=row, column=2, value=broken_links)
-        if broken_links > 0:
-            ws.cell(row=row, column=2).fill = PatternFill(start_color="F8D7DA", end_color="F8D7DA", fill_type="solid")
-        row += 1
+        _append_fields(w, [
+            ("Total Links Checked:", total_footer_links),
+            ("Valid Links:", w.cell(valid_links, fill=valid_fill)),
+            ("Broken Links (4xx/5xx):", w.cell(broken_links, fill=broken_fill)),
+        ])
         
         if not_checked_links > 0:
-            ws.cell(row=row, column=1, value="Not Checked (Timeouts/Errors):").font = Font(bold=True)
-            ws.cell(row=row, column=2, value=not_checked_links)
-            ws.cell(row=row, column=2).fill = PatternFill(start_color="FFF3CD", end_color="FFF3CD", fill_type="solid")
-            row += 1
+            w.append([
+                w.cell("Not Checked (Timeouts/Errors):", font=_BOLD),
+                w.cell(not_checked_links, fill=FILL_WARN),
+            ])
         
-        row += 1
+        w.skip()
         
         # Broken Links Details Table (similar to Navigation Broken Links)
         broken_links_list = []
@@ -1481,314 +1268,221 @@ class HomePageReportGenerator:
                 })
         
         if broken_links_list:
-            ws.cell(row=row, column=1, value="BROKEN LINKS DETAILS").font = Font(bold=True, size=12)
-            ws.merge_cells(f'A{row}:F{row}')
-            row += 1
+            _append_title(w, "BROKEN LINKS DETAILS", 'F')
             
             headers = ["Link Text", "URL", "Status Code", "Section", "Is Clickable", "Error Type"]
-            for col, header in enumerate(headers, 1):
-                cell = ws.cell(row=row, column=col, value=header)
-                cell.font = Font(bold=True, color="FFFFFF")
-                cell.fill = PatternFill(start_color="366092", end_color="366092", fill_type="solid")
-            row += 1
+            _append_header(w, headers)
             
             for link in broken_links_list:
-                ws.cell(row=row, column=1, value=link.get('text', '')[:50])
-                ws.cell(row=row, column=2, value=link.get('href', '')[:80])
                 status_code = link.get('status_code', 0)
-                ws.cell(row=row, column=3, value=status_code)
-                ws.cell(row=row, column=4, value=link.get('section', '')[:30])
-                ws.cell(row=row, column=5, value='Yes' if link.get('is_clickable') else 'No')
                 
                 # Error type
-                if status_code == 404:
-                    error_type = '404 Not Found'
-                    fill_color = "FFE4E1"
-                elif status_code == 403:
-                    error_type = '403 Forbidden'
-                    fill_color = "FFB6C1"
-                elif status_code >= 500:
-                    error_type = '500 Server Error'
-                    fill_color = "F8D7DA"
-                else:
-                    error_type = 'Other Error'
-                    fill_color = "FFF3CD"
-                
-                ws.cell(row=row, column=6, value=error_type)
+                error_type, fill = _classify_error(status_code)
                 
-                # Color coding
-                for col in range(1, 7):
-                    ws.cell(row=row, column=col).fill = PatternFill(start_color=fill_color, end_color=fill_color, fill_type="solid")
-                
-                row += 1
-        
-        row += 1
+                values = [
+                    link.get('text', '')[:50],
+                    link.get('href', '')[:80],
+                    status_code,
+                    link.get('section', '')[:30],
+                    _YESNO[bool(link.get('is_clickable'))],
+                    error_type,
+                ]
+                w.append([w.cell(value, fill=fill) for value in values])
+        
+        w.skip()
         
         # Trademark Details
         trademark = footer_results.get('trademark', {})
         if trademark.get('text') or trademark.get('trustarc_link'):
-            row += 1
-            ws.cell(row=row, column=1, value="TRADEMARK DETAILS").font = Font(bold=True, size=12)
-            ws.merge_cells(f'A{row}:B{row}')
-            row += 1
+            w.skip()
+            _append_title(w, "TRADEMARK DETAILS", 'B')
             
             if trademark.get('text'):
-                ws.cell(row=row, column=1, value="Trademark Text:").font = Font(bold=True)
-                ws.cell(row=row, column=2, value=trademark.get('text', '')[:100])
-                row += 1
+                w.append([w.cell("Trademark Text:", font=_BOLD), trademark.get('text', '')[:100]])
             
             if trademark.get('trustarc_link'):
-                ws.cell(row=row, column=1, value="TrustArc Link:").font = Font(bold=True)
-                ws.cell(row=row, column=2, value=trademark.get('trustarc_link', ''))
-                row += 1
-        
-        ws.column_dimensions['A'].width = 15
-        ws.column_dimensions['B'].width = 30
-        ws.column_dimensions['C'].width = 18
-        ws.column_dimensions['D'].width = 40
-        ws.column_dimensions['E'].width = 60
-        ws.column_dimensions['F'].width = 15
-        ws.column_dimensions['G'].width = 15
-        ws.column_dimensions['H'].width = 15
-        ws.column_dimensions['I'].width = 20
+                w.append([w.cell("TrustArc Link:", font=_BOLD), trademark.get('trustarc_link', '')])
     
-    def _create_tile_list_sheet(self, wb: Workbook, tl_results: Dict):
+    def _create_tile_list_sheet(self, wb: Workbook, tl_results: dict):
         """Create detailed tile list sheet"""
         ws = wb.create_sheet("Tile List")
         
-        # Summary Section
-        ws['A1'] = "TILE LIST SUMMARY"
-        ws['A1'].font = Font(bold=True, size=14, color="366092")
-        ws.merge_cells('A1:C1')
+        # Set column widths
+        _set_widths(ws, (12, 35, 15, 18, 20, 25, 60, 15, 60, 15, 15, 12))
+        w = SheetWriter(ws)
         
-        row = 3
-        ws.cell(row=row, column=1, value="Component Exists:").font = Font(bold=True)
-        ws.cell(row=row, column=2, value='Yes' if tl_results.get('component_exists') else 'No')
-        row += 1
+        # Summary Section
+        _append_title(w, "TILE LIST SUMMARY", 'C', _SHEET_TITLE_FONT)
+        w.skip()
         
-        ws.cell(row=row, column=1, value="Total Tiles Count:").font = Font(bold=True)
-        ws.cell(row=row, column=2, value=tl_results.get('tile_count', 0))
-        row += 2
+        _append_fields(w, [
+            ("Component Exists:", _YESNO[bool(tl_results.get('component_exists'))]),
+            ("Total Tiles Count:", tl_results.get('tile_count', 0)),
+        ])
+        w.skip()
         
         # Big Container Details
         big_container = tl_results.get('big_container', {})
         if big_container:
-            ws.cell(row=row, column=1, value="BIG CONTAINER DETAILS").font = Font(bold=True, size=12)
-            ws.merge_cells(f'A{row}:C{row}')
-            row += 1
+            _append_title(w, "BIG CONTAINER DETAILS", 'C')
             
-            ws.cell(row=row, column=1, value="Container ID:").font = Font(bold=True)
-            ws.cell(row=row, column=2, value=big_container.get('id', ''))
-            row += 1
+            w.append([w.cell("Container ID:", font=_BOLD), big_container.get('id', '')])
             
-            ws.cell(row=row, column=1, value="Container Size:").font = Font(bold=True)
             if big_container.get('width') and big_container.get('height'):
                 container_width = float(big_container.get('width', 0))
                 container_height = float(big_container.get('height', 0))
-                ws.cell(row=row, column=2, value=f"{container_width:.2f}x{container_height:.2f}")
+                container_size = f"{container_width:.2f}x{container_height:.2f}"
             else:
-                ws.cell(row=row, column=2, value='')
-            row += 1
+                container_size = ''
+            w.append([w.cell("Container Size:", font=_BOLD), container_size])
             
-            ws.cell(row=row, column=1, value="Container Background Color:").font = Font(bold=True)
-            ws.cell(row=row, column=2, value=big_container.get('background_color', ''))
-            row += 2
+            w.append([w.cell("Container Background Color:", font=_BOLD), big_container.get('background_color', '')])
+            w.skip()
         
         # Tile Details Table
         tiles = tl_results.get('tiles', [])
         if tiles:
-            ws.cell(row=row, column=1, value="TILE DETAILS").font = Font(bold=True, size=12)
-            ws.merge_cells(f'A{row}:M{row}')
-            row += 1
+            _append_title(w, "TILE DETAILS", 'M')
             
             headers = ["Tile #", "Title Text", "Text Size", "Text Color", "Tile Container Size", "Tile Container Color", "Icon URL", "Icon Size", "Link URL", "Is Clickable", "Link Status", "Target"]
-            for col, header in enumerate(headers, 1):
-                cell = ws.cell(row=row, column=col, value=header)
-                cell.font = Font(bold=True, color="FFFFFF")
-                cell.fill = PatternFill(start_color="366092", end_color="366092", fill_type="solid")
-            row += 1
+            _append_header(w, headers)
             
             for tile in tiles:
                 if isinstance(tile, dict):
-                    ws.cell(row=row, column=1, value=tile.get('index', ''))
-                    
                     # Title (Text)
                     title = tile.get('title', {})
-                    ws.cell(row=row, column=2, value=title.get('text', '')[:40] if title.get('text') else '')
-                    ws.cell(row=row, column=3, value=self._format_font_size(title.get('font_size', '')))
-                    ws.cell(row=row, column=4, value=title.get('font_color', ''))
                     
                     # Tile Container
                     container = tile.get('container', {})
                     if container.get('width') and container.get('height'):
                         tile_width = float(container.get('width', 0))
                         tile_height = float(container.get('height', 0))
-                        ws.cell(row=row, column=5, value=f"{tile_width:.2f}x{tile_height:.2f}")
+                        tile_size = f"{tile_width:.2f}x{tile_height:.2f}"
                     else:
-                        ws.cell(row=row, column=5, value='')
-                    ws.cell(row=row, column=6, value=container.get('background_color', ''))
+                        tile_size = ''
                     
                     # Icon
                     icon = tile.get('icon', {})
-                    ws.cell(row=row, column=7, value=icon.get('url', '')[:60] if icon.get('url') else '')
                     if icon.get('width') and icon.get('height'):
                         icon_width = float(icon.get('width', 0))
                         icon_height = float(icon.get('height', 0))
-                        ws.cell(row=row, column=8, value=f"{icon_width:.2f}x{icon_height:.2f}")
+                        icon_size = f"{icon_width:.2f}x{icon_height:.2f}"
                     else:
-                        ws.cell(row=row, column=8, value='')
+                        icon_size = ''
                     
                     # Link
                     link = tile.get('link', {})
-                    ws.cell(row=row, column=9, value=link.get('href', '')[:60] if link.get('href') else '')
                     
                     # Is Clickable
                     is_clickable = link.get('is_clickable', False)
-                    clickable_cell = ws.cell(row=row, column=10, value='Yes' if is_clickable else 'No')
                     if is_clickable:
-                        clickable_cell.fill = PatternFill(start_color="D4EDDA", end_color="D4EDDA", fill_type="solid")
+                        clickable_fill = FILL_PASS
                     else:
-                        clickable_cell.fill = PatternFill(start_color="F8D7DA", end_color="F8D7DA", fill_type="solid")
+                        clickable_fill = FILL_FAIL
                     
                     # Link status (should not be broken)
                     link_status = 'Valid' if link.get('is_valid') else 'Invalid' if link.get('status_code', 0) > 0 else 'Not Checked'
-                    status_cell = ws.cell(row=row, column=11, value=link_status)
                     if link.get('is_valid'):
-                        status_cell.fill = PatternFill(start_color="D4EDDA", end_color="D4EDDA", fill_type="solid")
+                        status_fill = FILL_PASS
                     elif link.get('status_code', 0) >= 400:
-                        status_cell.fill = PatternFill(start_color="F8D7DA", end_color="F8D7DA", fill_type="solid")
+                        status_fill = FILL_FAIL
                     else:
-                        status_cell.fill = PatternFill(start_color="FFF3CD", end_color="FFF3CD", fill_type="solid")
-                    
-                    ws.cell(row=row, column=12, value=link.get('target', '_self'))
+                        status_fill = FILL_WARN
                     
-                    row += 1
-        
-        # Set column widths
-        ws.column_dimensions['A'].width = 12
-        ws.column_dimensions['B'].width = 35
-        ws.column_dimensions['C'].width = 15
-        ws.column_dimensions['D'].width = 18
-        ws.column_dimensions['E'].width = 20
-        ws.column_dimensions['F'].width = 25
-        ws.column_dimensions['G'].width = 60
-        ws.column_dimensions['H'].width = 15
-        ws.column_dimensions['I'].width = 60
-        ws.column_dimensions['J'].width = 15
-        ws.column_dimensions['K'].width = 15
-        ws.column_dimensions['L'].width = 12
+                    w.append([
+                        tile.get('index', ''),
+                        title.get('text', '')[:40] if title.get('text') else '',
+                        self._format_font_size(title.get('font_size', '')),
+                        title.get('font_color', ''),
+                        tile_size,
+                        container.get('background_color', ''),
+                        icon.get('url', '')[:60] if icon.get('url') else '',
+                        icon_size,
+                        link.get('href', '')[:60] if link.get('href') else '',
+                        w.cell(_YESNO[bool(is_clickable)], fill=clickable_fill),
+                        w.cell(link_status, fill=status_fill),
+                        link.get('target', '_self'),
+                    ])
     
-    def _create_search_sheet(self, wb: Workbook, search_results: Dict):
+    def _create_search_sheet(self, wb: Workbook, search_results: dict):
         """Create detailed search sheet"""
         ws = wb.create_sheet("Search")
         
+        # Set column widths
+        _set_widths(ws, (25, 50, 60, 15, 15))
+        w = SheetWriter(ws)
+        
         # Summary Section
-        ws['A1'] = "SEARCH COMPONENT SUMMARY"
-        ws['A1'].font = Font(bold=True, size=14, color="366092")
-        ws.merge_cells('A1:C1')
+        _append_title(w, "SEARCH COMPONENT SUMMARY", 'C', _SHEET_TITLE_FONT)
+        w.skip()
         
-        row = 3
-        ws.cell(row=row, column=1, value="Component Exists:").font = Font(bold=True)
-        ws.cell(row=row, column=2, value='Yes' if search_results.get('component_exists') else 'No')
-        row += 1
+        w.append([w.cell("Component Exists:", font=_BOLD), _YESNO[bool(search_results.get('component_exists'))]])
         
         suggestion_count = search_results.get('suggestion_count', 0)
-        ws.cell(row=row, column=1, value="Search Suggestions Count:").font = Font(bold=True)
-        ws.cell(row=row, column=2, value=suggestion_count)
-        row += 2
+        w.append([w.cell("Search Suggestions Count:", font=_BOLD), suggestion_count])
+        w.skip()
         
         # Title Details
         title = search_results.get('title', {})
         if title.get('text'):
-            ws.cell(row=row, column=1, value="TITLE DETAILS").font = Font(bold=True, size=12)
-            ws.merge_cells(f'A{row}:C{row}')
-            row += 1
+            _append_title(w, "TITLE DETAILS", 'C')
             
-            ws.cell(row=row, column=1, value="Title Text:").font = Font(bold=True)
-            ws.cell(row=row, column=2, value=title.get('text', ''))
-            row += 1
-            
-            ws.cell(row=row, column=1, value="Font Size:").font = Font(bold=True)
-            ws.cell(row=row, column=2, value=self._format_font_size(title.get('font_size', '')))
-            row += 1
-            
-            ws.cell(row=row, column=1, value="Font Color:").font = Font(bold=True)
-            ws.cell(row=row, column=2, value=title.get('font_color', ''))
-            row += 2
+            _append_fields(w, [
+                ("Title Text:", title.get('text', '')),
+                ("Font Size:", self._format_font_size(title.get('font_size', ''))),
+                ("Font Color:", title.get('font_color', '')),
+            ])
+            w.skip()
         
         # Form Details
         form = search_results.get('form', {})
         if form.get('action'):
-            ws.cell(row=row, column=1, value="FORM DETAILS").font = Font(bold=True, size=12)
-            ws.merge_cells(f'A{row}:C{row}')
-            row += 1
+            _append_title(w, "FORM DETAILS", 'C')
             
-            ws.cell(row=row, column=1, value="Form Action:").font = Font(bold=True)
-            ws.cell(row=row, column=2, value=form.get('action', ''))
-            row += 1
-            
-            ws.cell(row=row, column=1, value="Form Method:").font = Font(bold=True)
-            ws.cell(row=row, column=2, value=form.get('method', 'get'))
-            row += 1
+            _append_fields(w, [
+                ("Form Action:", form.get('action', '')),
+                ("Form Method:", form.get('method', 'get')),
+            ])
             
             # Input field details
             input_field = form.get('input', {})
             if input_field:
-                ws.cell(row=row, column=1, value="Input Placeholder:").font = Font(bold=True)
-                ws.cell(row=row, column=2, value=input_field.get('placeholder', ''))
-                row += 1
-                
-                ws.cell(row=row, column=1, value="Is Required:").font = Font(bold=True)
-                ws.cell(row=row, column=2, value='Yes' if input_field.get('required') else 'No')
-                row += 1
+                _append_fields(w, [
+                    ("Input Placeholder:", input_field.get('placeholder', '')),
+                    ("Is Required:", _YESNO[bool(input_field.get('required'))]),
+                ])
                 
                 if input_field.get('data_search_page'):
-                    ws.cell(row=row, column=1, value="Data Search Page:").font = Font(bold=True)
-                    ws.cell(row=row, column=2, value=input_field.get('data_search_page', ''))
-                    row += 1
+                    w.append([w.cell("Data Search Page:", font=_BOLD), input_field.get('data_search_page', '')])
             
-            row += 1
+            w.skip()
         
         # Search Suggestions Details
         suggestions = search_results.get('suggestions', [])
         if suggestions:
-            ws.cell(row=row, column=1, value="SEARCH SUGGESTIONS DETAILS").font = Font(bold=True, size=12)
-            ws.merge_cells(f'A{row}:E{row}')
-            row += 1
+            _append_title(w, "SEARCH SUGGESTIONS DETAILS", 'E')
             
             headers = ["Suggestion #", "Suggestion Text", "Link URL", "Status Code", "Link Status"]
-            for col, header in enumerate(headers, 1):
-                cell = ws.cell(row=row, column=col, value=header)
-                cell.font = Font(bold=True, color="FFFFFF")
-                cell.fill = PatternFill(start_color="366092", end_color="366092", fill_type="solid")
-            row += 1
+            _append_header(w, headers)
             
             for suggestion in suggestions:
-                ws.cell(row=row, column=1, value=suggestion.get('index', ''))
-                ws.cell(row=row, column=2, value=suggestion.get('text', '')[:40])
-                ws.cell(row=row, column=3, value=suggestion.get('href', '')[:60])
-                
                 status_code = suggestion.get('status_code', 0)
-                ws.cell(row=row, column=4, value=status_code)
-                
                 link_status = 'Valid' if suggestion.get('is_valid') else 'Invalid' if status_code > 0 else 'Not Checked'
-                status_cell = ws.cell(row=row, column=5, value=link_status)
                 
                 # Color coding
                 if suggestion.get('is_valid'):
-                    status_cell.fill = PatternFill(start_color="D4EDDA", end_color="D4EDDA", fill_type="solid")
+                    status_fill = FILL_PASS
                 elif status_code >= 400:
-                    status_cell.fill = PatternFill(start_color="F8D7DA", end_color="F8D7DA", fill_type="solid")
+                    status_fill = FILL_FAIL
                 else:
-                    status_cell.fill = PatternFill(start_color="FFF3CD", end_color="FFF3CD", fill_type="solid")
+                    status_fill = FILL_WARN
                 
-                row += 1
-        
-        # Set column widths
-        ws.column_dimensions['A'].width = 25
-        ws.column_dimensions['B'].width = 50
-        ws.column_dimensions['C'].width = 60
-        ws.column_dimensions['D'].width = 15
-        ws.column_dimensions['E'].width = 15
+                w.append([
+                    suggestion.get('index', ''),
+                    suggestion.get('text', '')[:40],
+                    suggestion.get('href', '')[:60],
+                    status_code,
+                    w.cell(link_status, fill=status_fill),
+                ])
 
 
@@ -3,15 +3,34 @@ Comprehensive Home Page Validator for Solidigm Website
 Validates all home page components including Navigation, Carousel, Featured Products,
 Product Cards, Article List, Blade Components, Tile List, Search, and Footer
 """
+from __future__ import annotations
+
 import time
-from typing import Dict, List
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urljoin
+import requests
 from playwright.sync_api import Page
-from navigation_validator import NavigationValidator
-from blade_component_validator import BladeComponentValidator
-from carousel_validator import CarouselValidator
-from link_validator import LinkValidator
-from featured_products_validator import FeaturedProductsValidator
-from article_list_validator import ArticleListValidator
+from link_validator import request_identity
+
+# Console banners
+_SEP = "=" * 100
+_COMPONENT_HEADER = f"\n{_SEP}\nCOMPONENT {{number}}: {{name}}\n{_SEP}"
+
+# Concurrent HTTP status checks for footer/search links
+LINK_CHECK_WORKERS = 8
+
+# Known product card classes (an allowlist instead of a [class*="card"] substring match)
+PRODUCT_CARD_SELECTOR = '.product-card, .card-product, .cmp-product-card, .productcard'
+
+# Footer root selectors, most specific first
+FOOTER_SELECTORS = [
+    '.footer-content__main',
+    '.footer-content',
+    '.cmp-experiencefragment--footer',
+    'footer',
+    '[class*="footer"]',
+    '[role="contentinfo"]'
+]
 
 
 class HomePageValidator:
@@ -19,98 +38,81 @@ class HomePageValidator:
         self.page = page
         self.base_url = base_url
         self.results = {}
+        # Existence/count results from _scan_components(); empty until a full homepage run
+        self._dom_scan = {}
     
-    def validate_complete_homepage(self) -> Dict:
+    def validate_complete_homepage(self) -> dict:
         """Validate all home page components"""
-        print("\n" + "="*100)
-        print(" " * 30 + "HOMEPAGE COMPREHENSIVE VALIDATION")
-        print("="*100)
+        print(f"\n{_SEP}\n{' ' * 30}HOMEPAGE COMPREHENSIVE VALIDATION\n{_SEP}")
         
         try:
             # Navigate to home page
             print(f"\n[INFO] Navigating to {self.base_url}")
-            self.page.goto(self.base_url, timeout=90000, wait_until='domcontentloaded')
-            self.page.wait_for_timeout(3000)
+            response = self.page.goto(self.base_url, timeout=90000, wait_until='domcontentloaded')
+            # Skip the component validators entirely on a broken page - they would only find nothing
+            if response is None or not response.ok:
+                error = f"HTTP {response.status}" if response else "No response"
+                print(f"[ERROR] Homepage did not load: {error}")
+                return {'error': error}
+            # Wait for the load event instead of a fixed 3s sleep; returns as soon as the page has loaded
+            try:
+                self.page.wait_for_load_state('load', timeout=5000)
+            except Exception:
+                print("[WARNING] Page load event not reached within 5s, continuing")
             
             title = self.page.title()
             print(f"[OK] Page loaded: {title}")
             
-            # Initialize validators
+            # Initialize validators (imported here so footer-only runs don't load them)
+            from navigation_validator import NavigationValidator
+            from carousel_validator import CarouselValidator
+            from link_validator import LinkValidator
+            from featured_products_validator import FeaturedProductsValidator
+            from article_list_validator import ArticleListValidator
+            
             nav_validator = NavigationValidator(self.page, self.base_url)
             carousel_validator = CarouselValidator(self.page)
             link_validator = LinkValidator(self.page, self.base_url)
             featured_products_validator = FeaturedProductsValidator(self.page)
             article_list_validator = ArticleListValidator(self.page)
             
-            # Validate each component
-            print("\n" + "="*100)
-            print("COMPONENT 1: NAVIGATION")
-            print("="*100)
-            navigation_results = nav_validator.validate_navigation_menu()
-            
-            print("\n" + "="*100)
-            print("COMPONENT 2: CAROUSEL")
-            print("="*100)
-            carousel_results = carousel_validator.validate_carousel()
-            
-            print("\n" + "="*100)
-            print("COMPONENT 3: FEATURED PRODUCTS")
-            print("="*100)
-            featured_products = featured_products_validator.validate_featured_products()
-            
-            # Product Cards - Not present on homepage, skipping
-            # print("\n" + "="*100)
-            # print("COMPONENT 4: PRODUCT CARDS")
-            # print("="*100)
-            product_cards = {'component_exists': False, 'card_count': 0, 'cards': []}
-            
-            print("\n" + "="*100)
-            print("COMPONENT 5: ARTICLE LIST")
-            print("="*100)
-            article_list = article_list_validator.validate_article_list()
-            
-            print("\n" + "="*100)
-            print("COMPONENT 6: BLADE COMPONENTS")
-            print("="*100)
-            blade_components = self._validate_blade_components()
-            
-            print("\n" + "="*100)
-            print("COMPONENT 7: TILE LIST")
-            print("="*100)
-            tile_list = self._validate_tile_list()
-            
-            print("\n" + "="*100)
-            print("COMPONENT 8: SEARCH")
-            print("="*100)
-            search_component = self._validate_search_component()
-            
-            print("\n" + "="*100)
-            print("COMPONENT 9: FOOTER")
-            print("="*100)
-            footer = self._validate_footer()
+            # Validate each component, in page order
+            components = [
+                (1, "NAVIGATION", 'navigation', nav_validator.validate_navigation_menu),
+                (2, "CAROUSEL", 'carousel', carousel_validator.validate_carousel),
+                (3, "FEATURED PRODUCTS", 'featured_products', featured_products_validator.validate_featured_products),
+                (4, "PRODUCT CARDS", 'product_cards', None),  # Not present on homepage, skipping
+                (5, "ARTICLE LIST", 'article_list', article_list_validator.validate_article_list),
+                (6, "BLADE COMPONENTS", 'blade_components', self._validate_blade_components),
+                (7, "TILE LIST", 'tile_list', self._validate_tile_list),
+                (8, "SEARCH", 'search', self._validate_search_component),
+                (9, "FOOTER", 'footer', self._validate_footer),
+            ]
+            
+            component_results = {}
+            for number, name, key, validate in components:
+                if validate is None:
+                    component_results[key] = {'component_exists': False, 'card_count': 0, 'cards': []}
+                    continue
+                if key == 'blade_components':
+                    # One DOM pass for the count/existence checks of the simpler components
+                    # (after the interactive validators above, so lazily rendered sections are in the DOM)
+                    self._dom_scan = self._scan_components()
+                print(_COMPONENT_HEADER.format(number=number, name=name))
+                component_results[key] = validate()
             
             # Compile all results first
             results_dict = {
                 'url': self.base_url,
                 'timestamp': time.strftime("%Y-%m-%d %H:%M:%S"),
-                'navigation': navigation_results,
-                'carousel': carousel_results,
-                'featured_products': featured_products,
-                'product_cards': product_cards,
-                'article_list': article_list,
-                'blade_components': blade_components,
-                'tile_list': tile_list,
-                'search': search_component,
-                'footer': footer
+                **component_results
             }
             
             # Generate summary from the compiled results
             results_dict['summary'] = self._generate_summary(results_dict)
             self.results = results_dict
             
-            print("\n" + "="*100)
-            print("✅ HOMEPAGE VALIDATION COMPLETE")
-            print("="*100)
+            print(f"\n{_SEP}\n✅ HOMEPAGE VALIDATION COMPLETE\n{_SEP}")
             
             return self.results
             
@@ -119,7 +121,46 @@ class HomePageValidator:
             return {'error': str(e)}
     
     
-    def _validate_product_cards(self) -> Dict:
+    def _scan_components(self) -> dict:
+        """Collect existence flags and counts for product cards, tile list, search and footer in one page.evaluate"""
+        try:
+            return self.page.evaluate("""
+                ([cardSelector, footerSelectors]) => ({
+                    product_cards: document.querySelectorAll(cardSelector).length,
+                    tile_list: Array.from(document.querySelectorAll('.cmp-container'))
+                        .some(el => el.querySelector('.tilelistv2, .cmp-tilelist__support')),
+                    search: !!document.querySelector('.search-component'),
+                    footer_selector: footerSelectors.find(sel => document.querySelector(sel)) || null
+                })
+            """, [PRODUCT_CARD_SELECTOR, FOOTER_SELECTORS])
+        except Exception as e:
+            print(f"[WARNING] Component scan failed, falling back to per-component checks: {str(e)}")
+            return {}
+    
+    def _check_links(self, pending: list[tuple[dict, str]]):
+        """Fetch the status of every (link_data, absolute_href) pair concurrently and fill in status_code/is_valid"""
+        if not pending:
+            return
+        # Same user agent and cookies as the browser, so consent/session-gated links report the same status
+        headers, cookies = request_identity(self.page)
+        
+        def fetch_status(url: str) -> int:
+            try:
+                with requests.get(url, headers=headers, cookies=cookies, timeout=3, allow_redirects=True, stream=True) as response:
+                    return response.status_code
+            except requests.exceptions.RequestException:
+                return 0
+        
+        urls = list(dict.fromkeys(url for _, url in pending))
+        with ThreadPoolExecutor(max_workers=min(LINK_CHECK_WORKERS, len(urls))) as pool:
+            statuses = dict(zip(urls, pool.map(fetch_status, urls)))
+        
+        for link_data, url in pending:
+            status = statuses[url]
+            link_data['status_code'] = status
+            link_data['is_valid'] = 200 <= status < 400
+    
+    def _validate_product_cards(self) -> dict:
         """Validate Product Cards component"""
         print("[INFO] Validating Product Cards...")
         
@@ -131,11 +172,16 @@ class HomePageValidator:
         
         try:
             # Find product cards
-            cards = self.page.locator('.product-card, [class*="card"], .card-product')
+            cards = self.page.locator(PRODUCT_CARD_SELECTOR)
             
-            if cards.count() > 0:
+            if 'product_cards' in self._dom_scan:
+                card_count = self._dom_scan['product_cards']
+            else:
+                # No DOM scan count, so ask the locator (0 when no card matches)
+                card_count = cards.count()
+            if card_count > 0:
                 results['component_exists'] = True
-                results['card_count'] = cards.count()
+                results['card_count'] = card_count
                 print(f"   [OK] Found {results['card_count']} product cards")
                 
         except Exception as e:
@@ -144,12 +190,13 @@ class HomePageValidator:
         return results
     
     
-    def _validate_blade_components(self) -> Dict:
+    def _validate_blade_components(self) -> dict:
         """Validate Blade Components (left/right image layouts)"""
+        from blade_component_validator import BladeComponentValidator
         validator = BladeComponentValidator(self.page)
         return validator.validate_blade_components()
     
-    def _validate_tile_list(self) -> Dict:
+    def _validate_tile_list(self) -> dict:
         """Validate Tile List component (tile list with support tiles)"""
         print("\n[INFO] Validating Tile List component...")
         
@@ -164,7 +211,8 @@ class HomePageValidator:
             # Find the big container (.cmp-container that contains the tile list)
             big_container = self.page.locator('.cmp-container').filter(has=self.page.locator('.tilelistv2, .cmp-tilelist__support')).first
             
-            if big_container.count() == 0:
+            exists = self._dom_scan['tile_list'] if 'tile_list' in self._dom_scan else big_container.count() > 0
+            if not exists:
                 print("   [INFO] Tile List component not found")
                 return results
             
@@ -239,10 +287,17 @@ class HomePageValidator:
                 
                 # Quick check: ensure it's an actual tile card (has href or contains expected structure)
                 try:
-                    # Check if element has href (anchor tag) or contains title/icon
-                    has_href = bool(tile.get_attribute('href') or '')
-                    has_title_element = tile.locator('.cmp-tilelist__support-title').count() > 0
-                    has_icon_element = tile.locator('.cmp-tilelist__support-icon').count() > 0
+                    # Check if element has href (anchor tag) or contains title/icon - one round-trip
+                    structure = tile.evaluate("""
+                        (el) => ({
+                            href: el.getAttribute('href') || '',
+                            hasTitle: !!el.querySelector('.cmp-tilelist__support-title'),
+                            hasIcon: !!el.querySelector('.cmp-tilelist__support-icon')
+                        })
+                    """)
+                    has_href = bool(structure.get('href'))
+                    has_title_element = structure.get('hasTitle', False)
+                    has_icon_element = structure.get('hasIcon', False)
                     
                     # Only process if it looks like an actual tile card
                     if has_href or has_title_element or has_icon_element:
@@ -275,7 +330,7 @@ class HomePageValidator:
         
         return results
     
-    def _validate_single_tile(self, tile, index: int) -> Dict:
+    def _validate_single_tile(self, tile, index: int) -> dict:
         """Validate a single tile in the tile list"""
         tile_data = {
             'index': index + 1,
@@ -422,7 +477,7 @@ class HomePageValidator:
         
         return tile_data
     
-    def _validate_search_component(self) -> Dict:
+    def _validate_search_component(self) -> dict:
         """Validate Search component"""
         print("\n[INFO] Validating Search component...")
         
@@ -437,7 +492,8 @@ class HomePageValidator:
             # Find search component
             search_component = self.page.locator('.search-component').first
             
-            if search_component.count() == 0:
+            exists = self._dom_scan['search'] if 'search' in self._dom_scan else search_component.count() > 0
+            if not exists:
                 print("   [INFO] Search component not found")
                 return results
             
@@ -451,9 +507,23 @@ class HomePageValidator:
             except:
                 pass
             
+            # Check which sub-elements exist in a single round-trip
+            present = search_component.evaluate("""
+                (el) => {
+                    const form = el.querySelector('form.search-label');
+                    return {
+                        title: !!el.querySelector('.search-component__title, h3'),
+                        form: !!form,
+                        input: !!(form && form.querySelector('input.search-input, input[type="text"]')),
+                        hiddenInput: !!(form && form.querySelector('input[type="hidden"]')),
+                        suggestions: el.querySelectorAll('.search-component__suggestions__suggestion, a[class*="suggestion"]').length
+                    };
+                }
+            """)
+            
             # Validate title
             title_element = search_component.locator('.search-component__title, h3').first
-            if title_element.count() > 0:
+            if present['title']:
                 title_text = (title_element.text_content() or '').strip()
                 results['title']['text'] = title_text
                 
@@ -482,7 +552,7 @@ class HomePageValidator:
             
             # Validate search form
             form = search_component.locator('form.search-label').first
-            if form.count() > 0:
+            if present['form']:
                 form_action = form.get_attribute('action') or ''
                 form_method = form.get_attribute('method') or 'get'
                 
@@ -491,7 +561,7 @@ class HomePageValidator:
                 
                 # Get input field details
                 input_field = form.locator('input.search-input, input[type="text"]').first
-                if input_field.count() > 0:
+                if present['input']:
                     placeholder = input_field.get_attribute('placeholder') or ''
                     input_name = input_field.get_attribute('name') or ''
                     is_required = input_field.get_attribute('required') is not None
@@ -508,7 +578,7 @@ class HomePageValidator:
                 
                 # Get hidden input field
                 hidden_input = form.locator('input[type="hidden"]').first
-                if hidden_input.count() > 0:
+                if present['hiddenInput']:
                     hidden_name = hidden_input.get_attribute('name') or ''
                     hidden_value = hidden_input.get_attribute('value') or ''
                     results['form']['hidden_input'] = {
@@ -518,11 +588,12 @@ class HomePageValidator:
             
             # Validate search suggestions
             suggestions = search_component.locator('.search-component__suggestions__suggestion, a[class*="suggestion"]')
-            suggestion_count = suggestions.count()
+            suggestion_count = present['suggestions']
             results['suggestion_count'] = suggestion_count
             
             print(f"      Found {suggestion_count} suggestions")
             
+            pending_links = []
             for i in range(suggestion_count):
                 suggestion = suggestions.nth(i)
                 suggestion_text = (suggestion.text_content() or '').strip()
@@ -536,27 +607,23 @@ class HomePageValidator:
                     'status_code': 0
                 }
                 
-                # Validate link
+                # Queue link validation
                 if suggestion_href and suggestion_href != '#':
-                    try:
-                        from urllib.parse import urljoin
-                        absolute_href = suggestion_href if suggestion_href.startswith('http') else urljoin(self.page.url, suggestion_href)
-                        response = self.page.request.get(absolute_href, timeout=3000)
-                        suggestion_data['status_code'] = response.status
-                        suggestion_data['is_valid'] = 200 <= response.status < 400
-                    except Exception:
-                        suggestion_data['is_valid'] = False
+                    absolute_href = suggestion_href if suggestion_href.startswith('http') else urljoin(self.page.url, suggestion_href)
+                    pending_links.append((suggestion_data, absolute_href))
                 
                 results['suggestions'].append(suggestion_data)
                 print(f"         Suggestion {i+1}: {suggestion_text}")
             
+            self._check_links(pending_links)
+            
         except Exception as e:
             print(f"   [ERROR] Search component validation failed: {str(e)}")
             results['error'] = str(e)
         
         return results
     
-    def _validate_footer(self) -> Dict:
+    def _validate_footer(self) -> dict:
         """Validate Footer component"""
         print("\n[INFO] Validating Footer component...")
         
@@ -574,25 +641,19 @@ class HomePageValidator:
         }
         
         try:
-            # Try multiple selectors to find footer
+            # Try multiple selectors to find footer (already resolved by the component scan on full runs)
             footer = None
-            footer_selectors = [
-                '.footer-content__main',
-                '.footer-content',
-                '.cmp-experiencefragment--footer',
-                'footer',
-                '[class*="footer"]',
-                '[role="contentinfo"]'
-            ]
+            if 'footer_selector' in self._dom_scan:
+                selector = self._dom_scan['footer_selector']
+            else:
+                selector = next((sel for sel in FOOTER_SELECTORS if self.page.locator(sel).first.count() > 0), None)
             
-            for selector in footer_selectors:
+            if selector:
                 footer = self.page.locator(selector).first
-                if footer.count() > 0:
-                    print(f"   [OK] Footer found using selector: {selector}")
-                    results['component_exists'] = True
-                    break
+                print(f"   [OK] Footer found using selector: {selector}")
+                results['component_exists'] = True
             
-            if footer is None or footer.count() == 0:
+            if not results['component_exists']:
                 print("   [WARNING] Footer component not found with any selector")
                 return results
                 
@@ -623,9 +684,21 @@ class HomePageValidator:
             except:
                 pass
             
+            # Count the footer's sub-elements in a single round-trip
+            present = footer.evaluate("""
+                (footer) => ({
+                    logo: !!footer.querySelector('.footer-content__logo, a[class*="logo"]'),
+                    socialIcons: footer.querySelectorAll('.footer-content__social-icon, a[class*="social"]').length,
+                    copyright: !!footer.querySelector('.footer-content__copyright'),
+                    leftColumn: !!footer.querySelector('.footer-content__left'),
+                    navSections: footer.querySelectorAll('nav').length,
+                    trademark: !!footer.querySelector('.footer-content__trademark')
+                })
+            """)
+            
             # Validate logo
             logo = footer.locator('.footer-content__logo, a[class*="logo"]').first
-            if logo.count() > 0:
+            if present['logo']:
                 logo_href = logo.get_attribute('href') or ''
                 logo_title = logo.get_attribute('title') or ''
                 results['logo'] = {
@@ -636,11 +709,13 @@ class HomePageValidator:
             
             # Validate social icons
             social_icons = footer.locator('.footer-content__social-icon, a[class*="social"]')
-            icon_count = social_icons.count()
+            icon_count = present['socialIcons']
             results['social_icon_count'] = icon_count
             
             print(f"      Found {icon_count} social icons")
             
+            # Link statuses are fetched together once every footer link has been collected
+            pending_links = []
             for i in range(icon_count):
                 icon = social_icons.nth(i)
                 icon_href = icon.get_attribute('href') or ''
@@ -688,16 +763,10 @@ class HomePageValidator:
                     'domain_validation_message': domain_validation_message
                 }
                 
-                # Validate link
+                # Queue link validation
                 if icon_href and icon_href != '#' and not icon_href.startswith('#'):
-                    try:
-                        from urllib.parse import urljoin
-                        absolute_href = icon_href if icon_href.startswith('http') else urljoin(self.page.url, icon_href)
-                        response = self.page.request.get(absolute_href, timeout=3000)
-                        icon_data['status_code'] = response.status
-                        icon_data['is_valid'] = 200 <= response.status < 400
-                    except Exception:
-                        icon_data['is_valid'] = False
+                    absolute_href = icon_href if icon_href.startswith('http') else urljoin(self.page.url, icon_href)
+                    pending_links.append((icon_data, absolute_href))
                 
                 results['social_icons'].append(icon_data)
                 
@@ -709,18 +778,17 @@ class HomePageValidator:
             
             # Validate copyright section
             copyright_section = footer.locator('.footer-content__copyright').first
-            if copyright_section.count() > 0:
+            if present['copyright']:
                 copyright_text = (copyright_section.text_content() or '').strip()
                 results['copyright']['text'] = copyright_text
                 print(f"      Copyright text found")
             
             # Check if left column exists (logo, social icons, copyright)
-            left_column = footer.locator('.footer-content__left').first
-            has_left_column = left_column.count() > 0
+            has_left_column = present['leftColumn']
             
             # Validate navigation sections (columns)
             nav_sections = footer.locator('nav')
-            section_count = nav_sections.count()
+            section_count = present['navSections']
             results['section_count'] = section_count
             
             # Column count: 1 (left column) + navigation sections
@@ -732,10 +800,20 @@ class HomePageValidator:
                 print(f"      Left column (logo, social icons, copyright) found - counted as Column 1")
             print(f"      Total columns: {column_count} (1 left column + {section_count} navigation sections)")
             
+            # Section titles and link counts for every nav section in one round-trip
+            section_info = nav_sections.evaluate_all("""
+                (navs) => navs.map(nav => {
+                    const title = nav.querySelector('.footer-content__title, p.footer-content__title');
+                    return {
+                        title: title ? (title.textContent || '').trim() : '',
+                        link_count: nav.querySelectorAll('a').length
+                    };
+                })
+            """) if section_count else []
+            
             for i in range(section_count):
                 nav_section = nav_sections.nth(i)
-                section_title = nav_section.locator('.footer-content__title, p.footer-content__title').first
-                title_text = (section_title.text_content() or '').strip() if section_title.count() > 0 else ''
+                title_text = section_info[i]['title']
                 
                 # Get all links in this section - include nested links (like Cookie Preferences)
                 # Get all anchor tags within the nav section
@@ -744,7 +822,7 @@ class HomePageValidator:
                 processed_links = set()  # To avoid duplicates based on text+href combination
                 
                 # Process all links found
-                for j in range(all_links.count()):
+                for j in range(section_info[i]['link_count']):
                     link = all_links.nth(j)
                     link_text = (link.text_content() or '').strip()
                     link_href = link.get_attribute('href') or ''
@@ -811,16 +889,10 @@ class HomePageValidator:
                         'font_color': font_styles.get('color', '')
                     }
                     
-                    # Validate link
+                    # Queue link validation
                     if link_href and link_href != '#' and not link_href.startswith('#'):
-                        try:
-                            from urllib.parse import urljoin
-                            absolute_href = link_href if link_href.startswith('http') else urljoin(self.page.url, link_href)
-                            response = self.page.request.get(absolute_href, timeout=3000)
-                            link_data['status_code'] = response.status
-                            link_data['is_valid'] = 200 <= response.status < 400
-                        except Exception:
-                            link_data['is_valid'] = False
+                        absolute_href = link_href if link_href.startswith('http') else urljoin(self.page.url, link_href)
+                        pending_links.append((link_data, absolute_href))
                     
                     links_data.append(link_data)
                 
@@ -840,9 +912,12 @@ class HomePageValidator:
                 title_display = title_text if title_text else '(No Title)'
                 print(f"         Column {column_number} (Section {i+1}): {title_display} ({len(links_data)} links)")
             
+            # Validate all queued social icon and section links concurrently
+            self._check_links(pending_links)
+            
             # Validate trademark section
             trademark_section = footer.locator('.footer-content__trademark').first
-            if trademark_section.count() > 0:
+            if present['trademark']:
                 trademark_text = trademark_section.locator('.footer-content__text p').first
                 if trademark_text.count() > 0:
                     results['trademark']['text'] = (trademark_text.text_content() or '').strip()
@@ -862,7 +937,7 @@ class HomePageValidator:
         
         return results
     
-    def _generate_summary(self, results_dict: Dict) -> Dict:
+    def _generate_summary(self, results_dict: dict) -> dict:
         """Generate validation summary from results dictionary"""
         # Get carousel count
         carousel_data = results_dict.get('carousel', {})
@@ -6,6 +6,22 @@ from typing import List, Dict, Tuple
 from playwright.sync_api import Page, Locator
 from urllib.parse import urljoin, urlparse
 
+
+def request_identity(page: Page) -> Tuple[Dict, requests.cookies.RequestsCookieJar]:
+    """Return (headers, cookies) so plain HTTP checks look like the page's browser session"""
+    try:
+        headers = {'User-Agent': page.evaluate("() => navigator.userAgent")}
+    except Exception:
+        headers = {}
+    cookies = requests.cookies.RequestsCookieJar()
+    try:
+        for cookie in page.context.cookies():
+            cookies.set(cookie['name'], cookie['value'], domain=cookie.get('domain', ''), path=cookie.get('path', '/'))
+    except Exception:
+        pass
+    return headers, cookies
+
+
 class LinkValidator:
     def __init__(self, page: Page, base_url: str):
         self.page = page
@@ -1,248 +1,248 @@
 """
 Navigation (Header) Report Generator
 """
+import os
+from datetime import datetime
+from functools import lru_cache
 from typing import Dict
 from openpyxl import Workbook
 from openpyxl.styles import Font, PatternFill
-from base_report_generator import BaseReportGenerator
+from openpyxl.utils import get_column_letter
+from base_report_generator import BaseReportGenerator, SheetWriter
+
+
+@lru_cache(maxsize=32)
+def _fill(argb: str) -> PatternFill:
+    """Return the shared solid fill for an ARGB color (one instance per color)"""
+    return PatternFill(start_color=argb, end_color=argb, fill_type="solid")
+
+
+# Styles shared by every row (built once instead of per cell), colors as full ARGB
+_TITLE_FONT = Font(bold=True, size=14, color="FF366092")
+_SECTION_FONT = Font(bold=True, size=12)
+_BOLD = Font(bold=True)
+_HEADER_FONT = Font(bold=True, color="FFFFFFFF")
+_HEADER_FILL = _fill("FF366092")
+FILL_PASS = _fill("FFD4EDDA")  # Green
+FILL_FAIL = _fill("FFF8D7DA")  # Red
+FILL_WARN = _fill("FFFFF3CD")  # Yellow
+FILL_404 = _fill("FFFFE4E1")  # Light red
+FILL_403 = _fill("FFFFB6C1")  # Pink
+
+# Yes/No labels indexed by a bool
+_YESNO = ('No', 'Yes')
+
+# Reports with at least this many link rows are streamed through xlsxwriter when it is installed
+XLSXWRITER_ROW_THRESHOLD = 1000
+
+# Sub-menu link status keyed by status code: (link status, fill)
+_LINK_STATUS_TABLE = {
+    200: ('Working', FILL_PASS),
+    0: ('Not Checked', FILL_WARN),
+}
+
+# Broken link error types keyed by status code: (error type, fill)
+_ERROR_TABLE = {
+    404: ('404 Not Found', FILL_404),
+    403: ('403 Forbidden', FILL_403),
+}
+
+# Table header rows
+_MAIN_MENU_HEADERS = ("Menu Name", "Display Text", "Is Visible", "Has Mega Menu", "Sub-Menu Count", "Status")
+_SUB_MENU_HEADERS = ("Main Menu", "Link Text", "URL", "Status Code", "Is Visible", "Link Status")
+_BROKEN_LINK_HEADERS = ("Link Text", "URL", "Status Code", "Is Visible", "Error Type")
+_FONT_STYLE_HEADERS = ("Element Type", "Name", "Font Size", "Font Color")
+
+# Column widths A..F
+_COLUMN_WIDTHS = (20, 40, 20, 30, 15, 15)
+
+# Summary section rows: (label, summary key, fill when the count is non-zero)
+_SUMMARY_ROWS = (
+    ("Total Main Menu Items:", 'total_main_menu_items', None),
+    ("Visible Main Menu Items:", 'visible_main_menu_items', None),
+    ("Total Sub-Menu Items:", 'total_sub_menu_items', None),
+    ("Total Links Checked:", 'total_links_checked', None),
+    ("Valid Links:", 'valid_links', FILL_PASS),
+    ("Broken Links:", 'broken_links', FILL_FAIL),
+)
+
+
+def _classify_link(status_code: int):
+    """Return (link_status, fill) for a sub-menu link status code"""
+    status = _LINK_STATUS_TABLE.get(status_code)
+    if status:
+        return status
+    return ('Broken', FILL_FAIL) if status_code > 0 else ('Not Checked', FILL_FAIL)
+
+
+def _classify_error(status_code: int):
+    """Return (error_type, fill) for a broken link status code"""
+    error = _ERROR_TABLE.get(status_code)
+    if error:
+        return error
+    return ('500 Server Error', FILL_FAIL) if status_code >= 500 else ('Other Error', FILL_WARN)
 
 
 class NavigationReportGenerator(BaseReportGenerator):
     """Generate Excel report for Navigation/Header component"""
     
+    def __init__(self, output_dir: str = "reports", fast_mode: bool = False):
+        self.output_dir = output_dir
+        # Fast mode always uses the xlsxwriter (constant_memory) backend when it is installed
+        self.fast_mode = fast_mode
+        if not os.path.exists(output_dir):
+            os.makedirs(output_dir)
+    
+    def generate_excel_report(self, nav_results: Dict) -> str:
+        """Generate Excel report with the navigation sheet"""
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        filename = f"{self.output_dir}/navigation_report_{timestamp}.xlsx"
+        
+        link_rows = sum(len(items) for items in nav_results.get('sub_menus', {}).values())
+        link_rows += len(nav_results.get('link_validation', {}).get('broken_details', []))
+        
+        wb = None
+        if self.fast_mode or link_rows >= XLSXWRITER_ROW_THRESHOLD:
+            from xlsxwriter_backend import XlsxWriterWorkbook, xlsxwriter_available
+            if xlsxwriter_available():
+                wb = XlsxWriterWorkbook(filename)
+        if wb is None:
+            # Write-only mode streams rows to disk instead of keeping every cell in memory
+            wb = Workbook(write_only=True)
+        
+        self.create_sheet(wb, nav_results)
+        
+        wb.save(filename)
+        print(f"\n[EXCEL] Report generated: {filename}")
+        return filename
+    
     def create_sheet(self, wb: Workbook, nav_results: Dict):
-        """Create detailed navigation sheet"""
+        """Create detailed navigation sheet (works with write-only workbooks)"""
         ws = wb.create_sheet("Navigation")
         
+        # Set column widths in one pass (before the first row in a write-only sheet)
+        for index, width in enumerate(_COLUMN_WIDTHS, 1):
+            ws.column_dimensions[get_column_letter(index)].width = width
+        w = SheetWriter(ws)
+        # Bound once - these are called for every cell of every row below
+        append, cell = w.append, w.cell
+        
+        def header_row(headers):
+            append([cell(header, font=_HEADER_FONT, fill=_HEADER_FILL) for header in headers])
+        
+        def title_row(text, last_column, font=_SECTION_FONT):
+            append([cell(text, font=font)])
+            w.merge(last_column)
+        
+        def filled_row(values, fill):
+            # Every cell in a status-coded row shares the same fill instance
+            append([cell(value, fill=fill) for value in values])
+        
+        def count_row(label, value, fill=None):
+            append([cell(label, font=_BOLD), cell(value, fill=fill if fill and value > 0 else None)])
+        
         # Summary Section
-        ws['A1'] = "NAVIGATION MENU SUMMARY"
-        ws['A1'].font = Font(bold=True, size=14, color="366092")
-        ws.merge_cells('A1:D1')
-        
-        summary = nav_results.get('summary', {})
-        row = 3
-        
-        ws.cell(row=row, column=1, value="Total Main Menu Items:").font = Font(bold=True)
-        ws.cell(row=row, column=2, value=summary.get('total_main_menu_items', 0))
-        row += 1
-        
-        ws.cell(row=row, column=1, value="Visible Main Menu Items:").font = Font(bold=True)
-        ws.cell(row=row, column=2, value=summary.get('visible_main_menu_items', 0))
-        row += 1
-        
-        ws.cell(row=row, column=1, value="Total Sub-Menu Items:").font = Font(bold=True)
-        ws.cell(row=row, column=2, value=summary.get('total_sub_menu_items', 0))
-        row += 1
-        
-        ws.cell(row=row, column=1, value="Total Links Checked:").font = Font(bold=True)
-        ws.cell(row=row, column=2, value=summary.get('total_links_checked', 0))
-        row += 1
-        
-        ws.cell(row=row, column=1, value="Valid Links:").font = Font(bold=True)
-        valid_links = summary.get('valid_links', 0)
-        ws.cell(row=row, column=2, value=valid_links)
-        if valid_links > 0:
-            ws.cell(row=row, column=2).fill = PatternFill(start_color="D4EDDA", end_color="D4EDDA", fill_type="solid")
-        row += 1
-        
-        ws.cell(row=row, column=1, value="Broken Links:").font = Font(bold=True)
-        broken_links = summary.get('broken_links', 0)
-        ws.cell(row=row, column=2, value=broken_links)
-        if broken_links > 0:
-            ws.cell(row=row, column=2).fill = PatternFill(start_color="F8D7DA", end_color="F8D7DA", fill_type="solid")
-        row += 2
+        title_row("NAVIGATION MENU SUMMARY", 'D', font=_TITLE_FONT)
+        w.skip()
         
-        # Main Menu Details Table
-        ws.cell(row=row, column=1, value="MAIN MENU DETAILS").font = Font(bold=True, size=12)
-        ws.merge_cells(f'A{row}:F{row}')
-        row += 1
+        # The link counts are shared with link_validation - write them once, preferring the summary values
+        link_validation = nav_results.get('link_validation', {})
+        totals = {'total_links_checked': link_validation.get('total_checked', 0), **link_validation, **nav_results.get('summary', {})}
+        for label, key, fill in _SUMMARY_ROWS:
+            count_row(label, totals.get(key, 0), fill)
+        
+        # Not Checked Links (timeouts/errors)
+        not_checked = totals.get('not_checked_links', 0)
+        if not_checked > 0:
+            count_row("Not Checked (Timeouts/Errors):", not_checked, FILL_WARN)
+        w.skip()
         
-        headers = ["Menu Name", "Display Text", "Is Visible", "Has Mega Menu", "Sub-Menu Count", "Status"]
-        for col, header in enumerate(headers, 1):
-            cell = ws.cell(row=row, column=col, value=header)
-            cell.font = Font(bold=True, color="FFFFFF")
-            cell.fill = PatternFill(start_color="366092", end_color="366092", fill_type="solid")
-        row += 1
+        # Main Menu Details Table
+        title_row("MAIN MENU DETAILS", 'F')
+        header_row(_MAIN_MENU_HEADERS)
         
         # Get sub-menu counts
         sub_menus = nav_results.get('sub_menus', {})
+        sub_counts = {name: len(items) for name, items in sub_menus.items()}
         main_menu_items = nav_results.get('main_menu_items', [])
         
         for menu in main_menu_items:
             menu_name = menu.get('name', '')
-            sub_count = len(sub_menus.get(menu_name, []))
-            
-            ws.cell(row=row, column=1, value=menu_name)
-            ws.cell(row=row, column=2, value=menu.get('text', ''))
-            ws.cell(row=row, column=3, value='Yes' if menu.get('is_visible', False) else 'No')
-            ws.cell(row=row, column=4, value='Yes' if menu.get('has_mega_menu', False) else 'No')
-            ws.cell(row=row, column=5, value=sub_count)
-            ws.cell(row=row, column=6, value=menu.get('status', ''))
-            
+            status = menu.get('status', '')
             # Color coding
-            if menu.get('status') == 'PASS':
-                fill = PatternFill(start_color="D4EDDA", end_color="D4EDDA", fill_type="solid")
-            else:
-                fill = PatternFill(start_color="F8D7DA", end_color="F8D7DA", fill_type="solid")
-            
-            for col in range(1, 7):
-                ws.cell(row=row, column=col).fill = fill
+            fill = FILL_PASS if status == 'PASS' else FILL_FAIL
+            values = [
+                menu_name,
+                menu.get('text', ''),
+                _YESNO[bool(menu.get('is_visible', False))],
+                _YESNO[bool(menu.get('has_mega_menu', False))],
+                sub_counts.get(menu_name, 0),
+                status,
+            ]
+            filled_row(values, fill)
+        
+        w.skip()
+        
+        # Sub-Menu Details Table (skipped entirely when no sub-menu links were collected)
+        # Flatten the per-menu lists once so the table is written by a single loop
+        sub_menu_links = [(menu_name, item) for menu_name, sub_items in sub_menus.items() for item in sub_items]
+        if sub_menu_links:
+            title_row("SUB-MENU DETAILS", 'F')
+            header_row(_SUB_MENU_HEADERS)
             
-            row += 1
-        
-        row += 1
-        
-        # Sub-Menu Details Table
-        ws.cell(row=row, column=1, value="SUB-MENU DETAILS").font = Font(bold=True, size=12)
-        ws.merge_cells(f'A{row}:F{row}')
-        row += 1
-        
-        headers = ["Main Menu", "Link Text", "URL", "Status Code", "Is Visible", "Link Status"]
-        for col, header in enumerate(headers, 1):
-            cell = ws.cell(row=row, column=col, value=header)
-            cell.font = Font(bold=True, color="FFFFFF")
-            cell.fill = PatternFill(start_color="366092", end_color="366092", fill_type="solid")
-        row += 1
-        
-        for menu_name, sub_items in sub_menus.items():
-            for item in sub_items:
-                ws.cell(row=row, column=1, value=menu_name)
-                ws.cell(row=row, column=2, value=item.get('text', ''))
-                ws.cell(row=row, column=3, value=item.get('href', ''))
-                
+            for menu_name, item in sub_menu_links:
                 status_code = item.get('status_code', 0)
-                status_cell = ws.cell(row=row, column=4, value=status_code)
-                status_cell.number_format = '0'
-                
-                ws.cell(row=row, column=5, value='Yes' if item.get('is_visible', False) else 'No')
-                
-                link_status = 'Working' if status_code == 200 else 'Broken' if status_code > 0 else 'Not Checked'
-                ws.cell(row=row, column=6, value=link_status)
-                
-                # Color coding
-                if status_code == 200:
-                    fill_color = "D4EDDA"  # Green
-                elif status_code == 0:
-                    fill_color = "FFF3CD"  # Yellow
-                else:
-                    fill_color = "F8D7DA"  # Red
-                
-                for col in range(1, 7):
-                    ws.cell(row=row, column=col).fill = PatternFill(start_color=fill_color, end_color=fill_color, fill_type="solid")
+                link_status, fill = _classify_link(status_code)
                 
-                row += 1
-        
-        row += 1
-        
-        # Navigation Links Summary
-        link_validation = nav_results.get('link_validation', {})
-        if link_validation:
-            ws.cell(row=row, column=1, value="NAVIGATION LINKS SUMMARY").font = Font(bold=True, size=12)
-            ws.merge_cells(f'A{row}:D{row}')
-            row += 1
-            
-            ws.cell(row=row, column=1, value="Total Links Checked:").font = Font(bold=True)
-            ws.cell(row=row, column=2, value=link_validation.get('total_checked', 0))
-            row += 1
-            
-            ws.cell(row=row, column=1, value="Valid Links:").font = Font(bold=True)
-            valid = link_validation.get('valid_links', 0)
-            ws.cell(row=row, column=2, value=valid)
-            if valid > 0:
-                ws.cell(row=row, column=2).fill = PatternFill(start_color="D4EDDA", end_color="D4EDDA", fill_type="solid")
-            row += 1
-            
-            ws.cell(row=row, column=1, value="Broken Links (4xx/5xx):").font = Font(bold=True)
-            broken = link_validation.get('broken_links', 0)
-            ws.cell(row=row, column=2, value=broken)
-            if broken > 0:
-                ws.cell(row=row, column=2).fill = PatternFill(start_color="F8D7DA", end_color="F8D7DA", fill_type="solid")
-            row += 1
+                append([
+                    cell(menu_name, fill=fill),
+                    cell(item.get('text', ''), fill=fill),
+                    cell(item.get('href', ''), fill=fill),
+                    cell(status_code, fill=fill, number_format='0'),
+                    cell(_YESNO[bool(item.get('is_visible', False))], fill=fill),
+                    cell(link_status, fill=fill),
+                ])
             
-            # Not Checked Links (timeouts/errors)
-            not_checked = link_validation.get('not_checked_links', 0)
-            if not_checked > 0:
-                ws.cell(row=row, column=1, value="Not Checked (Timeouts/Errors):").font = Font(bold=True)
-                ws.cell(row=row, column=2, value=not_checked)
-                ws.cell(row=row, column=2).fill = PatternFill(start_color="FFF3CD", end_color="FFF3CD", fill_type="solid")
-                row += 1
-            
-            row += 1
+            w.skip()
+        
+        # Broken Links Details Table (only actual broken links)
+        broken_details = link_validation.get('broken_details', [])
+        if broken_details:
+            title_row("BROKEN LINKS DETAILS", 'E')
+            header_row(_BROKEN_LINK_HEADERS)
             
-            # Broken Links Details Table (only actual broken links)
-            broken_details = link_validation.get('broken_details', [])
-            if broken_details:
-                ws.cell(row=row, column=1, value="BROKEN LINKS DETAILS").font = Font(bold=True, size=12)
-                ws.merge_cells(f'A{row}:E{row}')
-                row += 1
-                
-                headers = ["Link Text", "URL", "Status Code", "Is Visible", "Error Type"]
-                for col, header in enumerate(headers, 1):
-                    cell = ws.cell(row=row, column=col, value=header)
-                    cell.font = Font(bold=True, color="FFFFFF")
-                    cell.fill = PatternFill(start_color="366092", end_color="366092", fill_type="solid")
-                row += 1
+            for link in broken_details:
+                status_code = link.get('status_code', 0)
+                error_type, fill = _classify_error(status_code)
+                # Most values are already short - only slice (and copy) the long ones
+                text = link.get('text') or ''
+                if len(text) > 50:
+                    text = text[:50]
+                href = link.get('href') or ''
+                if len(href) > 80:
+                    href = href[:80]
                 
-                for link in broken_details:
-                    ws.cell(row=row, column=1, value=link.get('text', '')[:50])
-                    ws.cell(row=row, column=2, value=link.get('href', '')[:80])
-                    status_code = link.get('status_code', 0)
-                    ws.cell(row=row, column=3, value=status_code)
-                    ws.cell(row=row, column=4, value='Yes' if link.get('is_visible', False) else 'No')
-                    ws.cell(row=row, column=5, value='404 Not Found' if status_code == 404 else '403 Forbidden' if status_code == 403 else '500 Server Error' if status_code >= 500 else 'Other Error')
-                    
-                    # Color coding
-                    if status_code == 404:
-                        fill_color = "FFE4E1"  # Light red
-                    elif status_code == 403:
-                        fill_color = "FFB6C1"  # Pink
-                    elif status_code >= 500:
-                        fill_color = "F8D7DA"  # Red
-                    else:
-                        fill_color = "FFF3CD"  # Yellow
-                    
-                    for col in range(1, 6):
-                        ws.cell(row=row, column=col).fill = PatternFill(start_color=fill_color, end_color=fill_color, fill_type="solid")
-                    
-                    row += 1
-            row += 1
+                values = [
+                    text,
+                    href,
+                    status_code,
+                    _YESNO[bool(link.get('is_visible', False))],
+                    error_type,
+                ]
+                filled_row(values, fill)
+            w.skip()
         
         # Font Styles Section
         font_styles = nav_results.get('font_styles', {})
         if font_styles.get('main_menu') or font_styles.get('sub_menu'):
-            row += 1
-            ws.cell(row=row, column=1, value="FONT STYLES").font = Font(bold=True, size=12)
-            ws.merge_cells(f'A{row}:D{row}')
-            row += 1
-            
-            headers = ["Element Type", "Name", "Font Size", "Font Color"]
-            for col, header in enumerate(headers, 1):
-                cell = ws.cell(row=row, column=col, value=header)
-                cell.font = Font(bold=True, color="FFFFFF")
-                cell.fill = PatternFill(start_color="366092", end_color="366092", fill_type="solid")
-            row += 1
+            w.skip()
+            title_row("FONT STYLES", 'D')
+            header_row(_FONT_STYLE_HEADERS)
             
             # Main menu font styles
             for item in font_styles.get('main_menu', []):
-                ws.cell(row=row, column=1, value="Main Menu")
-                ws.cell(row=row, column=2, value=item.get('name', ''))
-                ws.cell(row=row, column=3, value=self._format_font_size(item.get('font_size', '')))
-                ws.cell(row=row, column=4, value=item.get('font_color', ''))
-                row += 1
+                append(["Main Menu", item.get('name', ''), self._format_font_size(item.get('font_size', '')), item.get('font_color', '')])
             
             # Sub menu font styles
             for item in font_styles.get('sub_menu', []):
-                ws.cell(row=row, column=1, value="Sub Menu")
-                ws.cell(row=row, column=2, value=item.get('type', ''))
-                ws.cell(row=row, column=3, value=self._format_font_size(item.get('font_size', '')))
-                ws.cell(row=row, column=4, value=item.get('font_color', ''))
-                row += 1
-        
-        # Set column widths
-        ws.column_dimensions['A'].width = 20
-        ws.column_dimensions['B'].width = 40
-        ws.column_dimensions['C'].width = 20
-        ws.column_dimensions['D'].width = 30
-        ws.column_dimensions['E'].width = 15
-        ws.column_dimensions['F'].width = 15
-
+                append(["Sub Menu", item.get('type', ''), self._format_font_size(item.get('font_size', '')), item.get('font_color', '')])
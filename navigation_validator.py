@@ -1,9 +1,67 @@
 """
 Navigation Menu Validator for Solidigm Website
 """
+import re
 import time
-from typing import Dict, List
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import lru_cache
+from typing import Dict, List, Tuple
+from urllib.parse import urljoin, urlsplit
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from openpyxl.styles import Font, PatternFill
 from playwright.sync_api import Page
+from link_validator import request_identity
+
+# Concurrent HTTP status checks for navigation links
+LINK_CHECK_WORKERS = 8
+
+# One keep-alive connection pool for every link check, so the TLS handshake is paid once per host.
+# Gateway errors are retried once; raise_on_status=False still reports the final status code.
+_SESSION = requests.Session()
+_ADAPTER = HTTPAdapter(pool_connections=20, pool_maxsize=20,
+                       max_retries=Retry(total=1, backoff_factor=0.2, status_forcelist=[502, 503, 504], raise_on_status=False))
+_SESSION.mount('https://', _ADAPTER)
+_SESSION.mount('http://', _ADAPTER)
+_GET_FALLBACK_HEADERS = {'Accept-Encoding': 'identity', 'Range': 'bytes=0-0'}
+
+# Navigation hrefs that are not HTTP-checked
+_SKIP_RE = re.compile(r'^(mailto:|tel:|javascript:|#)', re.IGNORECASE)
+
+# Report styles shared by every row
+GREEN = PatternFill(start_color="D4EDDA", end_color="D4EDDA", fill_type="solid")
+RED = PatternFill(start_color="F8D7DA", end_color="F8D7DA", fill_type="solid")
+YELLOW = PatternFill(start_color="FFF3CD", end_color="FFF3CD", fill_type="solid")
+LIGHT_RED = PatternFill(start_color="FFE4E1", end_color="FFE4E1", fill_type="solid")
+LIGHT_BLUE = PatternFill(start_color="D1ECF1", end_color="D1ECF1", fill_type="solid")
+HEADER_FILL = PatternFill(start_color="366092", end_color="366092", fill_type="solid")
+HEADER_FONT = Font(bold=True, color="FFFFFF")
+TITLE_FONT = Font(bold=True, size=16, color="366092")
+SECTION_FONT = Font(bold=True, size=12)
+BOLD = Font(bold=True)
+
+
+@lru_cache(maxsize=None)
+def _status_to_fill(status_code: int) -> PatternFill:
+    """Return the broken link fill for a status code: green for working links, light red for
+    client errors, red for server errors and yellow for anything else"""
+    if status_code == 200:
+        return GREEN
+    if 400 <= status_code < 500:
+        return LIGHT_RED
+    if status_code >= 500:
+        return RED
+    return YELLOW
+
+
+def _url_cache_key(url: str) -> str:
+    """Normalize a URL for the status cache: no fragment, lowercase host, no trailing slash"""
+    parts = urlsplit(url)
+    key = f"{parts.scheme.lower()}://{parts.netloc.lower()}{parts.path.rstrip('/')}"
+    return f"{key}?{parts.query}" if parts.query else key
+
+
 class NavigationValidator:
     def __init__(self, page: Page, base_url: str):
         self.page = page
@@ -15,18 +73,30 @@ class NavigationValidator:
             'broken_links': [],
             'menu_interactions': []
         }
+        # Browser user agent and cookies for plain HTTP link checks, read on first use
+        self._identity = None
+        # Future of (status_code, error) per normalized URL, shared by the sub-menu and navigation link checks
+        self._url_status_cache = {}
+        # Link check pool, created on first use and shut down when validate_navigation_menu finishes
+        self._link_pool = None
+        # Root locators reused by every check (locators are lazy, so these stay valid across re-renders)
+        self._menu_items = page.locator('li.cmp-navigation__menu-items')
+        self._nav = page.locator('nav')
+        self._lang_items = page.locator('.cmp-navigation__language-items')
     
     def validate_navigation_menu(self) -> Dict:
         """Validate the complete navigation menu"""
-        print("\n" + "="*80)
-        print("NAVIGATION MENU VALIDATION")
-        print("="*80)
+        print(f"\n{'='*80}\nNAVIGATION MENU VALIDATION\n{'='*80}")
         
         try:
             # Navigate to the page
             print(f"\n[INFO] Navigating to {self.base_url}")
             self.page.goto(self.base_url, timeout=60000, wait_until='domcontentloaded')
-            self.page.wait_for_timeout(3000)
+            # Wait for the menu to render instead of sleeping a fixed 3s
+            try:
+                self._menu_items.first.wait_for(state='visible', timeout=5000)
+            except Exception:
+                print("[WARNING] Navigation menu not visible within 5s, continuing")
             
             # Get page title to verify load
             title = self.page.title()
@@ -38,15 +108,19 @@ class NavigationValidator:
             # 1. Validate Main Menu Items
             main_menu_items = self._validate_main_menu_items()
             
+            # Start the navigation link checks now so the HTTP requests run while the sub-menus are hovered
+            nav_links = self._collect_navigation_links()
+            
             # 2. Validate Each Main Menu's Sub-Menus
-            sub_menu_results = {}
+            # Every menu is opened first so all sub-menu links are checked as one batch
+            sub_menu_links = {}
             for menu_item in main_menu_items:
                 print(f"\n[INFO] Checking sub-menus for: {menu_item['name']}")
-                sub_results = self._validate_sub_menu(menu_item['name'])
-                sub_menu_results[menu_item['name']] = sub_results
+                sub_menu_links[menu_item['name']] = self._collect_sub_menu_links(menu_item['name'], menu_item.get('index'))
+            sub_menu_results = {name: self._sub_menu_results(name, links) for name, links in sub_menu_links.items()}
             
             # 3. Validate Navigation Links
-            link_results = self._validate_all_navigation_links()
+            link_results = self._validate_all_navigation_links(nav_links)
             
             # 4. Validate Language Switcher
             language_results = self._validate_language_switcher()
@@ -80,6 +154,10 @@ class NavigationValidator:
                 'timestamp': time.strftime("%Y-%m-%d %H:%M:%S"),
                 'error': str(e)
             }
+        finally:
+            if self._link_pool is not None:
+                self._link_pool.shutdown(wait=False, cancel_futures=True)
+                self._link_pool = None
     
     def _validate_main_menu_items(self) -> List[Dict]:
         """Validate main menu items presence and visibility"""
@@ -90,191 +168,249 @@ class NavigationValidator:
         
         main_menus = []
         
+        # Read text, visibility and mega menu presence of every menu item in one round-trip
+        try:
+            page_items = self.page.evaluate("""
+                () => Array.from(document.querySelectorAll('li.cmp-navigation__menu-items')).map((el, index) => {
+                    const textEl = el.querySelector('.cmp-navigation__menu-text');
+                    return {
+                        index,
+                        text: textEl ? textEl.textContent || '' : '',
+                        visible: !!(el.offsetWidth || el.offsetHeight || el.getClientRects().length)
+                            && window.getComputedStyle(el).visibility !== 'hidden',
+                        hasMegaMenu: !!el.querySelector('.cmp-navigation__mega-menu')
+                    };
+                })
+            """)
+        except Exception as e:
+            print(f"   [ERROR] Could not read main menu items: {str(e)}")
+            return [{'name': menu_name, 'error': str(e), 'status': 'ERROR'} for menu_name in expected_menus]
+        
+        # Match the page items against the expected menus in one pass (first matching item wins);
+        # each text is lowercased once and an exact label is a single dict lookup
+        expected = {menu_name.lower(): menu_name for menu_name in expected_menus}
+        found = {}
+        for item in page_items:
+            text = item['text'].lower()
+            menu_name = expected.get(text.strip())
+            if menu_name:
+                found.setdefault(menu_name, item)
+                continue
+            for key, menu_name in expected.items():
+                if key in text:
+                    found.setdefault(menu_name, item)
+        
+        # One line per menu, written with a single print after the loop
+        lines = []
         for menu_name in expected_menus:
-            try:
-                # Find the menu item
-                menu_selector = f'li.cmp-navigation__menu-items'
-                all_menu_items = self.page.locator(menu_selector)
-                count = all_menu_items.count()
-                
-                menu_found = False
-                menu_item = {}
+            item = found.get(menu_name)
+            
+            if item:
+                is_visible = item['visible']
+                has_mega_menu = item['hasMegaMenu']
                 
-                for i in range(count):
-                    item = all_menu_items.nth(i)
-                    text = item.locator('.cmp-navigation__menu-text').text_content() or ""
-                    
-                    if menu_name.lower() in text.lower():
-                        is_visible = item.is_visible()
-                        link = item.locator('.cmp-navigation__menu-links')
-                        has_mega_menu = item.locator('.cmp-navigation__mega-menu').count() > 0
-                        
-                        menu_item = {
-                            'name': menu_name,
-                            'text': text.strip(),
-                            'is_visible': is_visible,
-                            'has_mega_menu': has_mega_menu,
-                            'status': 'PASS' if is_visible else 'FAIL'
-                        }
-                        
-                        main_menus.append(menu_item)
-                        
-                        status_icon = "[OK]" if is_visible else "[FAIL]"
-                        print(f"   {status_icon} {menu_name}: Visible={is_visible}, HasMegaMenu={has_mega_menu}")
-                        menu_found = True
-                        break
+                main_menus.append({
+                    'name': menu_name,
+                    'text': item['text'].strip(),
+                    'is_visible': is_visible,
+                    'has_mega_menu': has_mega_menu,
+                    'status': 'PASS' if is_visible else 'FAIL',
+                    # Position among li.cmp-navigation__menu-items, so the sub-menu check can go straight to it
+                    'index': item['index']
+                })
                 
-                if not menu_found:
-                    menu_item = {
-                        'name': menu_name,
-                        'text': '',
-                        'is_visible': False,
-                        'has_mega_menu': False,
-                        'status': 'FAIL'
-                    }
-                    main_menus.append(menu_item)
-                    print(f"   [FAIL] {menu_name}: Not found")
-                    
-            except Exception as e:
-                print(f"   [ERROR] {menu_name}: {str(e)}")
+                status_icon = "[OK]" if is_visible else "[FAIL]"
+                lines.append(f"   {status_icon} {menu_name}: Visible={is_visible}, HasMegaMenu={has_mega_menu}")
+            else:
                 main_menus.append({
                     'name': menu_name,
-                    'error': str(e),
-                    'status': 'ERROR'
+                    'text': '',
+                    'is_visible': False,
+                    'has_mega_menu': False,
+                    'status': 'FAIL'
                 })
+                lines.append(f"   [FAIL] {menu_name}: Not found")
+        print("\n".join(lines))
         
         return main_menus
     
-    def _validate_sub_menu(self, menu_name: str) -> List[Dict]:
-        """Validate sub-menu items for a given main menu"""
-        sub_menu_items = []
+    def _validate_sub_menu(self, menu_name: str, menu_index: int = None) -> List[Dict]:
+        """Validate sub-menu items for a given main menu (menu_index comes from _validate_main_menu_items)"""
+        return self._sub_menu_results(menu_name, self._collect_sub_menu_links(menu_name, menu_index))
+    
+    def _collect_sub_menu_links(self, menu_name: str, menu_index: int = None) -> List[Tuple]:
+        """Open a main menu, read its sub-menu links and start their status checks in the background"""
+        menu_links = []
+        
+        if menu_index is None:
+            # Menu was not found on the page - nothing to hover
+            return menu_links
         
         try:
             # Hover over the main menu to trigger sub-menu
-            menu_selector = f'li.cmp-navigation__menu-items'
-            all_menu_items = self.page.locator(menu_selector)
+            item = self._menu_items.nth(menu_index)
+            item.hover()
+            
+            # Get all links in the mega menu, once it has opened
+            mega_menu = item.locator('.cmp-navigation__mega-menu')
+            if mega_menu.count() > 0:
+                try:
+                    mega_menu.first.wait_for(state='visible', timeout=2000)
+                except Exception:
+                    print(f"      [WARNING] Mega menu for {menu_name} did not open within 2s")
+            links = mega_menu.locator('.cmp-navigation__mega-menu-links')
+            link_count = links.count()
+            
+            print(f"      Found {link_count} sub-menu items")
+            
+            # Text, href and visibility of the first 20 links in one round-trip (one layout pass)
+            records = links.evaluate_all("""
+                (els) => els.slice(0, 20).map((e) => ({
+                    text: e.textContent || '',
+                    href: e.getAttribute('href') || '',
+                    visible: !!(e.offsetWidth || e.offsetHeight || e.getClientRects().length)
+                        && window.getComputedStyle(e).visibility !== 'hidden'
+                }))
+            """)
+            
+            for record in records:
+                link_text, href, is_visible = record['text'], record['href'], record['visible']
+                full_url = ''
+                if href and not href.startswith('javascript:'):
+                    full_url = self.base_url.rstrip('/') + href if href.startswith('/') else href
+                menu_links.append((link_text, href, is_visible, full_url))
+            
+            self._submit_urls([full_url for *_, full_url in menu_links if full_url])
+            
+        except Exception as e:
+            print(f"      [ERROR] Failed to get sub-menu for {menu_name}: {str(e)}")
+        
+        return menu_links
+    
+    def _sub_menu_results(self, menu_name: str, menu_links: List[Tuple]) -> List[Dict]:
+        """Build the sub-menu items once the status checks started by _collect_sub_menu_links finish"""
+        sub_menu_items = []
+        
+        try:
+            statuses = self._check_urls([full_url for *_, full_url in menu_links if full_url])
             
-            for i in range(all_menu_items.count()):
-                item = all_menu_items.nth(i)
-                text = item.locator('.cmp-navigation__menu-text').text_content() or ""
+            for link_text, href, is_visible, full_url in menu_links:
+                status_code = statuses[full_url][0] if full_url else 0
                 
-                if menu_name.lower() in text.lower():
-                    # Try to hover to open mega menu
-                    item.hover()
-                    self.page.wait_for_timeout(1000)
-                    
-                    # Get all links in the mega menu
-                    mega_menu = item.locator('.cmp-navigation__mega-menu')
-                    links = mega_menu.locator('.cmp-navigation__mega-menu-links')
-                    link_count = links.count()
-                    
-                    print(f"      Found {link_count} sub-menu items")
-                    
-                    for j in range(min(link_count, 20)):  # Limit to 20 items
-                        link = links.nth(j)
-                        link_text = link.text_content() or ""
-                        href = link.get_attribute('href') or ""
-                        is_visible = link.is_visible() if link_count > 0 else False
-                        
-                        # Get status code by making a request
-                        status_code = 0
-                        try:
-                            if href and not href.startswith('javascript:'):
-                                full_url = self.base_url.rstrip('/') + href if href.startswith('/') else href
-                                response = self.page.request.get(full_url, timeout=5000)
-                                status_code = response.status
-                        except:
-                            pass
-                        
-                        sub_menu_items.append({
-                            'text': link_text.strip(),
-                            'href': href,
-                            'status_code': status_code,
-                            'is_visible': is_visible,
-                            'status': 'PASS' if status_code == 200 and href else 'FAIL'
-                        })
-                    
-                    break
+                sub_menu_items.append({
+                    'text': link_text.strip(),
+                    'href': href,
+                    'status_code': status_code,
+                    'is_visible': is_visible,
+                    'status': 'PASS' if status_code == 200 and href else 'FAIL'
+                })
             
         except Exception as e:
-            print(f"      [ERROR] Failed to get sub-menu for {menu_name}: {str(e)}")
+            print(f"      [ERROR] Failed to check sub-menu links for {menu_name}: {str(e)}")
         
         return sub_menu_items
     
-    def _validate_all_navigation_links(self) -> Dict:
-        """Validate all navigation links"""
+    def _collect_navigation_links(self) -> List[Tuple]:
+        """Read the navigation links and start their status checks in the background"""
+        candidates = []
+        
+        try:
+            # Read href, text, visibility and main menu membership of every navigation link in one round-trip
+            links = self._nav.locator('a[href]').evaluate_all("""
+                (els) => els.map((e) => ({
+                    href: e.getAttribute('href') || '',
+                    text: e.textContent || '',
+                    visible: !!(e.offsetWidth || e.offsetHeight || e.getClientRects().length)
+                        && window.getComputedStyle(e).visibility !== 'hidden',
+                    inMenu: !!e.closest('.cmp-navigation__menu-items')
+                }))
+            """)
+            
+            print(f"\n[LINKS] Found {len(links)} navigation links")
+            
+            # Keep the first occurrence of each checkable href (skipping empty, mailto, tel, javascript and #... links)
+            seen = set()
+            records = []
+            for link in links:
+                href = link['href']
+                if href and href not in seen and not _SKIP_RE.match(href):
+                    seen.add(href)
+                    records.append(link)
+            
+            # Main menu links first, then the shallowest paths - only the first 50 are checked
+            records.sort(key=lambda link: (not link['inMenu'], urlsplit(link['href']).path.count('/')))
+            
+            # page.url is a round-trip to the browser - read it once for every relative link
+            page_url = self.page.url
+            for link in records[:50]:
+                href = link['href']
+                
+                # Convert relative URLs to absolute
+                absolute_href = href if href.startswith(('http://', 'https://')) else urljoin(page_url, href)
+                candidates.append((href, link['text'], link['visible'], absolute_href))
+            
+            self._submit_urls([absolute_href for *_, absolute_href in candidates])
+        
+        except Exception as e:
+            print(f"   [ERROR] Failed to collect navigation links: {str(e)}")
+        
+        return candidates
+    
+    def _validate_all_navigation_links(self, candidates: List[Tuple] = None) -> Dict:
+        """Validate all navigation links (candidates come from _collect_navigation_links)"""
         print("\n[LINKS] Validating navigation links...")
         
         all_links = []
         broken_links = []
         valid_links = []
         
+        if candidates is None:
+            candidates = self._collect_navigation_links()
+        
         try:
-            # Get all links in navigation
-            nav = self.page.locator('nav')
-            links = nav.locator('a[href]')
-            count = links.count()
-            
-            print(f"   Found {count} navigation links")
+            # Collect the statuses (most of them finished while the sub-menus were checked)
+            statuses = self._check_urls([absolute_href for *_, absolute_href in candidates])
             
             checked = 0
-            for i in range(min(count, 50)):  # Limit to 50 links
-                link = links.nth(i)
-                href = link.get_attribute('href') or ""
-                text = link.text_content() or ""
-                is_visible = link.is_visible()
+            for href, text, is_visible, absolute_href in candidates:
+                status_code, error = statuses[absolute_href]
+                if error:
+                    # Timeout or other error - don't count as broken, just as not checked
+                    link_info = {
+                        'text': text.strip()[:50],
+                        'href': href,
+                        'status_code': 0,
+                        'is_valid': False,
+                        'is_broken': False,  # Not broken, just not checked
+                        'is_visible': is_visible,
+                        'error': error
+                    }
+                    all_links.append(link_info)
+                    # Don't add to broken_links - these are "not checked", not broken
+                    continue
                 
-                if href:
-                    # Skip javascript and # links
-                    if href.startswith('javascript:') or href == '#':
-                        continue
-                    
-                    # Validate link
-                    try:
-                        # Convert relative URLs to absolute
-                        from urllib.parse import urljoin
-                        absolute_href = href if href.startswith('http') else urljoin(self.page.url, href)
-                        
-                        response = self.page.request.get(absolute_href, timeout=5000)
-                        status_code = response.status
-                        is_valid = 200 <= status_code < 400
-                        is_broken = status_code >= 400  # Only 4xx and 5xx are truly broken
-                        
-                        link_info = {
-                            'text': text.strip()[:50],
-                            'href': href,
-                            'status_code': status_code,
-                            'is_valid': is_valid,
-                            'is_broken': is_broken,
-                            'is_visible': is_visible
-                        }
-                        
-                        all_links.append(link_info)
-                        
-                        if is_valid:
-                            valid_links.append(link_info)
-                        elif is_broken:  # Only add to broken_links if status_code >= 400
-                            broken_links.append(link_info)
-                        # Links with status_code 0 (timeout/error) are not added to broken_links
-                        
-                        checked += 1
-                    except Exception as e:
-                        # Timeout or other error - don't count as broken, just as not checked
-                        link_info = {
-                            'text': text.strip()[:50],
-                            'href': href,
-                            'status_code': 0,
-                            'is_valid': False,
-                            'is_broken': False,  # Not broken, just not checked
-                            'is_visible': is_visible,
-                            'error': str(e)[:100]
-                        }
-                        all_links.append(link_info)
-                        # Don't add to broken_links - these are "not checked", not broken
-            
-            print(f"   Checked: {checked} links")
-            print(f"   Valid: {len(valid_links)}")
-            print(f"   Broken: {len(broken_links)}")
+                is_valid = 200 <= status_code < 400
+                is_broken = status_code >= 400  # Only 4xx and 5xx are truly broken
+                
+                link_info = {
+                    'text': text.strip()[:50],
+                    'href': href,
+                    'status_code': status_code,
+                    'is_valid': is_valid,
+                    'is_broken': is_broken,
+                    'is_visible': is_visible
+                }
+                
+                all_links.append(link_info)
+                
+                if is_valid:
+                    valid_links.append(link_info)
+                elif is_broken:  # Only add to broken_links if status_code >= 400
+                    broken_links.append(link_info)
+                
+                checked += 1
+            
+            print(f"   Checked: {checked} links\n   Valid: {len(valid_links)}\n   Broken: {len(broken_links)}")
             
         except Exception as e:
             print(f"   [ERROR] Link validation failed: {str(e)}")
@@ -283,9 +419,8 @@ class NavigationValidator:
         # Note: broken_links already only contains links with status_code >= 400
         truly_broken = broken_links  # No need to filter again, already filtered at line 255-256
         not_checked = [link for link in all_links if link.get('status_code', 0) == 0]
-        
-        # Debug: Print counts for verification
-        print(f"   [DEBUG] Total links: {len(all_links)}, Valid: {len(valid_links)}, Broken: {len(truly_broken)}, Not Checked: {len(not_checked)}")
+        if not_checked:
+            print(f"   Not Checked: {len(not_checked)}")
         
         return {
             'total_checked': len(all_links),
@@ -296,6 +431,48 @@ class NavigationValidator:
             'not_checked_details': not_checked[:20]  # Show first 20 not checked for reference
         }
     
+    def _fetch_status(self, url: str, headers: Dict, cookies) -> Tuple[int, str]:
+        """Return (status_code, error) for one URL; runs on the link check pool"""
+        try:
+            response = _SESSION.head(url, headers=headers, cookies=cookies, timeout=5, allow_redirects=True)
+            if response.status_code == 405:
+                # Server does not allow HEAD - fall back to GET without reading the body, asking for
+                # a single uncompressed byte so servers that honor Range send next to nothing
+                with _SESSION.get(url, headers={**headers, **_GET_FALLBACK_HEADERS}, cookies=cookies, timeout=5,
+                                  allow_redirects=True, stream=True) as response:
+                    pass
+                if response.status_code == 206:
+                    # Partial content for our Range request - the page itself is fine
+                    return 200, ''
+            return response.status_code, ''
+        except requests.exceptions.RequestException as e:
+            return 0, str(e)[:100]
+    
+    def _submit_urls(self, urls: List[str]) -> Dict[str, Future]:
+        """Start a status check for every URL not seen before and return the futures keyed by URL"""
+        cache = self._url_status_cache
+        keys = {url: _url_cache_key(url) for url in urls}
+        # The key only dedupes the cache - each check requests the first original href seen for it
+        originals = {}
+        for url, key in keys.items():
+            originals.setdefault(key, url)
+        pending = [key for key in originals if key not in cache]
+        if pending:
+            if self._identity is None:
+                self._identity = request_identity(self.page)
+            headers, cookies = self._identity
+            if self._link_pool is None:
+                self._link_pool = ThreadPoolExecutor(max_workers=LINK_CHECK_WORKERS)
+            
+            # Only this (Playwright) thread touches the cache, so no lock is needed around it
+            for key in pending:
+                cache[key] = self._link_pool.submit(self._fetch_status, originals[key], headers, cookies)
+        return {url: cache[key] for url, key in keys.items()}
+    
+    def _check_urls(self, urls: List[str]) -> Dict[str, Tuple[int, str]]:
+        """Return (status_code, error) for every URL, keyed by URL (cached URLs are not re-fetched)"""
+        return {url: future.result() for url, future in self._submit_urls(urls).items()}
+    
     def _validate_language_switcher(self) -> Dict:
         """Validate language switcher functionality"""
         print("\n[LANGUAGE] Validating language switcher...")
@@ -304,11 +481,12 @@ class NavigationValidator:
         
         try:
             # Find language switcher
-            lang_items = self.page.locator('.cmp-navigation__language-items')
+            lang_items = self._lang_items
             count = lang_items.count()
             
             print(f"   Found {count} language options")
             
+            lines = []
             for i in range(count):
                 item = lang_items.nth(i)
                 link = item.locator('a')
@@ -323,7 +501,9 @@ class NavigationValidator:
                 })
                 
                 status = "[ACTIVE]" if is_active else ""
-                print(f"   {status} Language: {text.strip()}")
+                lines.append(f"   {status} Language: {text.strip()}")
+            if lines:
+                print("\n".join(lines))
                 
         except Exception as e:
             print(f"   [ERROR] Language switcher validation failed: {str(e)}")
@@ -346,10 +526,13 @@ class NavigationValidator:
             if is_search_visible:
                 # Click to open search modal
                 search_button.click()
-                self.page.wait_for_timeout(1000)
                 
                 # Check if search modal opened
                 search_modal = self.page.locator('.c-search__modal')
+                try:
+                    search_modal.wait_for(state='visible', timeout=2000)
+                except Exception:
+                    pass
                 modal_open = search_modal.is_visible()
                 
                 # Find search input
@@ -360,16 +543,17 @@ class NavigationValidator:
                 popular_keywords = self.page.locator('.modal-tags__links')
                 keyword_count = popular_keywords.count()
                 
-                print(f"   Search visible: {is_search_visible}")
-                print(f"   Modal opened: {modal_open}")
-                print(f"   Input exists: {input_exists}")
-                print(f"   Popular keywords: {keyword_count}")
+                print(f"   Search visible: {is_search_visible}\n   Modal opened: {modal_open}\n"
+                      f"   Input exists: {input_exists}\n   Popular keywords: {keyword_count}")
                 
                 # Close search modal
                 if modal_open:
                     close_button = self.page.locator('.c-search__modal-close')
                     close_button.click()
-                    self.page.wait_for_timeout(500)
+                    try:
+                        search_modal.wait_for(state='hidden', timeout=2000)
+                    except Exception:
+                        print("   [WARNING] Search modal did not close within 2s")
                 
                 return {
                     'is_visible': is_search_visible,
@@ -400,76 +584,60 @@ class NavigationValidator:
         }
         
         try:
-            # Get main menu styles
-            main_menu_items = self.page.locator('li.cmp-navigation__menu-items')
-            count = main_menu_items.count()
+            # Read the main menu and sub-menu styles in one round-trip (each NodeList is queried once)
+            styles = self.page.evaluate("""
+                (limit) => {
+                    const read = (el) => {
+                        const s = window.getComputedStyle(el);
+                        return {
+                            fontSize: s.fontSize,
+                            fontFamily: s.fontFamily,
+                            fontWeight: s.fontWeight,
+                            color: s.color,
+                            backgroundColor: s.backgroundColor,
+                            textAlign: s.textAlign
+                        };
+                    };
+                    const items = Array.from(document.querySelectorAll('.cmp-navigation__menu-items'));
+                    const main = items.slice(0, limit).map((el) => {
+                        const textEl = el.querySelector('.cmp-navigation__menu-text');
+                        if (!textEl) return null;
+                        return {text: textEl.textContent || '', ...read(textEl)};
+                    });
+                    const subEl = document.querySelector('.cmp-navigation__mega-menu-links');
+                    return {count: items.length, main: main, sub: subEl ? read(subEl) : null};
+                }
+            """, 5)  # Top 5 main menus
             
-            print(f"   Analyzing {count} main menu items")
+            print(f"   Analyzing {styles['count']} main menu items")
             
-            for i in range(min(count, 5)):  # Top 5 main menus
-                item = main_menu_items.nth(i)
-                menu_text = item.locator('.cmp-navigation__menu-text')
-                
-                # Get computed styles
-                styles = self.page.evaluate(f"""
-                    () => {{
-                        const element = document.querySelectorAll('.cmp-navigation__menu-items')[{i}];
-                        if (!element) return null;
-                        const textEl = element.querySelector('.cmp-navigation__menu-text');
-                        if (!textEl) return null;
-                        const styles = window.getComputedStyle(textEl);
-                        return {{
-                            fontSize: styles.fontSize,
-                            fontFamily: styles.fontFamily,
-                            fontWeight: styles.fontWeight,
-                            color: styles.color,
-                            backgroundColor: styles.backgroundColor,
-                            textAlign: styles.textAlign
-                        }};
-                    }}
-                """)
-                
-                if styles:
-                    text = menu_text.text_content() or f"Menu {i+1}"
+            lines = []
+            for i, item_styles in enumerate(styles['main']):
+                if item_styles:
+                    text = item_styles['text'] or f"Menu {i+1}"
                     font_styles['main_menu'].append({
                         'name': text.strip()[:30],
-                        'font_size': styles['fontSize'],
-                        'font_color': styles['color'],
-                        'font_weight': styles['fontWeight'],
-                        'font_family': styles['fontFamily']
+                        'font_size': item_styles['fontSize'],
+                        'font_color': item_styles['color'],
+                        'font_weight': item_styles['fontWeight'],
+                        'font_family': item_styles['fontFamily']
                     })
                     
-                    print(f"   [OK] {text.strip()[:30]}: {styles['fontSize']}, Color: {styles['color']}")
-            
-            # Get sub-menu styles (sample)
-            mega_menu_links = self.page.locator('.cmp-navigation__mega-menu-links')
-            link_count = mega_menu_links.count()
-            
-            if link_count > 0:
-                styles = self.page.evaluate("""
-                    () => {
-                        const element = document.querySelector('.cmp-navigation__mega-menu-links');
-                        if (!element) return null;
-                        const styles = window.getComputedStyle(element);
-                        return {
-                            fontSize: styles.fontSize,
-                            fontFamily: styles.fontFamily,
-                            fontWeight: styles.fontWeight,
-                            color: styles.color,
-                            backgroundColor: styles.backgroundColor
-                        };
-                    }
-                """)
-                
-                if styles:
-                    font_styles['sub_menu'] = [{
-                        'type': 'sub-menu',
-                        'font_size': styles['fontSize'],
-                        'font_color': styles['color'],
-                        'font_weight': styles['fontWeight'],
-                        'font_family': styles['fontFamily']
-                    }]
-                    print(f"   [OK] Sub-menu links: {styles['fontSize']}, Color: {styles['color']}")
+                    lines.append(f"   [OK] {text.strip()[:30]}: {item_styles['fontSize']}, Color: {item_styles['color']}")
+            if lines:
+                print("\n".join(lines))
+            
+            # Sub-menu styles (sample of the first mega menu link block)
+            sub_styles = styles['sub']
+            if sub_styles:
+                font_styles['sub_menu'] = [{
+                    'type': 'sub-menu',
+                    'font_size': sub_styles['fontSize'],
+                    'font_color': sub_styles['color'],
+                    'font_weight': sub_styles['fontWeight'],
+                    'font_family': sub_styles['fontFamily']
+                }]
+                print(f"   [OK] Sub-menu links: {sub_styles['fontSize']}, Color: {sub_styles['color']}")
             
             # Generate summary
             if font_styles['main_menu']:
@@ -508,206 +676,128 @@ class NavigationValidator:
         filename = f"reports/navigation_report_{timestamp}.xlsx"
         
         from openpyxl import Workbook
-        from openpyxl.styles import Font, PatternFill, Alignment
+        from base_report_generator import SheetWriter
+        
+        # Write-only mode streams rows to disk instead of keeping every cell in memory
+        wb = Workbook(write_only=True)
         
-        wb = Workbook()
-        wb.remove(wb.active)
+        # Whole-row helpers: each row is built by one comprehension and written with one append
+        def header_row(w, headers):
+            w.append([w.cell(header, font=HEADER_FONT, fill=HEADER_FILL) for header in headers])
+        
+        def filled_row(w, values, fill):
+            w.append([w.cell(value, fill=fill) for value in values])
+        
+        def label_rows(w, rows):
+            for label, value in rows:
+                w.append([w.cell(label, font=BOLD), value])
         
         # Summary Sheet
         ws = wb.create_sheet("Summary")
-        ws['A1'] = "NAVIGATION MENU VALIDATION REPORT"
-        ws['A1'].font = Font(bold=True, size=16, color="366092")
-        ws.merge_cells('A1:B1')
+        w = SheetWriter(ws)
+        w.append([w.cell("NAVIGATION MENU VALIDATION REPORT", font=TITLE_FONT)])
+        w.merge('B')
+        w.skip()
         
         summary = results.get('summary', {})
-        row = 3
-        ws.cell(row=row, column=1, value="Main Menu Items:").font = Font(bold=True)
-        ws.cell(row=row, column=2, value=f"{summary.get('visible_main_menu_items', 0)}/{summary.get('total_main_menu_items', 0)} visible")
-        row += 1
-        ws.cell(row=row, column=1, value="Sub-Menu Items:").font = Font(bold=True)
-        ws.cell(row=row, column=2, value=summary.get('total_sub_menu_items', 0))
-        row += 1
-        ws.cell(row=row, column=1, value="Links Checked:").font = Font(bold=True)
-        ws.cell(row=row, column=2, value=summary.get('total_links_checked', 0))
-        row += 1
-        ws.cell(row=row, column=1, value="Valid Links:").font = Font(bold=True)
-        ws.cell(row=row, column=2, value=summary.get('valid_links', 0))
-        row += 1
-        ws.cell(row=row, column=1, value="Broken Links:").font = Font(bold=True)
-        ws.cell(row=row, column=2, value=summary.get('broken_links', 0))
+        label_rows(w, [
+            ("Main Menu Items:", f"{summary.get('visible_main_menu_items', 0)}/{summary.get('total_main_menu_items', 0)} visible"),
+            ("Sub-Menu Items:", summary.get('total_sub_menu_items', 0)),
+            ("Links Checked:", summary.get('total_links_checked', 0)),
+            ("Valid Links:", summary.get('valid_links', 0)),
+            ("Broken Links:", summary.get('broken_links', 0)),
+        ])
         
         # Main Menu Items Sheet
         ws = wb.create_sheet("Main Menu")
-        ws['A1'] = "Menu Name"
-        ws['B1'] = "Text"
-        ws['C1'] = "Is Visible"
-        ws['D1'] = "Has Mega Menu"
-        ws['E1'] = "Status"
+        w = SheetWriter(ws)
+        header_row(w, ("Menu Name", "Text", "Is Visible", "Has Mega Menu", "Status"))
         
-        for cell in ['A1', 'B1', 'C1', 'D1', 'E1']:
-            ws[cell].font = Font(bold=True, color="FFFFFF")
-            ws[cell].fill = PatternFill(start_color="366092", end_color="366092", fill_type="solid")
-        
-        row = 2
         for menu in results.get('main_menu_items', []):
-            ws.cell(row=row, column=1, value=menu.get('name', ''))
-            ws.cell(row=row, column=2, value=menu.get('text', ''))
-            ws.cell(row=row, column=3, value=menu.get('is_visible', False))
-            ws.cell(row=row, column=4, value=menu.get('has_mega_menu', False))
-            ws.cell(row=row, column=5, value=menu.get('status', ''))
-            
             # Color coding
-            if menu.get('status') == 'PASS':
-                fill = PatternFill(start_color="D4EDDA", end_color="D4EDDA", fill_type="solid")
-            else:
-                fill = PatternFill(start_color="F8D7DA", end_color="F8D7DA", fill_type="solid")
-            
-            for col in range(1, 6):
-                ws.cell(row=row, column=col).fill = fill
+            fill = GREEN if menu.get('status') == 'PASS' else RED
             
-            row += 1
+            filled_row(w, [menu.get('name', ''), menu.get('text', ''), menu.get('is_visible', False), menu.get('has_mega_menu', False), menu.get('status', '')], fill)
         
         # Font Styles Sheet ⭐ NEW!
         font_styles = results.get('font_styles', {})
         if font_styles.get('main_menu') or font_styles.get('sub_menu'):
             ws = wb.create_sheet("Font Styles", 2)
-            ws['A1'] = "Element Type"
-            ws['B1'] = "Name"
-            ws['C1'] = "Font Size"
-            ws['D1'] = "Font Color"
-            ws['D1'].font = Font(bold=True, color="FFFFFF")
-            ws['C1'].font = Font(bold=True, color="FFFFFF")
-            
-            for cell in ['A1', 'B1', 'C1', 'D1']:
-                if ws[cell].font is None or ws[cell].font.color != "FFFFFF":
-                    ws[cell].font = Font(bold=True, color="FFFFFF")
-                ws[cell].fill = PatternFill(start_color="366092", end_color="366092", fill_type="solid")
             
-            row = 2
+            # Column widths (before the first row in a write-only sheet)
+            ws.column_dimensions['A'].width = 20
+            ws.column_dimensions['B'].width = 40
+            ws.column_dimensions['C'].width = 20
+            ws.column_dimensions['D'].width = 30
+            w = SheetWriter(ws)
+            header_row(w, ("Element Type", "Name", "Font Size", "Font Color"))
             
             # Add main menu font styles
             for item in font_styles.get('main_menu', []):
-                ws.cell(row=row, column=1, value="Main Menu")
-                ws.cell(row=row, column=2, value=item.get('name', ''))
-                ws.cell(row=row, column=3, value=item.get('font_size', ''))
-                ws.cell(row=row, column=4, value=item.get('font_color', ''))
-                
-                for col in range(1, 5):
-                    ws.cell(row=row, column=col).fill = PatternFill(start_color="D4EDDA", end_color="D4EDDA", fill_type="solid")
-                
-                row += 1
+                filled_row(w, ["Main Menu", item.get('name', ''), item.get('font_size', ''), item.get('font_color', '')], GREEN)
             
             # Add sub menu font styles
             for item in font_styles.get('sub_menu', []):
-                ws.cell(row=row, column=1, value="Sub Menu")
-                ws.cell(row=row, column=2, value=item.get('type', ''))
-                ws.cell(row=row, column=3, value=item.get('font_size', ''))
-                ws.cell(row=row, column=4, value=item.get('font_color', ''))
-                
-                for col in range(1, 5):
-                    ws.cell(row=row, column=col).fill = PatternFill(start_color="D1ECF1", end_color="D1ECF1", fill_type="solid")
-                
-                row += 1
+                filled_row(w, ["Sub Menu", item.get('type', ''), item.get('font_size', ''), item.get('font_color', '')], LIGHT_BLUE)
             
             # Add summary
             summary = font_styles.get('summary', {})
-            row += 1
-            ws.cell(row=row, column=1, value="SUMMARY").font = Font(bold=True, size=12)
-            row += 1
-            ws.cell(row=row, column=1, value="Main Menu Font Size:").font = Font(bold=True)
-            ws.cell(row=row, column=2, value=summary.get('main_menu_font_size', ''))
-            row += 1
-            ws.cell(row=row, column=1, value="Main Menu Font Color:").font = Font(bold=True)
-            ws.cell(row=row, column=2, value=summary.get('main_menu_font_color', ''))
-            row += 1
-            ws.cell(row=row, column=1, value="Sub Menu Font Size:").font = Font(bold=True)
-            ws.cell(row=row, column=2, value=summary.get('sub_menu_font_size', ''))
-            row += 1
-            ws.cell(row=row, column=1, value="Sub Menu Font Color:").font = Font(bold=True)
-            ws.cell(row=row, column=2, value=summary.get('sub_menu_font_color', ''))
-            
-            # Auto-size columns
-            ws.column_dimensions['A'].width = 20
-            ws.column_dimensions['B'].width = 40
-            ws.column_dimensions['C'].width = 20
-            ws.column_dimensions['D'].width = 30
+            w.skip()
+            w.append([w.cell("SUMMARY", font=SECTION_FONT)])
+            label_rows(w, [
+                ("Main Menu Font Size:", summary.get('main_menu_font_size', '')),
+                ("Main Menu Font Color:", summary.get('main_menu_font_color', '')),
+                ("Sub Menu Font Size:", summary.get('sub_menu_font_size', '')),
+                ("Sub Menu Font Color:", summary.get('sub_menu_font_color', '')),
+            ])
         
         # Sub-Menu Details Sheet
         ws = wb.create_sheet("Sub-Menu Details")
-        ws['A1'] = "Menu"
-        ws['B1'] = "Link Text"
-        ws['C1'] = "URL"
-        ws['D1'] = "Status Code"
-        ws['E1'] = "Is Visible"
-        
-        for cell in ['A1', 'B1', 'C1', 'D1', 'E1']:
-            ws[cell].font = Font(bold=True, color="FFFFFF")
-            ws[cell].fill = PatternFill(start_color="366092", end_color="366092", fill_type="solid")
+        w = SheetWriter(ws)
+        header_row(w, ("Menu", "Link Text", "URL", "Status Code", "Is Visible"))
         
-        row = 2
         for menu_name, sub_items in results.get('sub_menus', {}).items():
             for item in sub_items:
-                ws.cell(row=row, column=1, value=menu_name)
-                ws.cell(row=row, column=2, value=item.get('text', ''))
-                ws.cell(row=row, column=3, value=item.get('href', ''))
-                
                 status_code = item.get('status_code', 0)
-                status_cell = ws.cell(row=row, column=4, value=status_code)
-                status_cell.number_format = '0'
-                
-                ws.cell(row=row, column=5, value=item.get('is_visible', False))
                 
                 # Color coding
                 if status_code == 200:
-                    fill_color = "D4EDDA"  # Green
+                    fill = GREEN
                 elif status_code == 0:
-                    fill_color = "FFF3CD"  # Yellow
+                    fill = YELLOW
                 else:
-                    fill_color = "F8D7DA"  # Red
-                
-                for col in range(1, 6):
-                    ws.cell(row=row, column=col).fill = PatternFill(start_color=fill_color, end_color=fill_color, fill_type="solid")
+                    fill = RED
                 
-                row += 1
+                w.append([
+                    w.cell(menu_name, fill=fill),
+                    w.cell(item.get('text', ''), fill=fill),
+                    w.cell(item.get('href', ''), fill=fill),
+                    w.cell(status_code, fill=fill, number_format='0'),
+                    w.cell(item.get('is_visible', False), fill=fill),
+                ])
         
         # Broken Links Sheet
         link_results = results.get('link_validation', {})
         broken_details = link_results.get('broken_details', [])
         if broken_details:
             ws = wb.create_sheet("Broken Links")
-            ws['A1'] = "Text"
-            ws['B1'] = "URL"
-            ws['C1'] = "Status Code"
-            ws['D1'] = "Is Visible"
+            w = SheetWriter(ws)
+            header_row(w, ("Text", "URL", "Status Code", "Is Visible"))
             
-            for cell in ['A1', 'B1', 'C1', 'D1']:
-                ws[cell].font = Font(bold=True, color="FFFFFF")
-                ws[cell].fill = PatternFill(start_color="366092", end_color="366092", fill_type="solid")
-            
-            row = 2
             for link in broken_details:
-                ws.cell(row=row, column=1, value=link.get('text', ''))
-                ws.cell(row=row, column=2, value=link.get('href', ''))
-                status_cell = ws.cell(row=row, column=3, value=link.get('status_code', 0))
-                status_cell.number_format = '0'  # Format as number
-                ws.cell(row=row, column=4, value=link.get('is_visible', False))
+                status_code = link.get('status_code', 0)
+                text = link.get('text', '')
+                href = link.get('href', '')
+                is_visible = link.get('is_visible', False)
+                fill = _status_to_fill(status_code)
                 
-                # Color code based on status
-                if link.get('status_code', 0) == 200:
-                    fill_color = "D4EDDA"  # Green for working links
-                elif 400 <= link.get('status_code', 0) < 500:
-                    fill_color = "FFE4E1"  # Light red for client errors
-                elif link.get('status_code', 0) >= 500:
-                    fill_color = "F8D7DA"  # Red for server errors
-                else:
-                    fill_color = "FFF3CD"  # Yellow for other cases
-                
-                for col in range(1, 5):
-                    ws.cell(row=row, column=col).fill = PatternFill(start_color=fill_color, end_color=fill_color, fill_type="solid")
-                
-                row += 1
+                w.append([
+                    w.cell(text, fill=fill),
+                    w.cell(href, fill=fill),
+                    w.cell(status_code, fill=fill, number_format='0'),  # Format as number
+                    w.cell(is_visible, fill=fill),
+                ])
         
         wb.save(filename)
         print(f"\n[EXCEL] Report generated: {filename}")
         return filename
-
@@ -0,0 +1,85 @@
+"""
+Run Article List and Carousel validation for the Solidigm home page in one browser session
+The page is loaded once and both validators run on it, then both Excel reports are written side by side
+"""
+import os
+from concurrent.futures import ThreadPoolExecutor
+from browser_session import SELECTOR_TIMEOUT, VIEWPORT, new_context
+from article_list_validator import ArticleListValidator
+from carousel_validator import CarouselValidator
+from carousel_report_generator import CarouselReportGenerator
+from run_article_list_validation import ARTICLE_IMAGES_LOADED, STORAGE_STATE, generate_excel_report as generate_article_list_report
+
+
+def main():
+    url = "https://www.solidigm.com/"
+    
+    print("=" * 80)
+    print(" " * 15 + "ARTICLE LIST + CAROUSEL VALIDATION")
+    print("=" * 80)
+    
+    # Reuse cookies/local storage from the previous run (consent banners etc. are already handled)
+    context = new_context(viewport=VIEWPORT,
+                          storage_state=STORAGE_STATE if os.path.exists(STORAGE_STATE) else None)
+    page = context.new_page()
+    page.set_default_timeout(SELECTOR_TIMEOUT)
+    # Navigation only waits for the DOM (the component waits cover the rest), so it gets a tighter bound than NAVIGATION_TIMEOUT
+    page.set_default_navigation_timeout(30000)
+    
+    try:
+        # Navigate once for both validators
+        print(f"\n[INFO] Navigating to {url}...")
+        # Return once the DOM is parsed - the waits below cover the scripts that mount the components
+        page.goto(url, wait_until='domcontentloaded')
+        # Wait for Splide to mount both components rather than sleeping a fixed 5s;
+        # each wait is separate so a slow article list still waits for the carousel
+        try:
+            page.wait_for_selector('.cmp-article-list__articles-container .splide__slide.is-visible', state='visible', timeout=10000)
+            page.wait_for_function(ARTICLE_IMAGES_LOADED, timeout=5000)
+        except Exception:
+            print("[WARNING] Article list not ready in time, continuing")
+        try:
+            page.wait_for_selector('.splide:has(.cmp-hero) .splide__slide.is-active', state='visible', timeout=8000)
+        except Exception:
+            print("[WARNING] Carousel not initialized within 8s, continuing")
+        
+        title = page.title()
+        print(f"[OK] Page loaded: {title}")
+        
+        # Save the session for the next run
+        try:
+            os.makedirs(os.path.dirname(STORAGE_STATE), exist_ok=True)
+            context.storage_state(path=STORAGE_STATE)
+        except Exception as e:
+            print(f"[WARNING] Could not save browser storage state: {str(e)}")
+        
+        # The validators look at different components, so they share the page
+        article_results = ArticleListValidator(page).validate_article_list()
+        carousel_results = CarouselValidator(page).validate_carousel()
+        
+        # Write the reports concurrently (separate workbooks, nothing shared)
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            reports = {}
+            if 'error' not in article_results and article_results.get('found'):
+                reports['Article List'] = executor.submit(generate_article_list_report, article_results)
+            if 'error' not in carousel_results:
+                reports['Carousel'] = executor.submit(CarouselReportGenerator().generate_excel_report, carousel_results)
+            
+            for name, future in reports.items():
+                try:
+                    print(f"\n[SUCCESS] {name} report saved: {future.result()}")
+                except Exception as e:
+                    print(f"\n[ERROR] {name} report generation failed: {str(e)}")
+        
+        print("\n" + "="*80)
+        print("VALIDATION COMPLETE")
+        print("="*80)
+    
+    except Exception as e:
+        print(f"\n[ERROR] {str(e)}")
+    finally:
+        context.close()
+
+
+if __name__ == "__main__":
+    main()
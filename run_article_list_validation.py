@@ -1,116 +1,115 @@
 """
 Run Article List validation and generate Excel report
 """
-from playwright.sync_api import sync_playwright
+from browser_session import SELECTOR_TIMEOUT, VIEWPORT, new_context
 from article_list_validator import ArticleListValidator
 from openpyxl import Workbook
 from openpyxl.styles import Font, PatternFill
 from openpyxl.utils import get_column_letter
+from base_report_generator import SheetWriter
+from xlsxwriter_backend import XlsxWriterWorkbook, xlsxwriter_available
 from datetime import datetime
 import os
 
+# Browser storage (cookies, local storage) kept between runs, shared by the home page runners
+STORAGE_STATE = "reports/.storage_state.json"
+
+# True once the images of the shown article cards have loaded (the validator reads their natural size)
+ARTICLE_IMAGES_LOADED = """() => Array.from(document.querySelectorAll(
+    '.cmp-article-list__articles-container .splide__slide.is-visible img')).every(img => img.complete)"""
+
+# Excel backend for the report: "openpyxl" (write-only) or "xlsxwriter" (constant_memory, when installed)
+_EXCEL_BACKEND = os.environ.get("EXCEL_BACKEND", "openpyxl")
+
+# Report styles shared by every sheet (built once at import instead of per report/cell)
+HEADER_FONT = Font(bold=True, color="FFFFFF")
+HEADER_FILL = PatternFill(start_color="366092", end_color="366092", fill_type="solid")
+TITLE_FONT = Font(bold=True, size=16)
+BOLD = Font(bold=True)
+
+# Yes/No labels indexed by a bool
+_YESNO = ('No', 'Yes')
+
+# Summary rows shown as Yes/No: (label, summary key)
+_SUMMARY_FLAGS = (
+    ("Title Exists:", 'title_exists'),
+    ("View All Link Valid:", 'view_all_link_valid'),
+    ("Chevrons Working:", 'chevrons_working'),
+    ("Hover Working:", 'hover_working'),
+    ("All Links Valid:", 'all_links_valid'),
+)
+
+# Column widths from column A, per sheet
+_SUMMARY_WIDTHS = (25, 30)
+_CARD_WIDTHS = (8, 50, 25, 50, 20, 20)
+_FONT_STYLE_WIDTHS = (8, 15, 15, 30)
+
+
+def _set_column_widths(ws, widths):
+    """Set all column widths of a sheet in one pass (before the first row in a write-only sheet)"""
+    for index, width in enumerate(widths, 1):
+        ws.column_dimensions[get_column_letter(index)].width = width
+
 
 def generate_excel_report(results: dict):
     """Generate Excel report for article list"""
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
     filename = f"reports/article_list_report_{timestamp}.xlsx"
     
-    if not os.path.exists("reports"):
-        os.makedirs("reports")
+    os.makedirs("reports", exist_ok=True)
     
-    wb = Workbook()
-    wb.remove(wb.active)
+    if _EXCEL_BACKEND == "xlsxwriter" and xlsxwriter_available():
+        wb = XlsxWriterWorkbook(filename)
+    else:
+        # Write-only mode streams rows to disk instead of keeping every cell in memory
+        wb = Workbook(write_only=True)
     
     # Summary Sheet
     ws = wb.create_sheet("Summary", 0)
-    ws['A1'] = "ARTICLE LIST VALIDATION REPORT"
-    ws['A1'].font = Font(bold=True, size=16)
-    ws.merge_cells('A1:B1')
+    _set_column_widths(ws, _SUMMARY_WIDTHS)
+    w = SheetWriter(ws)
+    w.append([w.cell("ARTICLE LIST VALIDATION REPORT", font=TITLE_FONT)])
+    w.merge('B')
+    w.skip()
     
-    row = 3
     summary = results.get('summary', {})
-    ws.cell(row=row, column=1, value="Total Cards:").font = Font(bold=True)
-    ws.cell(row=row, column=2, value=summary.get('total_cards', 0))
-    row += 1
-    
-    ws.cell(row=row, column=1, value="Title Exists:").font = Font(bold=True)
-    ws.cell(row=row, column=2, value='Yes' if summary.get('title_exists') else 'No')
-    row += 1
-    
-    ws.cell(row=row, column=1, value="View All Link Valid:").font = Font(bold=True)
-    ws.cell(row=row, column=2, value='Yes' if summary.get('view_all_link_valid') else 'No')
-    row += 1
-    
-    ws.cell(row=row, column=1, value="Chevrons Working:").font = Font(bold=True)
-    ws.cell(row=row, column=2, value='Yes' if summary.get('chevrons_working') else 'No')
-    row += 1
-    
-    ws.cell(row=row, column=1, value="Hover Working:").font = Font(bold=True)
-    ws.cell(row=row, column=2, value='Yes' if summary.get('hover_working') else 'No')
-    row += 1
-    
-    ws.cell(row=row, column=1, value="All Links Valid:").font = Font(bold=True)
-    ws.cell(row=row, column=2, value='Yes' if summary.get('all_links_valid') else 'No')
-    row += 1
+    w.append([w.cell("Total Cards:", font=BOLD), summary.get('total_cards', 0)])
+    for label, key in _SUMMARY_FLAGS:
+        w.append([w.cell(label, font=BOLD), _YESNO[bool(summary.get(key))]])
     
     # (Older summary stopped here)
     
-    ws.column_dimensions['A'].width = 25
-    ws.column_dimensions['B'].width = 30
-    
     # Article Cards Sheet
     ws = wb.create_sheet("Article Cards", 1)
+    _set_column_widths(ws, _CARD_WIDTHS)
+    w = SheetWriter(ws)
     headers = ["Card", "Title", "Category", "Link", "Container Size", "Image Size"]
+    w.append([w.cell(header, font=HEADER_FONT, fill=HEADER_FILL) for header in headers])
     
-    for col, header in enumerate(headers, start=1):
-        cell = ws.cell(row=1, column=col, value=header)
-        cell.font = Font(bold=True, color="FFFFFF")
-        cell.fill = PatternFill(start_color="366092", end_color="366092", fill_type="solid")
-    
-    row = 2
-    for card in results.get('cards', {}).get('cards', []):
-        ws.cell(row=row, column=1, value=card.get('index', 0))
-        ws.cell(row=row, column=2, value=card.get('title', ''))
-        ws.cell(row=row, column=3, value=card.get('category', ''))
-        ws.cell(row=row, column=4, value=card.get('link', ''))
-        
+    cards = results.get('cards', {}).get('cards', [])
+    for card in cards:
         container = card.get('container', {})
-        ws.cell(row=row, column=5, value=f"{container.get('width', 0)}x{container.get('height', 0)}")
-        
         img = card.get('image', {})
-        ws.cell(row=row, column=6, value=f"{img.get('width', 0)}x{img.get('height', 0)}")
-        
-        row += 1
-    
-    ws.column_dimensions['A'].width = 8
-    ws.column_dimensions['B'].width = 50
-    ws.column_dimensions['C'].width = 25
-    ws.column_dimensions['D'].width = 50
-    ws.column_dimensions['E'].width = 20
-    ws.column_dimensions['F'].width = 20
+        w.append((
+            card.get('index', 0),
+            card.get('title', ''),
+            card.get('category', ''),
+            card.get('link', ''),
+            f"{container.get('width', 0)}x{container.get('height', 0)}",
+            f"{img.get('width', 0)}x{img.get('height', 0)}",
+        ))
     
     # Font Styles Sheet
     ws = wb.create_sheet("Font Styles", 2)
+    _set_column_widths(ws, _FONT_STYLE_WIDTHS)
+    w = SheetWriter(ws)
     headers = ["Card", "Element", "Font Size", "Font Color"]
+    w.append([w.cell(header, font=HEADER_FONT, fill=HEADER_FILL) for header in headers])
     
-    for col, header in enumerate(headers, start=1):
-        cell = ws.cell(row=1, column=col, value=header)
-        cell.font = Font(bold=True, color="FFFFFF")
-        cell.fill = PatternFill(start_color="366092", end_color="366092", fill_type="solid")
-    
-    row = 2
-    for card in results.get('cards', {}).get('cards', []):
+    for card in cards:
+        index = card.get('index', 0)
         for element_type, styles in card.get('font_styles', {}).items():
-            ws.cell(row=row, column=1, value=card.get('index', 0))
-            ws.cell(row=row, column=2, value=element_type.upper())
-            ws.cell(row=row, column=3, value=styles.get('fontSize', ''))
-            ws.cell(row=row, column=4, value=styles.get('color', ''))
-            row += 1
-    
-    ws.column_dimensions['A'].width = 8
-    ws.column_dimensions['B'].width = 15
-    ws.column_dimensions['C'].width = 15
-    ws.column_dimensions['D'].width = 30
+            w.append((index, element_type.upper(), styles.get('fontSize', ''), styles.get('color', '')))
     
     wb.save(filename)
     print(f"\n[EXCEL] Report saved: {filename}")
@@ -124,19 +123,36 @@ def main():
     print(" " * 20 + "ARTICLE LIST VALIDATION")
     print("=" * 80)
     
-    playwright = sync_playwright().start()
-    browser = playwright.chromium.launch(headless=False, args=['--no-sandbox'])
-    page = browser.new_page(viewport={'width': 1920, 'height': 1080})
-    page.set_default_timeout(90000)
+    # Reuse cookies/local storage from the previous run (consent banners etc. are already handled)
+    context = new_context(viewport=VIEWPORT,
+                          storage_state=STORAGE_STATE if os.path.exists(STORAGE_STATE) else None)
+    page = context.new_page()
+    page.set_default_timeout(SELECTOR_TIMEOUT)
+    # Navigation only waits for the DOM (the component waits cover the rest), so it gets a tighter bound than NAVIGATION_TIMEOUT
+    page.set_default_navigation_timeout(30000)
     
     try:
         print(f"\n[INFO] Navigating to {url}...")
-        page.goto(url, timeout=90000, wait_until='domcontentloaded')
-        page.wait_for_timeout(5000)  # Wait for dynamic content
+        # Return once the DOM is parsed - the waits below cover the scripts that mount the components
+        page.goto(url, wait_until='domcontentloaded')
+        # Wait for Splide to mount the article list and for the shown cards' images to load
+        # rather than sleeping a fixed 5s
+        try:
+            page.wait_for_selector('.cmp-article-list__articles-container .splide__slide.is-visible', state='visible', timeout=10000)
+            page.wait_for_function(ARTICLE_IMAGES_LOADED, timeout=5000)
+        except Exception:
+            print("[WARNING] Article list not ready in time, continuing")
         
         title = page.title()
         print(f"[OK] Page loaded: {title}")
         
+        # Save the session for the next run
+        try:
+            os.makedirs(os.path.dirname(STORAGE_STATE), exist_ok=True)
+            context.storage_state(path=STORAGE_STATE)
+        except Exception as e:
+            print(f"[WARNING] Could not save browser storage state: {str(e)}")
+        
         # Run article list validation
         validator = ArticleListValidator(page)
         results = validator.validate_article_list()
@@ -152,7 +168,7 @@ def main():
     except Exception as e:
         print(f"\n[ERROR] {str(e)}")
     finally:
-        browser.close()
+        context.close()
 
 
 if __name__ == "__main__":
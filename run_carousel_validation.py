@@ -1,10 +1,14 @@
 """
 Run carousel validation for Solidigm home page
 """
-from playwright.sync_api import sync_playwright
+import os
+from browser_session import SELECTOR_TIMEOUT, VIEWPORT, new_context
 from carousel_validator import CarouselValidator
 from carousel_report_generator import CarouselReportGenerator
 
+# Browser storage (cookies, local storage) kept between runs, shared with the article list runner
+STORAGE_STATE = "reports/.storage_state.json"
+
 
 def main():
     url = "https://www.solidigm.com/"
@@ -13,20 +17,35 @@ def main():
     print("CAROUSEL VALIDATION - SOLIDIGM HOME PAGE")
     print("=" * 80)
     
-    playwright = sync_playwright().start()
-    browser = playwright.chromium.launch(headless=False, args=['--no-sandbox'])
-    page = browser.new_page(viewport={'width': 1920, 'height': 1080})
-    page.set_default_timeout(90000)
+    # Reuse cookies/local storage from the previous run (consent banners etc. are already handled)
+    context = new_context(viewport=VIEWPORT,
+                          storage_state=STORAGE_STATE if os.path.exists(STORAGE_STATE) else None)
+    page = context.new_page()
+    page.set_default_timeout(SELECTOR_TIMEOUT)
+    # Navigation only waits for the DOM (the component waits cover the rest), so it gets a tighter bound than NAVIGATION_TIMEOUT
+    page.set_default_navigation_timeout(30000)
     
     try:
         # Navigate to page
         print(f"\n[INFO] Navigating to {url}...")
-        page.goto(url, timeout=60000, wait_until='domcontentloaded')
-        page.wait_for_timeout(3000)
+        # Return once the DOM is parsed - the waits below cover the scripts that mount the components
+        page.goto(url, wait_until='domcontentloaded')
+        # Wait for Splide to mount the hero carousel (it marks the shown slide is-active) rather than sleeping a fixed 3s
+        try:
+            page.wait_for_selector('.splide:has(.cmp-hero) .splide__slide.is-active', state='visible', timeout=8000)
+        except Exception:
+            print("[WARNING] Carousel not initialized within 8s, continuing")
         
         title = page.title()
         print(f"[OK] Page loaded: {title}")
         
+        # Save the session for the next run
+        try:
+            os.makedirs(os.path.dirname(STORAGE_STATE), exist_ok=True)
+            context.storage_state(path=STORAGE_STATE)
+        except Exception as e:
+            print(f"[WARNING] Could not save browser storage state: {str(e)}")
+        
         # Validate carousel
         validator = CarouselValidator(page)
         results = validator.validate_carousel()
@@ -63,7 +82,7 @@ def main():
     except Exception as e:
         print(f"\n[ERROR] {str(e)}")
     finally:
-        browser.close()
+        context.close()
 
 
 if __name__ == "__main__":
@@ -5,7 +5,7 @@ Validates Homepage, Data Center page, and all Product Series pages (D3, D5, D7)
 import sys
 import json
 from pathlib import Path
-from playwright.sync_api import sync_playwright
+from browser_session import NAVIGATION_TIMEOUT, SELECTOR_TIMEOUT, VIEWPORT, new_context
 from homepage_validator import HomePageValidator
 from home_page_report_generator import HomePageReportGenerator
 from data_center_page_validator import DataCenterPageValidator
@@ -27,10 +27,11 @@ def main():
     print("  5. D7 Series page")
     print("\n" + "=" * 100)
     
-    playwright = sync_playwright().start()
-    browser = playwright.chromium.launch(headless=False, args=['--no-sandbox'])
-    page = browser.new_page(viewport={'width': 1920, 'height': 1080})
-    page.set_default_timeout(120000)
+    # One context per run on the shared browser (Chromium is only launched once per process)
+    context = new_context(viewport=VIEWPORT)
+    page = context.new_page()
+    page.set_default_timeout(SELECTOR_TIMEOUT)
+    page.set_default_navigation_timeout(NAVIGATION_TIMEOUT)
     
     all_results = {
         'homepage': {},
@@ -41,6 +42,8 @@ def main():
         'timestamp': datetime.now().strftime("%Y-%m-%d %H:%M:%S")
     }
     
+    homepage_report_gen = None
+    
     try:
         # 1. Validate Homepage
         print("\n" + "="*100)
@@ -52,12 +55,12 @@ def main():
             homepage_results = homepage_validator.validate_complete_homepage()
             all_results['homepage'] = homepage_results
             
-            # Generate homepage report
+            # Generate homepage report (saved in the background while the next page is validated)
             if 'error' not in homepage_results:
                 try:
-                    homepage_report_gen = HomePageReportGenerator()
+                    homepage_report_gen = HomePageReportGenerator(fast_mode=True)
                     homepage_report = homepage_report_gen.generate_excel_report(homepage_results)
-                    print(f"\n[SUCCESS] Homepage report saved: {homepage_report}")
+                    print(f"\n[SUCCESS] Homepage report queued: {homepage_report}")
                     all_results['homepage']['report_file'] = homepage_report
                 except Exception as e:
                     print(f"\n[ERROR] Homepage report generation failed: {str(e)}")
@@ -144,6 +147,13 @@ def main():
                 print(f"\n[ERROR] {series_name} Series validation failed: {str(e)}")
                 all_results[series_name.lower()]['error'] = str(e)
         
+        # Wait for the homepage report that was saved in the background
+        if homepage_report_gen:
+            try:
+                homepage_report_gen.wait_for_pending_saves()
+            except Exception as e:
+                print(f"\n[ERROR] Homepage report save failed: {str(e)}")
+        
         # Generate combined summary report
         print("\n" + "="*100)
         print(" " * 35 + "GENERATING COMBINED SUMMARY")
@@ -172,83 +182,52 @@ def main():
         import traceback
         traceback.print_exc()
     finally:
-        browser.close()
+        context.close()
 
 
 def _generate_combined_summary(all_results: dict):
     """Generate a combined summary report"""
     from openpyxl import Workbook
-    from openpyxl.styles import Font, PatternFill
+    from openpyxl.styles import Font
     from datetime import datetime
+    from base_report_generator import SheetWriter
     
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
     filename = f"reports/comprehensive_validation_summary_{timestamp}.xlsx"
     
-    wb = Workbook()
-    ws = wb.active
-    ws.title = "Summary"
-    
-    ws['A1'] = "COMPREHENSIVE VALIDATION SUMMARY"
-    ws['A1'].font = Font(bold=True, size=16, color="366092")
-    ws.merge_cells('A1:B1')
-    
-    row = 3
-    ws.cell(row=row, column=1, value="Validation Timestamp:").font = Font(bold=True)
-    ws.cell(row=row, column=2, value=all_results.get('timestamp', ''))
-    row += 2
-    
-    # Homepage Summary
-    ws.cell(row=row, column=1, value="HOMEPAGE").font = Font(bold=True, size=12)
-    ws.merge_cells(f'A{row}:B{row}')
-    row += 1
-    
-    homepage = all_results.get('homepage', {})
-    ws.cell(row=row, column=1, value="Status:").font = Font(bold=True)
-    ws.cell(row=row, column=2, value='Validated' if homepage.get('summary') else 'Failed')
-    row += 1
-    
-    if homepage.get('report_file'):
-        ws.cell(row=row, column=1, value="Report File:").font = Font(bold=True)
-        ws.cell(row=row, column=2, value=homepage['report_file'])
-        row += 1
-    row += 1
+    wb = Workbook(write_only=True)
+    ws = wb.create_sheet("Summary")
     
-    # Data Center Summary
-    ws.cell(row=row, column=1, value="DATA CENTER PAGE").font = Font(bold=True, size=12)
-    ws.merge_cells(f'A{row}:B{row}')
-    row += 1
-    
-    dc = all_results.get('data_center', {})
-    ws.cell(row=row, column=1, value="Status:").font = Font(bold=True)
-    ws.cell(row=row, column=2, value='Validated' if dc.get('hero') else 'Failed')
-    row += 1
-    
-    if dc.get('report_file'):
-        ws.cell(row=row, column=1, value="Report File:").font = Font(bold=True)
-        ws.cell(row=row, column=2, value=dc['report_file'])
-        row += 1
-    row += 1
-    
-    # Series Pages Summary
-    for series in ['D3', 'D5', 'D7']:
-        ws.cell(row=row, column=1, value=f"{series} SERIES").font = Font(bold=True, size=12)
-        ws.merge_cells(f'A{row}:B{row}')
-        row += 1
-        
-        series_data = all_results.get(series.lower(), {})
-        ws.cell(row=row, column=1, value="Status:").font = Font(bold=True)
-        ws.cell(row=row, column=2, value='Validated' if series_data.get('series') else 'Failed')
-        row += 1
-        
-        if series_data.get('report_file'):
-            ws.cell(row=row, column=1, value="Report File:").font = Font(bold=True)
-            ws.cell(row=row, column=2, value=series_data['report_file'])
-            row += 1
-        row += 1
-    
-    # Set column widths
+    # Set column widths (before the first row in a write-only sheet)
     ws.column_dimensions['A'].width = 30
     ws.column_dimensions['B'].width = 70
+    w = SheetWriter(ws)
+    bold = Font(bold=True)
+    section_font = Font(bold=True, size=12)
+    
+    w.append([w.cell("COMPREHENSIVE VALIDATION SUMMARY", font=Font(bold=True, size=16, color="366092"))])
+    w.merge('B')
+    w.skip()
+    
+    w.append([w.cell("Validation Timestamp:", font=bold), all_results.get('timestamp', '')])
+    w.skip()
+    
+    # One block per page: homepage, data center, then the series pages
+    pages = [
+        ("HOMEPAGE", all_results.get('homepage', {}), 'summary'),
+        ("DATA CENTER PAGE", all_results.get('data_center', {}), 'hero'),
+    ]
+    pages += [(f"{series} SERIES", all_results.get(series.lower(), {}), 'series') for series in ['D3', 'D5', 'D7']]
+    
+    for title, page_results, validated_key in pages:
+        w.append([w.cell(title, font=section_font)])
+        w.merge('B')
+        
+        w.append([w.cell("Status:", font=bold), 'Validated' if page_results.get(validated_key) else 'Failed'])
+        
+        if page_results.get('report_file'):
+            w.append([w.cell("Report File:", font=bold), page_results['report_file']])
+        w.skip()
     
     wb.save(filename)
     print(f"\n[SUCCESS] Combined summary report saved: {filename}")
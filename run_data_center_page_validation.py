@@ -7,11 +7,15 @@ Usage:
     python run_data_center_page_validation.py 2,2,1               # Use indices: Interface=2, Form Factor=2, Capacity=1
     python run_data_center_page_validation.py "PCIe 5.0 x4, NVMe","E1.S 9.5mm","15.36TB"  # Use text values
 """
+import re
 import sys
-from playwright.sync_api import sync_playwright
+from browser_session import NAVIGATION_TIMEOUT, SELECTOR_TIMEOUT, VIEWPORT, new_context
 from data_center_page_validator import DataCenterPageValidator
 from data_center_page_report_generator import DataCenterPageReportGenerator
 
+# One comma-terminated part of the filter argument; "..." and '...' keep their commas (an unclosed quote runs to the end)
+_FILTER_PART_RE = re.compile(r'''((?:"[^"]*"?|'[^']*'?|[^,"'])*),''')
+
 
 def parse_filter_args(args):
     """Parse filter arguments from command line
@@ -34,29 +38,8 @@ def parse_filter_args(args):
         
         # Check if it's comma-separated values
         if ',' in filter_arg:
-            # Split by comma, but handle quoted strings that may contain commas
-            parts = []
-            current_part = ""
-            in_quotes = False
-            quote_char = None
-            
-            for char in filter_arg:
-                if char in ['"', "'"] and not in_quotes:
-                    in_quotes = True
-                    quote_char = char
-                    current_part += char
-                elif char == quote_char and in_quotes:
-                    in_quotes = False
-                    quote_char = None
-                    current_part += char
-                elif char == ',' and not in_quotes:
-                    parts.append(current_part.strip())
-                    current_part = ""
-                else:
-                    current_part += char
-            
-            if current_part:
-                parts.append(current_part.strip())
+            # Split by comma, but keep single- or double-quoted values that contain commas together
+            parts = _FILTER_PART_RE.findall(filter_arg + ',')
             
             # Process each part
             for i, part in enumerate(parts):
@@ -110,10 +93,11 @@ def main():
         else:
             print(f"  Capacity: Not selected")
     
-    playwright = sync_playwright().start()
-    browser = playwright.chromium.launch(headless=False, args=['--no-sandbox'])
-    page = browser.new_page(viewport={'width': 1920, 'height': 1080})
-    page.set_default_timeout(120000)
+    # One context per run on the shared browser (Chromium is only launched once per process)
+    context = new_context(viewport=VIEWPORT)
+    page = context.new_page()
+    page.set_default_timeout(SELECTOR_TIMEOUT)
+    page.set_default_navigation_timeout(NAVIGATION_TIMEOUT)
     
     try:
         validator = DataCenterPageValidator(page)
@@ -143,7 +127,7 @@ def main():
         import traceback
         traceback.print_exc()
     finally:
-        browser.close()
+        context.close()
 
 
 if __name__ == "__main__":
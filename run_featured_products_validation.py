@@ -1,7 +1,7 @@
 """
 Run Featured Products validation on Solidigm home page
 """
-from playwright.sync_api import sync_playwright
+from browser_session import NAVIGATION_TIMEOUT, SELECTOR_TIMEOUT, VIEWPORT, new_context
 from featured_products_validator import FeaturedProductsValidator
 from featured_products_report_generator import FeaturedProductsReportGenerator
 
@@ -13,15 +13,20 @@ def main():
     print("FEATURED PRODUCTS VALIDATION - SOLIDIGM HOME PAGE")
     print("=" * 80)
 
-    playwright = sync_playwright().start()
-    browser = playwright.chromium.launch(headless=False, args=['--no-sandbox'])
-    page = browser.new_page(viewport={'width': 1920, 'height': 1080})
-    page.set_default_timeout(120000)
+    # One context per run on the shared browser (Chromium is only launched once per process)
+    context = new_context(viewport=VIEWPORT)
+    page = context.new_page()
+    page.set_default_timeout(SELECTOR_TIMEOUT)
+    page.set_default_navigation_timeout(NAVIGATION_TIMEOUT)
 
     try:
         print(f"\n[INFO] Navigating to {url}...")
-        page.goto(url, wait_until='domcontentloaded', timeout=90000)
-        page.wait_for_timeout(3000)
+        page.goto(url, wait_until='domcontentloaded')
+        # Wait for the featured products carousel rather than sleeping a fixed 3s
+        try:
+            page.wait_for_selector('.cmp-carousel.splide.product', state='attached', timeout=10000)
+        except Exception:
+            print("[WARNING] Featured products carousel not attached within 10s, continuing")
 
         validator = FeaturedProductsValidator(page)
         results = validator.validate_featured_products()
@@ -39,7 +44,7 @@ def main():
     except Exception as e:
         print(f"\n[ERROR] {str(e)}")
     finally:
-        browser.close()
+        context.close()
 
 
 if __name__ == "__main__":
@@ -3,7 +3,7 @@
 Script to validate only the Footer component on the homepage
 """
 
-from playwright.sync_api import sync_playwright
+from browser_session import NAVIGATION_TIMEOUT, SELECTOR_TIMEOUT, VIEWPORT, new_context
 from homepage_validator import HomePageValidator
 from home_page_report_generator import HomePageReportGenerator
 from datetime import datetime
@@ -17,15 +17,20 @@ def main():
     print(f"{'='*60}")
     print(f"URL: {url}\n")
     
-    playwright = sync_playwright().start()
-    browser = playwright.chromium.launch(headless=False, args=['--no-sandbox'])
-    page = browser.new_page(viewport={'width': 1920, 'height': 1080})
-    page.set_default_timeout(120000)
+    # One context per run on the shared browser (Chromium is only launched once per process)
+    context = new_context(viewport=VIEWPORT)
+    page = context.new_page()
+    page.set_default_timeout(SELECTOR_TIMEOUT)
+    page.set_default_navigation_timeout(NAVIGATION_TIMEOUT)
     
     try:
         print(f"[INFO] Navigating to {url}...")
-        page.goto(url, wait_until='load', timeout=60000)
-        page.wait_for_timeout(3000)
+        page.goto(url, wait_until='load')
+        # Wait for the footer markup rather than sleeping a fixed 3s
+        try:
+            page.wait_for_selector('footer, .footer-content', state='attached', timeout=5000)
+        except Exception:
+            print("[WARNING] Footer not attached within 5s, continuing")
         
         # Initialize validator
         validator = HomePageValidator(page, url)
@@ -47,6 +52,7 @@ def main():
         
         try:
             filename = report_gen.generate_excel_report(results)
+            report_gen.wait_for_pending_saves()
             print(f"\n[SUCCESS] Footer validation complete!")
             print(f"Report saved: {filename}")
         except Exception as e:
@@ -59,7 +65,7 @@ def main():
         import traceback
         traceback.print_exc()
     finally:
-        browser.close()
+        context.close()
 
 if __name__ == "__main__":
     main()
@@ -2,7 +2,7 @@
 Run complete home page validation
 """
 import sys
-from playwright.sync_api import sync_playwright
+from browser_session import NAVIGATION_TIMEOUT, SELECTOR_TIMEOUT, VIEWPORT, new_context
 from homepage_validator import HomePageValidator
 from home_page_report_generator import HomePageReportGenerator
 
@@ -17,10 +17,11 @@ def main():
     print(" " * 25 + "SOLIDIGM HOMEPAGE COMPREHENSIVE VALIDATION")
     print("=" * 100)
     
-    playwright = sync_playwright().start()
-    browser = playwright.chromium.launch(headless=False, args=['--no-sandbox'])
-    page = browser.new_page(viewport={'width': 1920, 'height': 1080})
-    page.set_default_timeout(120000)
+    # One context per run on the shared browser (Chromium is only launched once per process)
+    context = new_context(viewport=VIEWPORT)
+    page = context.new_page()
+    page.set_default_timeout(SELECTOR_TIMEOUT)
+    page.set_default_navigation_timeout(NAVIGATION_TIMEOUT)
     
     try:
         # Run validation
@@ -30,8 +31,10 @@ def main():
         # Generate Excel report
         if 'error' not in results:
             try:
-                report_gen = HomePageReportGenerator()
+                # Stream the full homepage report through xlsxwriter when it is installed
+                report_gen = HomePageReportGenerator(fast_mode=True)
                 excel_file = report_gen.generate_excel_report(results)
+                report_gen.wait_for_pending_saves()
                 print(f"\n[SUCCESS] Excel report saved: {excel_file}")
             except Exception as report_error:
                 print(f"\n[ERROR] Failed to generate Excel report: {str(report_error)}")
@@ -55,7 +58,7 @@ def main():
     except Exception as e:
         print(f"\n[ERROR] {str(e)}")
     finally:
-        browser.close()
+        context.close()
 
 
 if __name__ == "__main__":
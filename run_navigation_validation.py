@@ -2,7 +2,7 @@
 Run navigation validation for Solidigm website
 """
 import sys
-from playwright.sync_api import sync_playwright
+from browser_session import NAVIGATION_TIMEOUT, SELECTOR_TIMEOUT, VIEWPORT, new_context
 from navigation_validator import NavigationValidator
 
 
@@ -13,10 +13,11 @@ def main():
     print("NAVIGATION MENU VALIDATION - SOLIDIGM WEBSITE")
     print("=" * 80)
     
-    playwright = sync_playwright().start()
-    browser = playwright.chromium.launch(headless=False, args=['--no-sandbox'])
-    page = browser.new_page(viewport={'width': 1920, 'height': 1080})
-    page.set_default_timeout(90000)
+    # One context per run on the shared browser (Chromium is only launched once per process)
+    context = new_context(viewport=VIEWPORT)
+    page = context.new_page()
+    page.set_default_timeout(SELECTOR_TIMEOUT)
+    page.set_default_navigation_timeout(NAVIGATION_TIMEOUT)
     
     try:
         # Run navigation validation
@@ -43,7 +44,7 @@ def main():
     except Exception as e:
         print(f"\n[ERROR] {str(e)}")
     finally:
-        browser.close()
+        context.close()
 
 
 if __name__ == "__main__":
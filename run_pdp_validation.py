@@ -3,7 +3,7 @@ Run Product Detail Page (PDP) validation
 Validates individual product pages like D3-S4620, D7-P5520, etc.
 """
 import sys
-from playwright.sync_api import sync_playwright
+from browser_session import NAVIGATION_TIMEOUT, SELECTOR_TIMEOUT, VIEWPORT, new_context
 from pdp_validator import PDPValidator
 from pdp_report_generator import PDPReportGenerator
 
@@ -19,10 +19,11 @@ def main():
     print(" " * 30 + "PRODUCT DETAIL PAGE (PDP) VALIDATION")
     print("=" * 100)
     
-    playwright = sync_playwright().start()
-    browser = playwright.chromium.launch(headless=False, args=['--no-sandbox'])
-    page = browser.new_page(viewport={'width': 1920, 'height': 1080})
-    page.set_default_timeout(120000)
+    # One context per run on the shared browser (Chromium is only launched once per process)
+    context = new_context(viewport=VIEWPORT)
+    page = context.new_page()
+    page.set_default_timeout(SELECTOR_TIMEOUT)
+    page.set_default_navigation_timeout(NAVIGATION_TIMEOUT)
     
     try:
         # Run validation
@@ -49,7 +50,7 @@ def main():
         import traceback
         traceback.print_exc()
     finally:
-        browser.close()
+        context.close()
 
 
 if __name__ == "__main__":
@@ -3,12 +3,39 @@ Run Product Series validation for all series (D3, D5, D7)
 """
 import sys
 import json
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from playwright.sync_api import sync_playwright
+from browser_session import NAVIGATION_TIMEOUT, SELECTOR_TIMEOUT, VIEWPORT, open_context
 from product_series_validator import ProductSeriesValidator
 from product_series_report_generator import ProductSeriesReportGenerator
 
 
+def validate_series(series_info: dict, series_data_path: str) -> dict:
+    """Validate one series page in its own Playwright instance and browser
+    
+    Sync Playwright objects cannot be shared between threads, so every worker
+    thread drives its own browser; the series pages load side by side.
+    """
+    series = series_info['series']
+    print(f"\n{'='*100}\nVALIDATING {series} SERIES\n{'='*100}")
+    
+    with sync_playwright() as playwright:
+        # Each series keeps its own profile (and disk cache) between runs
+        context = open_context(playwright, series.lower(), viewport=VIEWPORT)
+        try:
+            page = context.new_page()
+            page.set_default_timeout(SELECTOR_TIMEOUT)
+            page.set_default_navigation_timeout(NAVIGATION_TIMEOUT)
+            
+            validator = ProductSeriesValidator(page, series_data_path)
+            results = validator.validate_series_page(series_info['url'], series)
+            results['series_info'] = series_info
+            return results
+        finally:
+            context.close()
+
+
 def main():
     # Load series data
     series_data_path = 'product_series.json'
@@ -35,29 +62,18 @@ def main():
     print(" " * 30 + "PRODUCT SERIES VALIDATION")
     print("=" * 100)
     
-    playwright = sync_playwright().start()
-    browser = playwright.chromium.launch(headless=False, args=['--no-sandbox'])
-    page = browser.new_page(viewport={'width': 1920, 'height': 1080})
-    page.set_default_timeout(120000)
-    
     all_results = []
     
     try:
-        for series_info in series_to_validate:
-            series = series_info['series']
-            url = series_info['url']
-            
-            print(f"\n{'='*100}")
-            print(f"VALIDATING {series} SERIES")
-            print(f"{'='*100}")
-            
-            validator = ProductSeriesValidator(page, series_data_path)
-            results = validator.validate_series_page(url, series)
-            results['series_info'] = series_info
-            all_results.append(results)
-            
-            # Small delay between series
-            page.wait_for_timeout(2000)
+        # Validate all series concurrently, one thread (and browser) per series
+        with ThreadPoolExecutor(max_workers=len(series_to_validate)) as executor:
+            futures = [executor.submit(validate_series, series_info, series_data_path) for series_info in series_to_validate]
+            # Results keep the series order from product_series.json
+            for series_info, future in zip(series_to_validate, futures):
+                try:
+                    all_results.append(future.result())
+                except Exception as e:
+                    print(f"\n[ERROR] {series_info['series']} series validation failed: {str(e)}")
         
         # Generate Excel report
         if all_results:
@@ -84,8 +100,6 @@ def main():
         print(f"\n[ERROR] {str(e)}")
         import traceback
         traceback.print_exc()
-    finally:
-        browser.close()
 
 
 if __name__ == "__main__":
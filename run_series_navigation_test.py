@@ -2,7 +2,7 @@
 Run Series Navigation Test
 Tests navigation through Product menu to D3, D5, D7 series pages
 """
-from playwright.sync_api import sync_playwright
+from browser_session import NAVIGATION_TIMEOUT, SELECTOR_TIMEOUT, VIEWPORT, new_context
 from series_navigation_validator import SeriesNavigationValidator
 
 
@@ -15,10 +15,11 @@ def main():
     print("\nTesting navigation: Product > D3/D5/D7 Series")
     print("=" * 100)
     
-    playwright = sync_playwright().start()
-    browser = playwright.chromium.launch(headless=False, args=['--no-sandbox'])
-    page = browser.new_page(viewport={'width': 1920, 'height': 1080})
-    page.set_default_timeout(120000)
+    # One context per run on the shared browser (Chromium is only launched once per process)
+    context = new_context(viewport=VIEWPORT)
+    page = context.new_page()
+    page.set_default_timeout(SELECTOR_TIMEOUT)
+    page.set_default_navigation_timeout(NAVIGATION_TIMEOUT)
     
     try:
         validator = SeriesNavigationValidator(page)
@@ -41,7 +42,7 @@ def main():
         import traceback
         traceback.print_exc()
     finally:
-        browser.close()
+        context.close()
 
 
 if __name__ == "__main__":
@@ -0,0 +1,65 @@
+"""
+Shared Playwright browser for the validation runners
+
+The browser configured in Config is launched once per process; each run opens its
+own BrowserContext (isolated cookies/storage) on it and closes only that context.
+The browser itself is closed when the interpreter exits.
+"""
+import atexit
+from playwright.sync_api import Browser, BrowserContext, Route, sync_playwright
+from config import Config
+
+# Requests aborted when Config.BLOCK_HEAVY_RESOURCES is on (images are kept - they are validated)
+BLOCKED_RESOURCE_TYPES = ('media', 'font')
+BLOCKED_HOSTS = ('google-analytics', 'doubleclick', 'adobedtm', 'omtrdc')
+
+_playwright = None
+_browser = None
+
+
+def _route_request(route: Route):
+    request = route.request
+    if request.resource_type in BLOCKED_RESOURCE_TYPES or any(host in request.url for host in BLOCKED_HOSTS):
+        route.abort()
+    else:
+        route.continue_()
+
+
+def block_heavy_resources(context: BrowserContext):
+    """Abort media, web font and analytics requests for every page of the context"""
+    if Config.BLOCK_HEAVY_RESOURCES:
+        context.route("**/*", _route_request)
+
+
+def get_browser() -> Browser:
+    """Return the shared browser, launching it on first use"""
+    global _playwright, _browser
+    if _browser is None:
+        _playwright = sync_playwright().start()
+        # chromium, firefox or webkit - anything else falls back to chromium
+        browser_types = {
+            'chromium': _playwright.chromium,
+            'firefox': _playwright.firefox,
+            'webkit': _playwright.webkit,
+        }
+        _browser = browser_types.get(Config.BROWSER, _playwright.chromium).launch(
+            headless=Config.HEADLESS,
+            args=['--no-sandbox', '--disable-dev-shm-usage']
+        )
+        atexit.register(close_browser)
+    return _browser
+
+
+def close_browser():
+    """Close the shared browser and stop Playwright (safe to call more than once)"""
+    global _playwright, _browser
+    try:
+        if _browser is not None:
+            _browser.close()
+        if _playwright is not None:
+            _playwright.stop()
+    except Exception as e:
+        print(f"[WARNING] Could not close browser: {str(e)}")
+    finally:
+        _browser = None
+        _playwright = None
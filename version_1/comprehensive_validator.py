@@ -245,9 +245,11 @@ class ComprehensiveValidator:
     
     def _validate_element_sizes(self):
         """Validate element sizes"""
+        # Header and footer span the full page, so their expected width follows the configured viewport
+        page_width = Config.VIEWPORT['width']
         elements = [
-            {'selector': 'header', 'expected_width': 1920, 'expected_height': 100, 'tolerance': 50},
-            {'selector': 'footer', 'expected_width': 1920, 'expected_height': 200, 'tolerance': 100},
+            {'selector': 'header', 'expected_width': page_width, 'expected_height': 100, 'tolerance': 50},
+            {'selector': 'footer', 'expected_width': page_width, 'expected_height': 200, 'tolerance': 100},
         ]
         
         for elem in elements:
@@ -13,12 +13,24 @@ class Config:
     
     # Browser settings
     BROWSER = os.getenv('BROWSER', 'chromium')  # chromium, firefox, webkit
-    HEADLESS = os.getenv('HEADLESS', 'false').lower() == 'true'
-    VIEWPORT = {'width': 1920, 'height': 1080}
+    # Headless by default; SOLIDIGM_HEADED=1 (or HEADLESS=false) opens a browser window
+    HEADLESS = os.getenv('SOLIDIGM_HEADED') != '1' and os.getenv('HEADLESS', 'true').lower() == 'true'
+    VIEWPORT = {'width': 1366, 'height': 768}
+    # Abort media, web font and analytics requests (see browser_session.block_heavy_resources)
+    BLOCK_HEAVY_RESOURCES = os.getenv('BLOCK_HEAVY_RESOURCES', 'true').lower() == 'true'
     
-    # Timeouts (in milliseconds)
-    TIMEOUT = 60000  # Increased to 60 seconds
-    NAVIGATION_TIMEOUT = 60000  # Increased to 60 seconds
+    # Timeouts (in milliseconds) - element actions/waits fail fast, only navigation gets longer.
+    # Pass timeout= on a single call for an element that is known to be slow.
+    SELECTOR_TIMEOUT = 15000
+    NAVIGATION_TIMEOUT = 45000
+    
+    # Browser worker processes used by run_validation.py (capped at the number of URLs)
+    MAX_WORKERS = int(os.getenv('MAX_WORKERS', '8'))
+    
+    # Wait for the network to go idle (up to SETTLE_TIMEOUT) after navigation instead of
+    # always sleeping SETTLE_TIMEOUT; set SMART_WAIT=false to restore the fixed sleep
+    SMART_WAIT = os.getenv('SMART_WAIT', 'true').lower() == 'true'
+    SETTLE_TIMEOUT = 3000
     
     # Screenshot settings
     SCREENSHOT_DIR = 'screenshots'
@@ -15,10 +15,10 @@ class ExcelReportGenerator:
         if not os.path.exists(output_dir):
             os.makedirs(output_dir)
     
-    def generate_excel_report(self, validation_results: Dict) -> str:
-        """Generate Excel report"""
+    def generate_excel_report(self, validation_results: Dict, suffix: str = "") -> str:
+        """Generate Excel report (suffix is appended to the file name)"""
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        filename = f"{self.output_dir}/validation_report_{timestamp}.xlsx"
+        filename = f"{self.output_dir}/validation_report_{timestamp}{suffix}.xlsx"
         
         wb = Workbook()
         wb.remove(wb.active)  # Remove default sheet
@@ -3,307 +3,343 @@ Report Generator for validation results
 """
 import json
 import os
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
 from typing import Dict, List
 
+# Report files are written with many short writes - a 1 MB buffer turns them into a few large ones
+_WRITE_BUFFER = 1 << 20
+
+try:
+    import orjson
+except ImportError:  # orjson is optional - the JSON report falls back to the json module
+    orjson = None
+
+# HTML report skeleton - the invariant markup is built once, only the values are filled in per report
+_HTML_HEAD = """
+<!DOCTYPE html>
+<html>
+<head>
+    <meta charset="UTF-8">
+<title>Solidigm Validation Report</title>
+    <style>
+        body {{ font-family: Arial, sans-serif; margin: 20px; background: #f5f5f5; }}
+        .container {{ background: white; padding: 30px; border-radius: 8px; box-shadow: 0 2px 4px rgba(0,0,0,0.1); }}
+        h1 {{ color: #333; border-bottom: 3px solid #007bff; padding-bottom: 10px; }}
+        h2 {{ color: #555; margin-top: 30px; }}
+        .summary {{ background: #f8f9fa; padding: 20px; border-radius: 5px; margin: 20px 0; }}
+        .metric {{ display: inline-block; margin: 10px 20px; padding: 10px 20px; background: #fff; border-radius: 5px; }}
+        .metric-value {{ font-size: 24px; font-weight: bold; color: #007bff; }}
+        .metric-label {{ font-size: 14px; color: #666; }}
+        .passed {{ color: #28a745; }}
+        .failed {{ color: #dc3545; }}
+        table {{ width: 100%; border-collapse: collapse; margin: 20px 0; }}
+        th, td {{ padding: 12px; text-align: left; border-bottom: 1px solid #ddd; }}
+        th {{ background: #007bff; color: white; }}
+        tr:hover {{ background: #f5f5f5; }}
+        .badge {{ padding: 4px 8px; border-radius: 4px; font-size: 12px; }}
+        .badge-success {{ background: #d4edda; color: #155724; }}
+        .badge-danger {{ background: #f8d7da; color: #721c24; }}
+        ul {{ line-height: 1.8; }}
+        li {{ margin: 5px 0; }}
+    </style>
+</head>
+<body>
+    <div class="container">
+        <h1>🔍 Solidigm Validation Report</h1>
+        <p><strong>Generated:</strong> {timestamp}</p>
+        <p><strong>URL:</strong> {url}</p>
+        <p><strong>Locale:</strong> {locale}</p>
+
+        <h2>Summary</h2>
+        <div class="summary">
+"""
+
+_HTML_ERROR = """
+    <div style="background: #f8d7da; color: #721c24; padding: 20px; border-radius: 5px; margin: 20px 0;">
+        <h3>Error Occurred</h3>
+        <p><strong>Error Message:</strong> {error}</p>
+    </div>
+"""
+
+_HTML_METRIC = """
+        <div class="metric">
+            <div class="metric-value{css_class}">{value}</div>
+            <div class="metric-label">{label}</div>
+        </div>"""
+
+_HTML_TABLE_HEAD = """
+    <h2>UI Validation Details</h2>
+    <table>
+        <tr>
+            <th>Category</th>
+            <th>Total</th>
+            <th>Passed</th>
+            <th>Failed</th>
+            <th>Status</th>
+        </tr>"""
+
+_HTML_TABLE_ROW = """
+        <tr>
+            <td>{category}</td>
+            <td>{total}</td>
+            <td>{passed}</td>
+            <td>{failed}</td>
+            <td><span class="badge badge-{status_class}">{status}</span></td>
+        </tr>"""
+
+_HTML_BROKEN_LINK = """
+        <li>
+            <strong>{text}</strong><br>
+            <small>{url}</small><br>
+            <span class="badge badge-danger">Status: {status_code}</span>
+        </li>"""
+
+_HTML_FOOT = """
+    </div>
+</body>
+</html>
+"""
+
 
 class ReportGenerator:
     def __init__(self, output_dir: str = "reports"):
         self.output_dir = output_dir
-        if not os.path.exists(output_dir):
-            os.makedirs(output_dir)
+        os.makedirs(output_dir, exist_ok=True)
     
-    def generate_report(self, validation_results: Dict) -> str:
-        """Generate comprehensive external report"""
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        filename = f"{self.output_dir}/validation_report_{timestamp}.txt"
+    def generate_report(self, validation_results: Dict, html: bool = False, suffix: str = "") -> str:
+        """Generate comprehensive external report (text + JSON, and the HTML report when html=True)
         
-        with open(filename, 'w', encoding='utf-8') as f:
-            f.write(self._generate_text_report(validation_results))
+        suffix is appended to the file names to keep reports written within the same second apart.
+        """
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        filename = f"{self.output_dir}/validation_report_{timestamp}{suffix}.txt"
+        json_filename = f"{self.output_dir}/validation_report_{timestamp}{suffix}.json"
         
-        # Also generate JSON report
-        json_filename = f"{self.output_dir}/validation_report_{timestamp}.json"
-        with open(json_filename, 'w', encoding='utf-8') as f:
-            json.dump(validation_results, f, indent=2, ensure_ascii=False)
+        # The reports only read validation_results, so they are written side by side
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            futures = [
+                executor.submit(self._write_text, filename, validation_results),
+                executor.submit(self._write_json, json_filename, validation_results),
+            ]
+            if html:
+                futures.append(executor.submit(self.generate_html_report, validation_results, suffix))
+            for future in as_completed(futures):
+                future.result()
         
         print(f"\n[REPORT] Generated: {filename}")
         print(f"[REPORT] JSON report generated: {json_filename}")
         
         return filename
     
-    def _generate_text_report(self, results: Dict) -> str:
-        """Generate text-based report"""
-        report_lines = []
+    def _write_text(self, filename: str, results: Dict):
+        """Write the text report file"""
+        with open(filename, 'w', encoding='utf-8', buffering=_WRITE_BUFFER) as f:
+            self._write_text_report(results, f)
+    
+    def _write_json(self, filename: str, results: Dict):
+        """Write the JSON report file (with orjson when it is installed)"""
+        if orjson is not None:
+            # orjson serializes straight to UTF-8 bytes, like json.dump(..., ensure_ascii=False)
+            with open(filename, 'wb', buffering=_WRITE_BUFFER) as f:
+                f.write(orjson.dumps(results, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
+            return
+        with open(filename, 'w', encoding='utf-8', buffering=_WRITE_BUFFER) as f:
+            json.dump(results, f, indent=2, ensure_ascii=False)
+    
+    @staticmethod
+    def _write_section(f, title: str, lines):
+        """Write a section title and rule followed by each line (lines can be a generator)"""
+        write = f.write
+        write(title)
+        write("\n")
+        write("-" * 100)
+        write("\n")
+        for text in lines:
+            write(text)
+            write("\n")
+    
+    def _write_text_report(self, results: Dict, f):
+        """Write the text-based report section by section to an open file"""
+        # Look every section's data up once
+        validation_info = results.get('validation_info', {})
+        summary = results.get('overall_summary', {})
+        ui_summary = results.get('ui_validation', {}).get('summary', {})
+        by_category = ui_summary.get('by_category', {})
+        link_result = results.get('link_validation', {})
+        broken_details = link_result.get('broken_details', [])
+        
+        write = f.write
+        section = self._write_section
+        
+        def line(text: str = ""):
+            write(text)
+            write("\n")
+        
+        def footer():
+            line("=" * 100)
+            line(f"Report generated at: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+            line("=" * 100)
         
         # Header
-        report_lines.append("=" * 100)
-        report_lines.append(" " * 30 + "SOLIDIGM VALIDATION REPORT")
-        report_lines.append("=" * 100)
-        report_lines.append("")
+        line("=" * 100)
+        line(" " * 30 + "SOLIDIGM VALIDATION REPORT")
+        line("=" * 100)
+        line()
         
         # Validation Info
-        report_lines.append("VALIDATION INFORMATION")
-        report_lines.append("-" * 100)
-        if 'validation_info' in results:
-            report_lines.append(f"URL: {results['validation_info'].get('url', 'N/A')}")
-            report_lines.append(f"Locale: {results['validation_info'].get('locale', 'N/A')}")
-            report_lines.append(f"Timestamp: {results['validation_info'].get('timestamp', 'N/A')}")
-        else:
-            report_lines.append("URL: N/A")
-            report_lines.append("Locale: N/A")
-            report_lines.append("Timestamp: N/A")
-        report_lines.append("")
+        section(f, "VALIDATION INFORMATION", (
+            f"URL: {validation_info.get('url', 'N/A')}",
+            f"Locale: {validation_info.get('locale', 'N/A')}",
+            f"Timestamp: {validation_info.get('timestamp', 'N/A')}",
+            "",
+        ))
         
         # Check if there was an error
         if 'error' in results:
-            report_lines.append("ERROR OCCURRED")
-            report_lines.append("-" * 100)
-            report_lines.append(f"Error Message: {results['error']}")
-            report_lines.append("")
-            report_lines.append("=" * 100)
-            report_lines.append(f"Report generated at: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-            report_lines.append("=" * 100)
-            return "\n".join(report_lines)
+            section(f, "ERROR OCCURRED", (f"Error Message: {results['error']}", ""))
+            footer()
+            return
         
         # Overall Summary
-        report_lines.append("OVERALL SUMMARY")
-        report_lines.append("-" * 100)
-        summary = results.get('overall_summary', {})
-        report_lines.append(f"Total UI Validations Performed: {summary.get('total_ui_validations', 0)}")
-        report_lines.append(f"UI Validations Passed: {summary.get('passed_ui_validations', 0)}")
-        report_lines.append(f"UI Validations Failed: {summary.get('failed_ui_validations', 0)}")
-        report_lines.append(f"Total Links Checked: {summary.get('total_links', 0)}")
-        report_lines.append(f"Valid Links: {summary.get('valid_links', 0)}")
-        report_lines.append(f"Broken Links: {summary.get('broken_links', 0)}")
-        report_lines.append("")
+        # Clean runs (no failures, no broken links) skip the failure sections entirely
+        failed_ui = summary.get('failed_ui_validations', 0)
+        has_failures = failed_ui > 0 or summary.get('broken_links', 0) > 0
+        section(f, "OVERALL SUMMARY", (
+            f"Total UI Validations Performed: {summary.get('total_ui_validations', 0)}",
+            f"UI Validations Passed: {summary.get('passed_ui_validations', 0)}",
+            f"UI Validations Failed: {summary.get('failed_ui_validations', 0)}",
+            f"Total Links Checked: {summary.get('total_links', 0)}",
+            f"Valid Links: {summary.get('valid_links', 0)}",
+            f"Broken Links: {summary.get('broken_links', 0)}",
+            "",
+        ))
         
         # UI Validation Details
-        ui_result = results.get('ui_validation', {})
-        if 'summary' in ui_result:
-            ui_summary = ui_result['summary']
-            report_lines.append("UI VALIDATION DETAILS")
-            report_lines.append("-" * 100)
-            report_lines.append(f"Total UI Checks: {ui_summary['total_validations']}")
-            report_lines.append(f"Passed: {ui_summary['passed']}")
-            report_lines.append(f"Failed: {ui_summary['failed']}")
-            report_lines.append(f"Pass Percentage: {ui_summary['pass_percentage']}%")
-            report_lines.append("")
+        if ui_summary:
+            section(f, "UI VALIDATION DETAILS", (
+                f"Total UI Checks: {ui_summary['total_validations']}",
+                f"Passed: {ui_summary['passed']}",
+                f"Failed: {ui_summary['failed']}",
+                f"Pass Percentage: {ui_summary['pass_percentage']}%",
+                "",
+            ))
             
             # Category Breakdown
-            report_lines.append("CATEGORY BREAKDOWN")
-            report_lines.append("-" * 100)
-            for category, data in ui_summary['by_category'].items():
-                if data['total'] > 0:
-                    report_lines.append(f"\n{category.upper().replace('_', ' ')}:")
-                    report_lines.append(f"  Total: {data['total']}")
-                    report_lines.append(f"  Passed: {data['passed']}")
-                    report_lines.append(f"  Failed: {data['failed']}")
-                    
-                    # Show failure details
-                    if data['failed'] > 0 and data['details']:
-                        report_lines.append("  Failure Details:")
-                        for detail in data['details'][:5]:  # Show first 5 failures
-                            if isinstance(detail, dict) and 'details' in detail:
-                                report_lines.append(f"    - {detail['details']}")
-            report_lines.append("")
+            section(f, "CATEGORY BREAKDOWN", self._category_lines(by_category))
+            line()
         
         # Link Validation Details
-        link_result = results.get('link_validation', {})
-        report_lines.append("LINK VALIDATION DETAILS")
-        report_lines.append("-" * 100)
-        report_lines.append(f"Total Links: {link_result.get('total_links', 0)}")
-        report_lines.append(f"Valid Links: {link_result.get('valid_links', 0)}")
-        report_lines.append(f"Broken Links: {link_result.get('broken_links', 0)}")
+        section(f, "LINK VALIDATION DETAILS", (
+            f"Total Links: {link_result.get('total_links', 0)}",
+            f"Valid Links: {link_result.get('valid_links', 0)}",
+            f"Broken Links: {link_result.get('broken_links', 0)}",
+        ))
         
         # Show broken links
-        if link_result.get('broken_links', 0) > 0 and link_result.get('broken_details', []):
-            broken_details = link_result.get('broken_details', [])
-            report_lines.append("\nBROKEN LINKS:")
-            report_lines.append("-" * 100)
-            for broken in broken_details[:10]:  # Show first 10
-                report_lines.append(f"  URL: {broken['url']}")
-                report_lines.append(f"  Text: {broken['text']}")
-                report_lines.append(f"  Status: {broken['status_code']}")
-                report_lines.append(f"  Message: {broken['message']}")
-                report_lines.append("")
+        if link_result.get('broken_links', 0) > 0 and broken_details:
+            section(f, "\nBROKEN LINKS:", (
+                text
+                for broken in broken_details[:10]  # Show first 10
+                for text in (
+                    f"  URL: {broken['url']}",
+                    f"  Text: {broken['text']}",
+                    f"  Status: {broken['status_code']}",
+                    f"  Message: {broken['message']}",
+                    "",
+                )
+            ))
         
-        # Failure Summary
-        if summary.get('failed_ui_validations', 0) > 0 or summary.get('broken_links', 0) > 0:
-            report_lines.append("")
-            report_lines.append("FAILURE SUMMARY")
-            report_lines.append("-" * 100)
-            
-            ui_details = ui_result['summary']['by_category']
-            failures = []
-            
-            for category, data in ui_details.items():
-                if data['failed'] > 0:
-                    failures.append({
-                        'category': category,
-                        'count': data['failed'],
-                        'issues': [d.get('details', '') for d in data['details'] if d.get('details')]
-                    })
-            
-            for failure in failures:
-                report_lines.append(f"\n{failure['category'].upper().replace('_', ' ')} - {failure['count']} failures:")
-                for issue in failure['issues'][:3]:  # Show first 3 issues
-                    report_lines.append(f"  • {issue}")
+        # Failure Summary (categories are only walked when a UI validation failed)
+        if has_failures:
+            line()
+            section(f, "FAILURE SUMMARY", self._failure_lines(by_category) if failed_ui > 0 else ())
         
         # Footer
-        report_lines.append("")
-        report_lines.append("=" * 100)
-        report_lines.append(f"Report generated at: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-        report_lines.append("=" * 100)
-        
-        return "\n".join(report_lines)
+        line()
+        footer()
+    
+    @staticmethod
+    def _category_lines(by_category: Dict):
+        """Yield the category breakdown lines"""
+        for category, data in by_category.items():
+            if data['total'] > 0:
+                yield f"\n{category.upper().replace('_', ' ')}:"
+                yield f"  Total: {data['total']}"
+                yield f"  Passed: {data['passed']}"
+                yield f"  Failed: {data['failed']}"
+                
+                # Show failure details
+                if data['failed'] > 0 and data['details']:
+                    yield "  Failure Details:"
+                    for detail in data['details'][:5]:  # Show first 5 failures
+                        if isinstance(detail, dict) and 'details' in detail:
+                            yield f"    - {detail['details']}"
+    
+    @staticmethod
+    def _failure_lines(by_category: Dict):
+        """Yield the failure summary lines (first 3 issues per failed category)"""
+        for category, data in by_category.items():
+            if data['failed'] > 0:
+                issues = [d.get('details', '') for d in data['details'] if d.get('details')]
+                yield f"\n{category.upper().replace('_', ' ')} - {data['failed']} failures:"
+                for issue in issues[:3]:  # Show first 3 issues
+                    yield f"  • {issue}"
     
-    def generate_html_report(self, validation_results: Dict) -> str:
+    def generate_html_report(self, validation_results: Dict, suffix: str = "") -> str:
         """Generate HTML-based report"""
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        filename = f"{self.output_dir}/validation_report_{timestamp}.html"
+        filename = f"{self.output_dir}/validation_report_{timestamp}{suffix}.html"
         
-        html_content = f"""
-        <!DOCTYPE html>
-        <html>
-        <head>
-            <meta charset="UTF-8">
-        <title>Solidigm Validation Report</title>
-            <style>
-                body {{ font-family: Arial, sans-serif; margin: 20px; background: #f5f5f5; }}
-                .container {{ background: white; padding: 30px; border-radius: 8px; box-shadow: 0 2px 4px rgba(0,0,0,0.1); }}
-                h1 {{ color: #333; border-bottom: 3px solid #007bff; padding-bottom: 10px; }}
-                h2 {{ color: #555; margin-top: 30px; }}
-                .summary {{ background: #f8f9fa; padding: 20px; border-radius: 5px; margin: 20px 0; }}
-                .metric {{ display: inline-block; margin: 10px 20px; padding: 10px 20px; background: #fff; border-radius: 5px; }}
-                .metric-value {{ font-size: 24px; font-weight: bold; color: #007bff; }}
-                .metric-label {{ font-size: 14px; color: #666; }}
-                .passed {{ color: #28a745; }}
-                .failed {{ color: #dc3545; }}
-                table {{ width: 100%; border-collapse: collapse; margin: 20px 0; }}
-                th, td {{ padding: 12px; text-align: left; border-bottom: 1px solid #ddd; }}
-                th {{ background: #007bff; color: white; }}
-                tr:hover {{ background: #f5f5f5; }}
-                .badge {{ padding: 4px 8px; border-radius: 4px; font-size: 12px; }}
-                .badge-success {{ background: #d4edda; color: #155724; }}
-                .badge-danger {{ background: #f8d7da; color: #721c24; }}
-                ul {{ line-height: 1.8; }}
-                li {{ margin: 5px 0; }}
-            </style>
-        </head>
-        <body>
-            <div class="container">
-                <h1>🔍 Solidigm Validation Report</h1>
-                <p><strong>Generated:</strong> {validation_results['validation_info']['timestamp']}</p>
-                <p><strong>URL:</strong> {validation_results['validation_info']['url']}</p>
-                <p><strong>Locale:</strong> {validation_results['validation_info']['locale']}</p>
-                
-                <h2>Summary</h2>
-                <div class="summary">
-        """
+        validation_info = validation_results['validation_info']
+        overall_summary = validation_results.get('overall_summary', {})
+        by_category = validation_results.get('ui_validation', {}).get('summary', {}).get('by_category', {})
+        broken_details = validation_results.get('link_validation', {}).get('broken_details', [])
+        head = _HTML_HEAD.format(timestamp=validation_info['timestamp'], url=validation_info['url'], locale=validation_info['locale'])
         
         # Check if there was an error
         if 'error' in validation_results:
-            html_content += f"""
-                <div style="background: #f8d7da; color: #721c24; padding: 20px; border-radius: 5px; margin: 20px 0;">
-                    <h3>Error Occurred</h3>
-                    <p><strong>Error Message:</strong> {validation_results['error']}</p>
-                </div>
-            """
+            body = _HTML_ERROR.format(error=validation_results['error'])
         else:
-            overall_summary = validation_results.get('overall_summary', {})
-            html_content += f"""
-                    <div class="metric">
-                        <div class="metric-value">{overall_summary.get('total_ui_validations', 0)}</div>
-                        <div class="metric-label">UI Validations</div>
-                    </div>
-                    <div class="metric">
-                        <div class="metric-value passed">{overall_summary.get('passed_ui_validations', 0)}</div>
-                        <div class="metric-label">Passed</div>
-                    </div>
-                    <div class="metric">
-                        <div class="metric-value failed">{overall_summary.get('failed_ui_validations', 0)}</div>
-                        <div class="metric-label">Failed</div>
-                    </div>
-                    <div class="metric">
-                        <div class="metric-value">{overall_summary.get('total_links', 0)}</div>
-                        <div class="metric-label">Total Links</div>
-                    </div>
-                    <div class="metric">
-                        <div class="metric-value failed">{overall_summary.get('broken_links', 0)}</div>
-                        <div class="metric-label">Broken Links</div>
-                    </div>
-                </div>
-        """
-        
-        if 'error' in validation_results:
-            html_content += """
-            </div>
-        </body>
-        </html>
-        """
-            with open(filename, 'w', encoding='utf-8') as f:
-                f.write(html_content)
-            print(f"[REPORT] HTML report generated: {filename}")
-            return filename
-        
-        html_content += """
-        """
-        
-        # Add details sections
-        html_content += """
-                <h2>UI Validation Details</h2>
-                <table>
-                    <tr>
-                        <th>Category</th>
-                        <th>Total</th>
-                        <th>Passed</th>
-                        <th>Failed</th>
-                        <th>Status</th>
-                    </tr>
-        """
-        
-        ui_summary = validation_results.get('ui_validation', {}).get('summary', {}).get('by_category', {})
-        for category, data in ui_summary.items():
-            if data['total'] > 0:
-                status_class = 'passed' if data['failed'] == 0 else 'failed'
-                html_content += f"""
-                    <tr>
-                        <td>{category.replace('_', ' ').title()}</td>
-                        <td>{data['total']}</td>
-                        <td>{data['passed']}</td>
-                        <td>{data['failed']}</td>
-                        <td><span class="badge badge-{status_class}">{'✓ Pass' if data['failed'] == 0 else '✗ Fail'}</span></td>
-                    </tr>
-                """
-        
-        html_content += "</table>"
-        
-        # Add broken links section
-        broken_details = validation_results.get('link_validation', {}).get('broken_details', [])
-        if broken_details:
-            html_content += """
-                <h2>Broken Links</h2>
-                <ul>
-            """
-            for broken in broken_details[:10]:
-                html_content += f"""
-                    <li>
-                        <strong>{broken['text']}</strong><br>
-                        <small>{broken['url']}</small><br>
-                        <span class="badge badge-danger">Status: {broken['status_code']}</span>
-                    </li>
-                """
-            html_content += "</ul>"
-        
-        html_content += """
-            </div>
-        </body>
-        </html>
-        """
+            metrics = (
+                (overall_summary.get('total_ui_validations', 0), '', 'UI Validations'),
+                (overall_summary.get('passed_ui_validations', 0), ' passed', 'Passed'),
+                (overall_summary.get('failed_ui_validations', 0), ' failed', 'Failed'),
+                (overall_summary.get('total_links', 0), '', 'Total Links'),
+                (overall_summary.get('broken_links', 0), ' failed', 'Broken Links'),
+            )
+            parts = [_HTML_METRIC.format(value=value, css_class=css_class, label=label) for value, css_class, label in metrics]
+            parts.append("\n    </div>\n")
+            
+            # UI validation details table
+            parts.append(_HTML_TABLE_HEAD)
+            parts.extend(
+                _HTML_TABLE_ROW.format(
+                    category=category.replace('_', ' ').title(),
+                    total=data['total'],
+                    passed=data['passed'],
+                    failed=data['failed'],
+                    status_class='passed' if data['failed'] == 0 else 'failed',
+                    status='✓ Pass' if data['failed'] == 0 else '✗ Fail',
+                )
+                for category, data in by_category.items() if data['total'] > 0
+            )
+            parts.append("\n    </table>\n")
+            
+            # Broken links section
+            if broken_details:
+                parts.append("\n    <h2>Broken Links</h2>\n    <ul>")
+                parts.extend(
+                    _HTML_BROKEN_LINK.format(text=broken['text'], url=broken['url'], status_code=broken['status_code'])
+                    for broken in broken_details[:10]
+                )
+                parts.append("\n    </ul>\n")
+            body = "".join(parts)
         
-        with open(filename, 'w', encoding='utf-8') as f:
-            f.write(html_content)
+        with open(filename, 'w', encoding='utf-8', buffering=_WRITE_BUFFER) as f:
+            f.write(head)
+            f.write(body)
+            f.write(_HTML_FOOT)
         
         print(f"[REPORT] HTML report generated: {filename}")
         return filename
-
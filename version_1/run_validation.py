@@ -3,7 +3,9 @@ Main script to run validation from notepad/input file
 """
 import sys
 import os
-from playwright.sync_api import sync_playwright
+from multiprocessing import Pool
+from multiprocessing.util import Finalize
+from browser_session import block_heavy_resources, close_browser, get_browser
 from comprehensive_validator import ComprehensiveValidator
 from report_generator import ReportGenerator
 from excel_report_generator import ExcelReportGenerator
@@ -14,6 +16,7 @@ class ValidationRunner:
     def __init__(self):
         self.config = Config()
         self.browser = None
+        self.context = None
         self.page = None
         self.results = []
     
@@ -25,60 +28,45 @@ class ValidationRunner:
             print(f"[ERROR] File not found: {filename}")
             return urls_config
         
+        # Iterate the file instead of reading every line into a list first
         with open(filename, 'r', encoding='utf-8') as f:
-            lines = f.readlines()
-        
-        for line_num, line in enumerate(lines, 1):
-            line = line.strip()
-            
-            # Skip empty lines and comments
-            if not line or line.startswith('#'):
-                continue
-            
-            # Format: URL | locale
-            # Example: https://www.solidigm.com/ | US/EN
-            if '|' in line:
-                parts = line.split('|')
-                url = parts[0].strip()
-                locale = parts[1].strip() if len(parts) > 1 else "US/EN"
-            else:
-                url = line.strip()
-                locale = "US/EN"  # Default locale
-            
-            if url:
-                urls_config.append({
-                    'url': url,
-                    'locale': locale,
-                    'line': line_num
-                })
+            for line_num, line in enumerate(f, 1):
+                line = line.strip()
+                
+                # Skip empty lines and comments
+                if not line or line[0] == '#':
+                    continue
+                
+                # Format: URL | locale
+                # Example: https://www.solidigm.com/ | US/EN
+                url, separator, locale = line.partition('|')
+                url = url.strip()
+                # Only the text up to a second '|' is the locale, like split('|')[1]
+                locale = locale.partition('|')[0].strip() if separator else "US/EN"  # Default locale
+                
+                if url:
+                    urls_config.append({
+                        'url': url,
+                        'locale': locale,
+                        'line': line_num
+                    })
         
         return urls_config
     
     def setup_browser(self):
-        """Initialize browser"""
-        playwright = sync_playwright().start()
-        
-        if self.config.BROWSER == 'chromium':
-            browser = playwright.chromium
-        elif self.config.BROWSER == 'firefox':
-            browser = playwright.firefox
-        elif self.config.BROWSER == 'webkit':
-            browser = playwright.webkit
-        else:
-            browser = playwright.chromium
-        
-        self.browser = browser.launch(
-            headless=self.config.HEADLESS,
-            args=['--no-sandbox', '--disable-dev-shm-usage']
-        )
-        
-        self.page = self.browser.new_page(viewport=self.config.VIEWPORT)
-        self.page.set_default_timeout(self.config.TIMEOUT)
+        """Open a context on the shared browser (launched once per process)"""
+        self.browser = get_browser()
+        self.context = self.browser.new_context(viewport=self.config.VIEWPORT)
+        block_heavy_resources(self.context)
+        self.page = self.context.new_page()
+        self.page.set_default_timeout(self.config.SELECTOR_TIMEOUT)
+        self.page.set_default_navigation_timeout(self.config.NAVIGATION_TIMEOUT)
     
     def close_browser(self):
-        """Close browser"""
-        if self.browser:
-            self.browser.close()
+        """Close this run's context (the shared browser is closed at exit)"""
+        if self.context:
+            self.context.close()
+            self.context = None
     
     def validate_url(self, url: str, locale: str = "US/EN") -> dict:
         """Validate a single URL"""
@@ -91,8 +79,14 @@ class ValidationRunner:
             # Navigate to the page
             print(f"\n[NAVIGATING] {url}...")
             self.page.goto(url, timeout=self.config.NAVIGATION_TIMEOUT, wait_until='domcontentloaded')
-            # Wait a bit for page to fully load
-            self.page.wait_for_timeout(3000)
+            # Let dynamic content settle - returns as soon as the network is idle, never later than before
+            if self.config.SMART_WAIT:
+                try:
+                    self.page.wait_for_load_state('networkidle', timeout=self.config.SETTLE_TIMEOUT)
+                except Exception:
+                    pass  # Still busy after SETTLE_TIMEOUT (analytics, polling) - same as the old fixed wait
+            else:
+                self.page.wait_for_timeout(self.config.SETTLE_TIMEOUT)
             
             title = self.page.title()
             print(f"[OK] Page loaded: {title}")
@@ -135,34 +129,34 @@ class ValidationRunner:
         
         print(f"[OK] Found {len(urls_config)} URL(s) to validate")
         
-        # Setup browser
-        print("\n[INFO] Initializing browser...")
-        self.setup_browser()
-        
-        # Generate reports directory
+        # Report generators are created once and reused for every URL
         report_gen = ReportGenerator()
+        excel_gen = ExcelReportGenerator()
         
-        # Validate each URL
-        for idx, url_config in enumerate(urls_config, 1):
-            print(f"\n[{idx}/{len(urls_config)}] Processing URL...")
-            
-            result = self.validate_url(url_config['url'], url_config['locale'])
-            self.results.append(result)
-            
-            # Generate individual reports
-            report_gen.generate_report(result)
-            report_gen.generate_html_report(result)
-            
-            # Generate Excel report
-            excel_gen = ExcelReportGenerator()
-            excel_gen.generate_excel_report(result)
+        # Validate the URLs in worker processes, each driving its own browser (sync Playwright
+        # can't be shared between threads). imap returns the results in input file order.
+        processes = min(self.config.MAX_WORKERS, len(urls_config))
+        print(f"\n[INFO] Initializing {processes} browser worker(s)...")
+        pool = Pool(processes=processes, initializer=_init_worker)
+        try:
+            for idx, result in enumerate(pool.imap(validate_url_worker, urls_config), 1):
+                print(f"\n[{idx}/{len(urls_config)}] Processing URL...")
+                self.results.append(result)
+                
+                # Generate individual reports (text, JSON and HTML are written concurrently);
+                # the suffix keeps reports of URLs finishing in the same second apart
+                report_gen.generate_report(result, html=True, suffix=f"_{idx}")
+                
+                # Generate Excel report
+                excel_gen.generate_excel_report(result, suffix=f"_{idx}")
+        finally:
+            # close + join (not terminate) so the workers exit normally and close their browsers
+            pool.close()
+            pool.join()
         
         # Generate summary report
         self._generate_summary_report(report_gen)
         
-        # Cleanup
-        self.close_browser()
-        
         # Print final summary
         print("\n" + "="*100)
         print("[SUCCESS] VALIDATION COMPLETE")
@@ -177,25 +171,26 @@ class ValidationRunner:
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         filename = f"reports/summary_report_{timestamp}.txt"
         
+        # Build the whole report (one block per URL) and write it with a single call
+        parts = ["=" * 100 + "\n" + " " * 30 + "VALIDATION SUMMARY REPORT\n" + "=" * 100 + "\n\n"]
+        for idx, result in enumerate(self.results, 1):
+            validation_info = result['validation_info']
+            if 'error' in result:
+                parts.append(f"\n[{idx}] {validation_info['url']}\n"
+                             f"    [ERROR] Error: {result['error']}\n\n")
+            else:
+                summary = result['overall_summary']
+                parts.append(f"\n[{idx}] {validation_info['url']}\n"
+                             f"    Locale: {validation_info['locale']}\n"
+                             f"    UI Validations: {summary['total_ui_validations']} total, "
+                             f"{summary['passed_ui_validations']} passed, "
+                             f"{summary['failed_ui_validations']} failed\n"
+                             f"    Links: {summary['total_links']} total, "
+                             f"{summary['valid_links']} valid, "
+                             f"{summary['broken_links']} broken\n\n")
+        
         with open(filename, 'w', encoding='utf-8') as f:
-            f.write("="*100 + "\n")
-            f.write(" " * 30 + "VALIDATION SUMMARY REPORT\n")
-            f.write("="*100 + "\n\n")
-            
-            for idx, result in enumerate(self.results, 1):
-                if 'error' in result:
-                    f.write(f"\n[{idx}] {result['validation_info']['url']}\n")
-                    f.write(f"    [ERROR] Error: {result['error']}\n\n")
-                else:
-                    summary = result['overall_summary']
-                    f.write(f"\n[{idx}] {result['validation_info']['url']}\n")
-                    f.write(f"    Locale: {result['validation_info']['locale']}\n")
-                    f.write(f"    UI Validations: {summary['total_ui_validations']} total, "
-                            f"{summary['passed_ui_validations']} passed, "
-                            f"{summary['failed_ui_validations']} failed\n")
-                    f.write(f"    Links: {summary['total_links']} total, "
-                            f"{summary['valid_links']} valid, "
-                            f"{summary['broken_links']} broken\n\n")
+            f.write("".join(parts))
         
         print(f"\n[REPORT] Summary report generated: {filename}")
     
@@ -216,6 +211,21 @@ class ValidationRunner:
                 print(f"     Links: {summary['valid_links']} valid, {summary['broken_links']} broken")
 
 
+def _init_worker():
+    """Close the worker's browser when the pool shuts the worker process down"""
+    Finalize(None, close_browser, exitpriority=10)
+
+
+def validate_url_worker(url_config: dict) -> dict:
+    """Validate one URL in a pool worker process (the worker's browser is reused across its URLs)"""
+    runner = ValidationRunner()
+    runner.setup_browser()
+    try:
+        return runner.validate_url(url_config['url'], url_config['locale'])
+    finally:
+        runner.close_browser()
+
+
 def main():
     """Main entry point"""
     if len(sys.argv) < 2:
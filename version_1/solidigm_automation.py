@@ -38,7 +38,7 @@ class SolidigmAutomation:
         
         # Create page
         self.page = self.browser.new_page(viewport=self.config.VIEWPORT)
-        self.page.set_default_timeout(self.config.TIMEOUT)
+        self.page.set_default_timeout(self.config.SELECTOR_TIMEOUT)
         
         # Initialize validators
         self.ui_validator = UIValidator(self.page)
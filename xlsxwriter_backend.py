@@ -0,0 +1,174 @@
+"""
+xlsxwriter backend for the Excel report generators
+
+Wraps xlsxwriter's constant_memory mode behind the small part of openpyxl's
+write-only worksheet API the report generators use (ws.append, merged_cells,
+column_dimensions), so the same sheet builders can stream rows straight to disk.
+"""
+from typing import Dict, List, Tuple
+from openpyxl.utils import column_index_from_string, range_boundaries
+
+try:
+    import xlsxwriter
+except ImportError:  # xlsxwriter is optional - callers fall back to openpyxl
+    xlsxwriter = None
+
+
+def xlsxwriter_available() -> bool:
+    """Return True if the xlsxwriter package can be used"""
+    return xlsxwriter is not None
+
+
+def _hex_color(color) -> str:
+    """Convert an openpyxl Color (e.g. '00366092') to an xlsxwriter color ('#366092')"""
+    rgb = getattr(color, 'rgb', None)
+    if not isinstance(rgb, str):
+        return ''
+    return '#' + rgb[-6:]
+
+
+class _BufferedCell:
+    """Styled cell passed to XlsxWriterSheet.append(); styles are turned into a format on write"""
+    __slots__ = ('value', 'font', 'fill', 'number_format')
+
+    def __init__(self, value=None, font=None, fill=None, number_format=None):
+        self.value = value
+        self.font = font
+        self.fill = fill
+        self.number_format = number_format
+
+
+class _ColumnDimension:
+    def __init__(self, sheet, col: int):
+        self._sheet = sheet
+        self._col = col
+
+    @property
+    def width(self):
+        return self._sheet._widths.get(self._col)
+
+    @width.setter
+    def width(self, value):
+        self._sheet._widths[self._col] = value
+        self._sheet._ws.set_column(self._col, self._col, value)
+
+
+class _ColumnDimensions:
+    def __init__(self, sheet):
+        self._sheet = sheet
+
+    def __getitem__(self, letter: str) -> _ColumnDimension:
+        return _ColumnDimension(self._sheet, column_index_from_string(letter) - 1)
+
+
+class _MergedCells:
+    """Collects merged ranges like openpyxl's ws.merged_cells"""
+
+    def __init__(self, sheet):
+        self._sheet = sheet
+
+    def add(self, range_string: str):
+        min_col, min_row, max_col, max_row = range_boundaries(range_string)
+        self._sheet._merges.setdefault(min_row, []).append((min_col, max_row, max_col))
+
+
+class XlsxWriterSheet:
+    """Append-only worksheet mirroring openpyxl's write-only worksheet API
+
+    The last appended row is held back until the next append so merges added
+    for it can still be applied; rows are streamed top to bottom (constant_memory).
+    """
+
+    def __init__(self, workbook: 'XlsxWriterWorkbook', ws):
+        self._workbook = workbook
+        self._ws = ws
+        self._row = 0
+        self._cells: List[_BufferedCell] = []
+        self._merges: Dict[int, List[Tuple[int, int, int]]] = {}
+        self._widths: Dict[int, float] = {}
+        self.column_dimensions = _ColumnDimensions(self)
+        self.merged_cells = _MergedCells(self)
+
+    @property
+    def title(self) -> str:
+        return self._ws.name
+
+    def styled_cell(self, value=None, font=None, fill=None, number_format=None) -> _BufferedCell:
+        return _BufferedCell(value, font, fill, number_format)
+
+    def append(self, row):
+        self._flush()
+        self._row += 1
+        self._cells = [cell if isinstance(cell, _BufferedCell) else _BufferedCell(cell) for cell in row]
+
+    def _flush(self):
+        """Write the held-back row to the xlsxwriter stream"""
+        if not self._row:
+            return
+        row_idx = self._row - 1
+        merged = set()
+        for min_col, max_row, max_col in self._merges.pop(self._row, []):
+            first = self._cells[min_col - 1] if min_col <= len(self._cells) else _BufferedCell()
+            fmt = self._workbook._format_for(first)
+            self._ws.merge_range(row_idx, min_col - 1, max_row - 1, max_col - 1, first.value, fmt)
+            merged.update(range(min_col - 1, max_col))
+        for col_idx, cell in enumerate(self._cells):
+            if col_idx in merged:
+                continue
+            fmt = self._workbook._format_for(cell)
+            if cell.value is None:
+                if fmt is not None:
+                    self._ws.write_blank(row_idx, col_idx, None, fmt)
+            else:
+                self._ws.write(row_idx, col_idx, cell.value, fmt)
+        self._cells = []
+
+    def close(self):
+        self._flush()
+
+
+class XlsxWriterWorkbook:
+    """Minimal openpyxl Workbook stand-in backed by xlsxwriter's constant_memory mode"""
+
+    def __init__(self, filename: str):
+        if xlsxwriter is None:
+            raise ImportError("xlsxwriter is not installed")
+        self.filename = filename
+        self._wb = xlsxwriter.Workbook(filename, {'constant_memory': True, 'strings_to_urls': False})
+        self._sheets: List[XlsxWriterSheet] = []
+        self._formats = {}
+
+    def create_sheet(self, title: str, index: int = None) -> XlsxWriterSheet:
+        # xlsxwriter can only append sheets; the generators create them in display order
+        sheet = XlsxWriterSheet(self, self._wb.add_worksheet(title))
+        self._sheets.append(sheet)
+        return sheet
+
+    def _format_for(self, cell: _BufferedCell):
+        """Return a shared xlsxwriter format for the cell's font/fill, building it once"""
+        key = (cell.font, cell.fill, cell.number_format)
+        if key == (None, None, None):
+            return None
+        if key not in self._formats:
+            props = {}
+            font = cell.font
+            if font is not None:
+                if font.b:
+                    props['bold'] = True
+                if font.sz:
+                    props['font_size'] = font.sz
+                if _hex_color(font.color):
+                    props['font_color'] = _hex_color(font.color)
+            fill = cell.fill
+            if fill is not None and fill.fill_type == 'solid':
+                props['pattern'] = 1
+                props['bg_color'] = _hex_color(fill.start_color)
+            if cell.number_format:
+                props['num_format'] = cell.number_format
+            self._formats[key] = self._wb.add_format(props)
+        return self._formats[key]
+
+    def save(self, filename: str = None):
+        for sheet in self._sheets:
+            sheet.close()
+        self._wb.close()